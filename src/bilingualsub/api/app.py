@@ -6,15 +6,20 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
+from pydantic_core import to_json
 
+from bilingualsub.api.constants import WORK_ROOT
 from bilingualsub.api.errors import ApiError
 from bilingualsub.api.jobs import JobManager
 from bilingualsub.api.logging import setup_logging
@@ -26,17 +31,32 @@ if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
 
+# Resolved once at import; the built frontend only changes between deploys.
+_FRONTEND_DIST = (
+    Path(__file__).resolve().parent.parent.parent.parent / "frontend" / "dist"
+)
+_FRONTEND_DIST_EXISTS = _FRONTEND_DIST.is_dir()
+
+_DEFAULT_EXECUTOR_WORKERS = 64
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan: setup/teardown."""
     setup_logging()
-    manager = JobManager()
-    app.state.job_manager = manager
+    # asyncio.to_thread runs retranslate LLM calls and upload copies; they
+    # are I/O-bound, so size the pool for concurrency, not for CPU count.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=_DEFAULT_EXECUTOR_WORKERS,
+            thread_name_prefix="bilingualsub-io",
+        )
+    )
+    WORK_ROOT.mkdir(parents=True, exist_ok=True)
+    app.state.job_manager = JobManager()
     settings = get_settings()
     app.state.glossary_manager = GlossaryManager(Path(settings.glossary_path))
-    await manager.start_cleanup_loop()
     yield
-    await manager.stop_cleanup_loop()
 
 
 def create_app() -> FastAPI:
@@ -47,6 +67,9 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Strong references for fire-and-forget pipeline tasks (see routes).
+    app.state.background_tasks = set()
+
     # CORS
     app.add_middleware(
         CORSMiddleware,
@@ -58,27 +81,33 @@ def create_app() -> FastAPI:
 
     # Global error handler
     @app.exception_handler(ApiError)
-    async def api_error_handler(_request: Request, exc: ApiError) -> JSONResponse:
-        return JSONResponse(
+    async def api_error_handler(_request: Request, exc: ApiError) -> Response:
+        # Encoded by pydantic-core's Rust serializer rather than stdlib json.
+        return Response(
+            content=to_json(
+                {
+                    "code": exc.code,
+                    "message": exc.message,
+                    "detail": exc.detail,
+                }
+            ),
             status_code=exc.status_code,
-            content={
-                "code": exc.code,
-                "message": exc.message,
-                "detail": exc.detail,
-            },
+            media_type="application/json",
         )
 
     # API routes
     app.include_router(router)
 
     # Serve frontend static files if built
-    frontend_dist = (
-        Path(__file__).resolve().parent.parent.parent.parent / "frontend" / "dist"
-    )
-    if frontend_dist.is_dir():
+    if _FRONTEND_DIST_EXISTS:
+        # Only the frontend bundle is compressed: SSE must flush per event and
+        # video/audio downloads are already compressed media.
         app.mount(
             "/",
-            StaticFiles(directory=str(frontend_dist), html=True),
+            GZipMiddleware(
+                StaticFiles(directory=str(_FRONTEND_DIST), html=True),
+                compresslevel=6,
+            ),
             name="static",
         )
 
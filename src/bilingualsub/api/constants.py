@@ -1,6 +1,8 @@
 """Constants and enums for the API layer."""
 
+import tempfile
 from enum import StrEnum
+from pathlib import Path
 
 
 class JobStatus(StrEnum):
@@ -54,5 +56,9 @@ class ProcessingMode(StrEnum):
 
 
 JOB_TTL_SECONDS = 1800
-CLEANUP_INTERVAL_SECONDS = 300
+MAX_JOBS = 10_000
 SSE_KEEPALIVE_SECONDS = 30
+SSE_SEND_TIMEOUT_SECONDS = 30
+EVENT_QUEUE_MAXSIZE = 64
+# Per-job working directories live under one root: WORK_ROOT / <job_id>
+WORK_ROOT = Path(tempfile.gettempdir()) / "bilingualsub_work"
@@ -30,6 +30,18 @@ class JobNotFoundError(ApiError):
         )
 
 
+class JobStoreFullError(ApiError):
+    """Raised when every stored job is still running and no slot can be freed."""
+
+    def __init__(self, max_jobs: int) -> None:
+        super().__init__(
+            status_code=503,
+            code="job_store_full",
+            message="Too many jobs in progress",
+            detail=f"At most {max_jobs} jobs can be kept at once; try again later",
+        )
+
+
 class InvalidRequestError(ApiError):
     """Raised when the client sends an invalid request."""
 
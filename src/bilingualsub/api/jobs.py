@@ -1,30 +1,96 @@
-"""In-memory job store with TTL-based cleanup."""
+"""In-memory job store with lazy TTL-based expiry."""
 
 from __future__ import annotations
 
 import asyncio
-import contextlib
+import secrets
+import shutil
 import time
-import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import structlog
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 from bilingualsub.api.constants import (
-    CLEANUP_INTERVAL_SECONDS,
+    EVENT_QUEUE_MAXSIZE,
     JOB_TTL_SECONDS,
+    MAX_JOBS,
     FileType,
     JobStatus,
     ProcessingMode,
+    SSEEvent,
 )
+from bilingualsub.api.errors import JobStoreFullError
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 logger = structlog.get_logger()
 
 
+def _progress_data(event: dict[str, object]) -> dict[str, object] | None:
+    """Return the payload of a progress event, or None for other events."""
+    data = event.get("data")
+    if event.get("event") != SSEEvent.PROGRESS or not isinstance(data, dict):
+        return None
+    return data
+
+
+class EventQueue(asyncio.Queue[dict[str, object]]):
+    """SSE event queue that coalesces and sheds redundant progress events.
+
+    ``maxsize`` is a soft bound that only progress events respect: complete
+    and error events are always enqueued, even past it. The underlying queue
+    is therefore unbounded, and ``full()`` always reports False.
+    """
+
+    def __init__(self, maxsize: int = EVENT_QUEUE_MAXSIZE) -> None:
+        super().__init__()
+        self._soft_maxsize = maxsize
+
+    def _init(self, _maxsize: int) -> None:
+        self._queue: deque[dict[str, object]] = deque()
+
+    def publish(self, event: dict[str, object]) -> None:
+        """Enqueue an event without blocking the producer.
+
+        A progress event for the same step as the newest queued progress event
+        replaces it in place (keeping any extra keys of the replaced payload).
+        At the soft bound the oldest progress event is dropped, or the new one
+        if none is queued; complete and error events are never dropped.
+        """
+        new_data = _progress_data(event)
+        if new_data is not None and self._queue:
+            last_data = _progress_data(self._queue[-1])
+            if last_data is not None and last_data.get("current_step") == new_data.get(
+                "current_step"
+            ):
+                self._queue[-1] = {**event, "data": {**last_data, **new_data}}
+                return
+
+        at_bound = 0 < self._soft_maxsize <= self.qsize()
+        if at_bound and not self._drop_oldest_progress() and new_data is not None:
+            return
+        self.put_nowait(event)
+
+    def clear(self) -> None:
+        """Drop every queued event, keeping open SSE streams attached."""
+        while not self.empty():
+            self.get_nowait()
+            self.task_done()
+
+    def _drop_oldest_progress(self) -> bool:
+        for i, queued in enumerate(self._queue):
+            if _progress_data(queued) is not None:
+                del self._queue[i]
+                # The dropped event was counted by put_nowait; mark it done so
+                # join() still returns once every delivered event is handled.
+                self.task_done()
+                return True
+        return False
+
+
 @dataclass
 class Job:
     """Represents a subtitle generation job."""
@@ -53,17 +119,73 @@ class Job:
     processing_mode: ProcessingMode = ProcessingMode.SUBTITLE
     video_duration: float = 0.0
     video_fps: float = 0.0
+    work_dir: Path | None = None
     output_files: dict[FileType, Path] = field(default_factory=dict)
-    event_queue: asyncio.Queue[dict[str, object]] = field(default_factory=asyncio.Queue)
+    # String form of output_files served to status polls; kept in step by
+    # set_output_file so each GET does not rebuild it.
+    _output_files_str: dict[FileType, str] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    event_queue: EventQueue = field(default_factory=EventQueue)
     created_at: float = field(default_factory=time.monotonic)
+    task: asyncio.Task[None] | None = field(default=None, repr=False)
+    log: structlog.stdlib.BoundLogger = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Bind the job-scoped logger once for every pipeline phase."""
+        self.log = logger.bind(job_id=self.id)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a pipeline phase is still in flight for this job."""
+        return self.task is not None and not self.task.done()
+
+    @property
+    def output_files_str(self) -> dict[FileType, str]:
+        """Output file paths rendered as strings for status responses."""
+        return self._output_files_str
+
+    def set_output_file(self, file_type: FileType, path: Path) -> None:
+        """Record an output file and its string form."""
+        self.output_files[file_type] = path
+        self._output_files_str[file_type] = str(path)
+
+
+# Strong references to in-flight work-dir removals so they are not collected.
+_removal_tasks: set[asyncio.Task[None]] = set()
+
+
+def _remove_work_dir(job: Job) -> None:
+    """Delete the working directory of a job that left the store.
+
+    Inside a running event loop the removal runs in a worker thread so a
+    large directory tree does not block the loop; otherwise it runs inline.
+    """
+    if job.work_dir is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        shutil.rmtree(job.work_dir, ignore_errors=True)
+        return
+    task = loop.create_task(
+        asyncio.to_thread(shutil.rmtree, job.work_dir, ignore_errors=True)
+    )
+    _removal_tasks.add(task)
+    task.add_done_callback(_removal_tasks.discard)
 
 
 class JobManager:
-    """Manages in-memory job lifecycle with automatic cleanup."""
+    """Manages in-memory job lifecycle with lazy TTL expiry.
+
+    Jobs are kept in creation order, so expired jobs always sit at the front
+    of the store and are swept on access without a background task. A job
+    whose pipeline task is still in flight is never removed, since it is
+    still writing to its working directory; it is swept once the task ends.
+    """
 
     def __init__(self) -> None:
         self._jobs: dict[str, Job] = {}
-        self._cleanup_task: asyncio.Task[None] | None = None
 
     def create_job(
         self,
@@ -75,8 +197,15 @@ class JobManager:
         local_video_path: Path | None = None,
         processing_mode: ProcessingMode = ProcessingMode.SUBTITLE,
     ) -> Job:
-        """Create a new job and store it."""
-        job_id = uuid.uuid4().hex[:12]
+        """Create a new job and store it, evicting the oldest idle job when full.
+
+        Raises:
+            JobStoreFullError: If the store is full and every job is running.
+        """
+        self.cleanup_expired()
+        if len(self._jobs) >= MAX_JOBS and not self._evict_oldest_idle():
+            raise JobStoreFullError(MAX_JOBS)
+        job_id = secrets.token_hex(6)
         job = Job(
             id=job_id,
             source_url=source_url,
@@ -92,37 +221,44 @@ class JobManager:
         return job
 
     def get_job(self, job_id: str) -> Job | None:
-        """Get a job by ID, returns None if not found."""
-        return self._jobs.get(job_id)
+        """Get a job by ID, returns None if not found or expired and idle."""
+        job = self._jobs.get(job_id)
+        if job is not None and time.monotonic() - job.created_at > JOB_TTL_SECONDS:
+            self.cleanup_expired()
+            return self._jobs.get(job_id)
+        return job
 
     def cleanup_expired(self) -> int:
-        """Remove jobs older than JOB_TTL_SECONDS. Returns count of removed jobs."""
+        """Remove idle jobs older than JOB_TTL_SECONDS.
+
+        Returns:
+            Count of removed jobs. Expired jobs that are still running are kept.
+        """
         now = time.monotonic()
-        expired = [
-            jid
-            for jid, job in self._jobs.items()
-            if now - job.created_at > JOB_TTL_SECONDS
-        ]
+        expired: list[str] = []
+        for jid, job in self._jobs.items():
+            if now - job.created_at <= JOB_TTL_SECONDS:
+                break
+            if not job.is_running:
+                expired.append(jid)
         for jid in expired:
-            del self._jobs[jid]
+            _remove_work_dir(self._jobs.pop(jid))
         if expired:
             logger.info("jobs_cleaned_up", count=len(expired))
         return len(expired)
 
-    async def start_cleanup_loop(self) -> None:
-        """Start periodic cleanup task."""
-        self._cleanup_task = asyncio.create_task(self._cleanup_loop())
-
-    async def stop_cleanup_loop(self) -> None:
-        """Stop the periodic cleanup task."""
-        if self._cleanup_task is not None:
-            self._cleanup_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._cleanup_task
-            self._cleanup_task = None
-
-    async def _cleanup_loop(self) -> None:
-        """Periodically clean up expired jobs."""
-        while True:
-            await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
-            self.cleanup_expired()
+    def remove_job(self, job_id: str) -> None:
+        """Drop a job and its working directory, e.g. when its upload failed."""
+        job = self._jobs.pop(job_id, None)
+        if job is not None:
+            _remove_work_dir(job)
+
+    def _evict_oldest_idle(self) -> bool:
+        """Drop the oldest idle job to make room; False if every job is running."""
+        for jid, job in self._jobs.items():
+            if not job.is_running:
+                _remove_work_dir(self._jobs.pop(jid))
+                logger.warning("job_store_full_evicted_oldest", max_jobs=MAX_JOBS)
+                return True
+        logger.warning("job_store_full_no_idle_jobs", max_jobs=MAX_JOBS)
+        return False
@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-import tempfile
+import contextlib
+import contextvars
+import functools
 import time
-from pathlib import Path
-from typing import TYPE_CHECKING
-
-import structlog
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+from urllib.parse import urlparse
 
 from bilingualsub.api.constants import (
+    WORK_ROOT,
     FileType,
     JobStatus,
     ProcessingMode,
@@ -20,13 +22,15 @@ from bilingualsub.api.constants import (
 from bilingualsub.api.errors import PipelineError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    import structlog
 
     from bilingualsub.api.jobs import Job
 from bilingualsub.core import (
     DownloadError,
     Subtitle,
-    SubtitleEntry,
     TranscriptionError,
     TranslationError,
     VideoMetadata,
@@ -34,12 +38,16 @@ from bilingualsub.core import (
     build_whisper_prompt,
     describe_video,
     download_video,
-    merge_subtitles,
     transcribe_audio,
     translate_subtitle,
 )
 from bilingualsub.core.subtitle_fetcher import fetch_manual_subtitle
-from bilingualsub.formats import parse_srt, serialize_bilingual_ass, serialize_srt
+from bilingualsub.formats import (
+    parse_srt,
+    serialize_bilingual_ass,
+    serialize_srt,
+    write_bilingual_srt,
+)
 from bilingualsub.utils import (
     FFmpegError,
     burn_subtitles,
@@ -50,7 +58,16 @@ from bilingualsub.utils import (
     trim_video,
 )
 
-logger = structlog.get_logger()
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+# Pipeline stages are long, blocking calls (yt-dlp, ffmpeg subprocesses,
+# remote Whisper/LLM requests). Running them on a dedicated pool keeps them
+# from starving the loop's default executor used by request handlers.
+_STAGE_MAX_WORKERS = 16
+_stage_executor = ThreadPoolExecutor(
+    max_workers=_STAGE_MAX_WORKERS, thread_name_prefix="bilingualsub-stage"
+)
 
 # Maps core errors to (error_code, user_message) for PipelineError
 _ERROR_MAP: dict[type, tuple[str, str]] = {
@@ -65,6 +82,40 @@ _ERROR_MAP: dict[type, tuple[str, str]] = {
     ValueError: ("invalid_input", "Invalid input"),
 }
 
+# Translation progress is forwarded only when it moved by at least this many
+# percentage points or this much time passed since the last emitted event.
+_PROGRESS_MIN_DELTA = 1.0
+_PROGRESS_MIN_INTERVAL_SECONDS = 0.25
+
+
+async def _run_stage(
+    func: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs
+) -> _T:
+    """Run a blocking pipeline stage on the stage pool, preserving contextvars."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_stage_executor, call)
+
+
+@contextlib.contextmanager
+def _timed_step(
+    log: structlog.stdlib.BoundLogger, step: str
+) -> Iterator[dict[str, object]]:
+    """Log ``step_done`` with the elapsed time once the wrapped step succeeds.
+
+    Yields a dict the caller can fill with extra fields for the log record.
+    """
+    fields: dict[str, object] = {}
+    t0 = time.monotonic()
+    yield fields
+    log.info(
+        "step_done",
+        step=step,
+        duration_ms=int((time.monotonic() - t0) * 1000),
+        **fields,
+    )
+
 
 def _send_progress(
     job: Job,
@@ -78,20 +129,37 @@ def _send_progress(
     job.status = status
     job.progress = progress
     job.current_step = current_step
-    data: dict[str, object] = {
-        "status": str(status),
-        "progress": progress,
-        "current_step": current_step,
-        "message": message,
-    }
+    job.event_queue.publish(
+        _progress_event(status, progress, current_step, message, extra)
+    )
+
+
+def _progress_event(
+    status: JobStatus,
+    progress: float,
+    current_step: str,
+    message: str,
+    extra: dict[str, object] | None = None,
+) -> dict[str, object]:
+    """Build an SSE progress event as a single payload allocation."""
+    # Sub-0.1% jitter is invisible in the UI but would defeat SSE dedup.
+    progress = round(progress, 1)
     if extra:
-        data.update(extra)
-    job.event_queue.put_nowait(
-        {
-            "event": SSEEvent.PROGRESS,
-            "data": data,
+        data: dict[str, object] = {
+            "status": status.value,
+            "progress": progress,
+            "current_step": current_step,
+            "message": message,
+            **extra,
         }
-    )
+    else:
+        data = {
+            "status": status.value,
+            "progress": progress,
+            "current_step": current_step,
+            "message": message,
+        }
+    return {"event": SSEEvent.PROGRESS, "data": data}
 
 
 def _send_error(job: Job, code: str, message: str, detail: str) -> None:
@@ -100,7 +168,7 @@ def _send_error(job: Job, code: str, message: str, detail: str) -> None:
     job.error_code = code
     job.error_message = message
     job.error_detail = detail
-    job.event_queue.put_nowait(
+    job.event_queue.publish(
         {
             "event": SSEEvent.ERROR,
             "data": {"code": code, "message": message, "detail": detail},
@@ -112,7 +180,7 @@ def _send_complete(job: Job) -> None:
     """Update job state and enqueue an SSE complete event."""
     job.status = JobStatus.COMPLETED
     job.progress = 100.0
-    job.event_queue.put_nowait(
+    job.event_queue.publish(
         {
             "event": SSEEvent.COMPLETE,
             "data": {"status": "completed", "progress": 100},
@@ -122,8 +190,12 @@ def _send_complete(job: Job) -> None:
 
 def _to_pipeline_error(exc: Exception) -> PipelineError:
     """Convert a core module exception to PipelineError."""
-    for exc_type, (code, message) in _ERROR_MAP.items():
-        if isinstance(exc, exc_type):
+    # Walk the MRO so the common case (an exact match) is a single dict lookup
+    # and subclasses such as RateLimitError still resolve to their base entry.
+    for exc_type in type(exc).__mro__:
+        mapped = _ERROR_MAP.get(exc_type)
+        if mapped is not None:
+            code, message = mapped
             return PipelineError(code, message, detail=str(exc))
     return PipelineError(
         "pipeline_failed", "Unexpected pipeline error", detail=str(exc)
@@ -131,10 +203,22 @@ def _to_pipeline_error(exc: Exception) -> PipelineError:
 
 
 def _make_translate_progress_cb(job: Job) -> Callable[[int, int], None]:
-    """Create a progress callback for the translation step."""
+    """Create a throttled progress callback for the translation step."""
+    last_emit_pct = 0.0
+    last_emit_t = time.monotonic()
 
     def _on_progress(completed: int, total: int) -> None:
+        nonlocal last_emit_pct, last_emit_t
         pct = 50.0 + (completed / total) * 20.0 if total > 0 else 50.0
+        now = time.monotonic()
+        if (
+            completed < total
+            and pct - last_emit_pct < _PROGRESS_MIN_DELTA
+            and now - last_emit_t < _PROGRESS_MIN_INTERVAL_SECONDS
+        ):
+            return
+        last_emit_pct = pct
+        last_emit_t = now
         _send_progress(
             job,
             JobStatus.TRANSLATING,
@@ -174,16 +258,11 @@ async def _trim_if_needed(
         return video_path
 
     _send_progress(job, JobStatus.DOWNLOADING, 12.0, "trim", "Trimming video")
-    t0 = time.monotonic()
     trimmed_path = work_dir / "video_trimmed.mp4"
     start = job.start_time if job.start_time is not None else 0.0
     end = job.end_time if job.end_time is not None else metadata_duration
-    await asyncio.to_thread(trim_video, video_path, trimmed_path, start, end)
-    log.info(
-        "step_done",
-        step="trim",
-        duration_ms=int((time.monotonic() - t0) * 1000),
-    )
+    with _timed_step(log, "trim"):
+        await _run_stage(trim_video, video_path, trimmed_path, start, end)
     return trimmed_path
 
 
@@ -197,15 +276,10 @@ async def _extract_audio_step(
     _send_progress(
         job, JobStatus.DOWNLOADING, 15.0, "extract_audio", "Extracting audio"
     )
-    t0 = time.monotonic()
     audio_path = work_dir / "audio.mp3"
-    await asyncio.to_thread(extract_audio, video_path, audio_path)
-    job.output_files[FileType.AUDIO] = audio_path
-    log.info(
-        "step_done",
-        step="extract_audio",
-        duration_ms=int((time.monotonic() - t0) * 1000),
-    )
+    with _timed_step(log, "extract_audio"):
+        await _run_stage(extract_audio, video_path, audio_path)
+    job.set_output_file(FileType.AUDIO, audio_path)
     return audio_path
 
 
@@ -220,20 +294,19 @@ async def _acquire_video(
             job, JobStatus.DOWNLOADING, 5.0, "upload", "Processing uploaded file"
         )
         video_path = job.local_video_path
-        meta_dict = await asyncio.to_thread(extract_video_metadata, video_path)
+        probe = await _run_stage(extract_video_metadata, video_path)
         metadata = VideoMetadata(
-            title=str(meta_dict["title"]),
-            duration=float(meta_dict["duration"]),
-            width=int(meta_dict["width"]),
-            height=int(meta_dict["height"]),
-            fps=float(meta_dict["fps"]),
-            has_audio=bool(meta_dict.get("has_audio", True)),
+            title=probe["title"],
+            duration=probe["duration"],
+            width=probe["width"],
+            height=probe["height"],
+            fps=probe["fps"],
+            has_audio=probe.get("has_audio", True),
         )
         log.info("step_done", step="upload", source=str(video_path))
         return video_path, metadata
 
     _send_progress(job, JobStatus.DOWNLOADING, 0.0, "download", "Downloading video")
-    t0 = time.monotonic()
     video_path = work_dir / "video.mp4"
 
     loop = asyncio.get_running_loop()
@@ -243,41 +316,43 @@ async def _acquire_video(
             pct = (downloaded / total) * 10.0  # Map to 0-10% range
 
             def _put_event() -> None:
-                job.event_queue.put_nowait(
-                    {
-                        "event": SSEEvent.PROGRESS,
-                        "data": {
-                            "status": str(JobStatus.DOWNLOADING),
-                            "progress": pct,
-                            "current_step": "download",
-                            "message": f"Downloading ({downloaded / total * 100:.0f}%)",
-                        },
-                    }
+                job.event_queue.publish(
+                    _progress_event(
+                        JobStatus.DOWNLOADING,
+                        pct,
+                        "download",
+                        f"Downloading ({downloaded / total * 100:.0f}%)",
+                    )
                 )
 
             loop.call_soon_threadsafe(_put_event)
 
-    metadata = await asyncio.to_thread(
-        download_video,
-        job.source_url,
-        video_path,
-        on_progress=_on_download_progress,
-        start_time=job.start_time,
-        end_time=job.end_time,
-    )
-    log.info(
-        "step_done",
-        step="download",
-        duration_ms=int((time.monotonic() - t0) * 1000),
-    )
+    with _timed_step(log, "download"):
+        metadata = await _run_stage(
+            download_video,
+            job.source_url,
+            video_path,
+            on_progress=_on_download_progress,
+            start_time=job.start_time,
+            end_time=job.end_time,
+        )
     return video_path, metadata
 
 
+_YOUTUBE_HOSTS = frozenset({"youtube.com", "youtu.be"})
+
+
+def _is_youtube_url(url: str) -> bool:
+    """Return True if the URL's host is YouTube or one of its subdomains."""
+    host = urlparse(url).hostname or ""
+    return host in _YOUTUBE_HOSTS or host.endswith(".youtube.com")
+
+
 def _send_download_complete(job: Job) -> None:
     """Update job state and enqueue an SSE download_complete event."""
     job.status = JobStatus.DOWNLOAD_COMPLETE
     job.progress = 100.0
-    job.event_queue.put_nowait(
+    job.event_queue.publish(
         {
             "event": SSEEvent.DOWNLOAD_COMPLETE,
             "data": {"status": "download_complete", "progress": 100},
@@ -287,8 +362,15 @@ def _send_download_complete(job: Job) -> None:
 
 async def run_download(job: Job) -> None:
     """Phase 1: Download -> Extract Audio."""
-    log = logger.bind(job_id=job.id)
-    work_dir = Path(tempfile.mkdtemp(prefix=f"bilingualsub_{job.id}_"))
+    log = job.log
+    # Uploads already have a work dir holding the saved file. Otherwise job
+    # IDs are unique, so the directory must not exist yet; a collision would
+    # mean two jobs sharing files. JobManager removes it on expiry.
+    work_dir = job.work_dir
+    if work_dir is None:
+        work_dir = WORK_ROOT / job.id
+        work_dir.mkdir(parents=True, exist_ok=False)
+        job.work_dir = work_dir
 
     try:
         video_path, metadata = await _acquire_video(job, work_dir, log)
@@ -312,14 +394,14 @@ async def run_download(job: Job) -> None:
         job.video_channel = metadata.channel
 
         # Only show channel URL for YouTube sources
-        source_url = job.source_url or ""
-        is_youtube_source = "youtube.com" in source_url or "youtu.be" in source_url
         raw_channel_url = metadata.channel_url
         job.video_channel_url = (
-            raw_channel_url if (is_youtube_source and raw_channel_url) else ""
+            raw_channel_url
+            if raw_channel_url and _is_youtube_url(job.source_url or "")
+            else ""
         )
 
-        job.output_files[FileType.SOURCE_VIDEO] = video_path
+        job.set_output_file(FileType.SOURCE_VIDEO, video_path)
 
         _send_download_complete(job)
         log.info("download_complete", job_id=job.id)
@@ -344,32 +426,35 @@ async def _merge_and_serialize(
 ) -> None:
     """Merge original + translated subtitles and serialize to SRT/ASS."""
     _send_progress(job, JobStatus.MERGING, 70.0, "merge", "Merging bilingual subtitles")
-    t0 = time.monotonic()
 
-    merged_entries = await asyncio.to_thread(
-        merge_subtitles, original_sub.entries, translated_sub.entries
-    )
-    merged_sub = Subtitle(entries=merged_entries)
-
-    srt_content = serialize_srt(merged_sub)
-    srt_path = work_dir / "subtitle.srt"
-    srt_path.write_text(srt_content, encoding="utf-8")
-    job.output_files[FileType.SRT] = srt_path
+    async def _write_srt() -> Path:
+        srt_path = work_dir / "subtitle.srt"
+        await _run_stage(
+            write_bilingual_srt, original_sub.entries, translated_sub.entries, srt_path
+        )
+        return srt_path
 
-    ass_content = serialize_bilingual_ass(
-        original_sub,
-        translated_sub,
-        video_width=job.video_width,
-        video_height=job.video_height,
-    )
-    ass_path = work_dir / "subtitle.ass"
-    ass_path.write_text(ass_content, encoding="utf-8")
-    job.output_files[FileType.ASS] = ass_path
+    async def _write_ass() -> Path:
+        ass_content = await _run_stage(
+            serialize_bilingual_ass,
+            original_sub,
+            translated_sub,
+            video_width=job.video_width,
+            video_height=job.video_height,
+        )
+        ass_path = work_dir / "subtitle.ass"
+        await _run_stage(ass_path.write_text, ass_content, encoding="utf-8")
+        return ass_path
 
-    log.info("step_done", step="merge", duration_ms=int((time.monotonic() - t0) * 1000))
+    # The bilingual SRT and the ASS track only share the read-only inputs,
+    # so they are produced concurrently.
+    with _timed_step(log, "merge"):
+        srt_path, ass_path = await asyncio.gather(_write_srt(), _write_ass())
+    job.set_output_file(FileType.SRT, srt_path)
+    job.set_output_file(FileType.ASS, ass_path)
 
 
-def _serialize_translated_only(
+async def _serialize_translated_only(
     job: Job, translated_sub: Subtitle, work_dir: Path
 ) -> None:
     """Serialize only the translated subtitle to SRT (no bilingual merge)."""
@@ -377,15 +462,15 @@ def _serialize_translated_only(
         job, JobStatus.MERGING, 70.0, "serialize", "Generating subtitle file..."
     )
 
-    srt_content = serialize_srt(translated_sub)
+    srt_content = await _run_stage(serialize_srt, translated_sub)
     srt_path = work_dir / "subtitle.srt"
-    srt_path.write_text(srt_content, encoding="utf-8")
-    job.output_files[FileType.SRT] = srt_path
+    await _run_stage(srt_path.write_text, srt_content, encoding="utf-8")
+    job.set_output_file(FileType.SRT, srt_path)
 
 
 async def _run_visual_description_subtitle(job: Job) -> None:
     """Run visual description subtitle pipeline."""
-    log = logger.bind(job_id=job.id)
+    log = job.log
     try:
         video_path = job.output_files.get(FileType.SOURCE_VIDEO)
         if not video_path:
@@ -405,7 +490,7 @@ async def _run_visual_description_subtitle(job: Job) -> None:
             "describe",
             "Analyzing video content...",
         )
-        described_sub = await asyncio.to_thread(
+        described_sub = await _run_stage(
             describe_video, video_path, source_lang=job.source_lang
         )
         job.subtitle_source = SubtitleSource.VISUAL_DESCRIPTION
@@ -418,7 +503,7 @@ async def _run_visual_description_subtitle(job: Job) -> None:
             "translate",
             "Translating descriptions...",
         )
-        translated_sub = await asyncio.to_thread(
+        translated_sub = await _run_stage(
             translate_subtitle,
             described_sub,
             source_lang=job.source_lang,
@@ -431,7 +516,9 @@ async def _run_visual_description_subtitle(job: Job) -> None:
         )
 
         # Serialize translated-only SRT (70-80%)
-        _serialize_translated_only(job, translated_sub, work_dir=video_path.parent)
+        await _serialize_translated_only(
+            job, translated_sub, work_dir=video_path.parent
+        )
 
         _send_complete(job)
 
@@ -453,66 +540,84 @@ async def _run_visual_description_subtitle(job: Job) -> None:
         )
 
 
+async def _fetch_manual_subtitle_step(
+    job: Job,
+    work_dir: Path,
+    log: structlog.stdlib.BoundLogger,
+) -> Subtitle | None:
+    """Fetch uploader-provided subtitles for URL sources, if any exist."""
+    if not job.source_url:
+        return None
+
+    _send_progress(
+        job,
+        JobStatus.TRANSCRIBING,
+        20.0,
+        "transcribe",
+        "Checking for manual subtitles",
+    )
+    with _timed_step(log, "subtitle_fetch") as step:
+        original_sub = await _run_stage(
+            fetch_manual_subtitle, job.source_url, job.source_lang, work_dir
+        )
+        if original_sub is not None:
+            step.update(source="youtube_manual", entries=len(original_sub.entries))
+    return original_sub
+
+
 async def run_subtitle(job: Job) -> None:
     """Phase 2: Transcribe -> Translate -> Merge -> Serialize."""
-    log = logger.bind(job_id=job.id)
+    log = job.log
 
     if job.processing_mode == ProcessingMode.VISUAL_DESCRIPTION:
         await _run_visual_description_subtitle(job)
         return
 
     try:
-        if FileType.AUDIO not in job.output_files:
+        audio_path = job.output_files.get(FileType.AUDIO)
+        if audio_path is None:
             video_path = job.output_files.get(FileType.SOURCE_VIDEO)
             if not video_path:
                 raise PipelineError("pipeline_failed", "Source video not found")
-            await _extract_audio_step(job, video_path, video_path.parent, log)
-
-        audio_path = job.output_files[FileType.AUDIO]
-        work_dir = audio_path.parent
-
-        original_sub = None
-        subtitle_source = SubtitleSource.WHISPER
-
-        if job.source_url:
-            _send_progress(
-                job,
-                JobStatus.TRANSCRIBING,
-                20.0,
-                "transcribe",
-                "Checking for manual subtitles",
-            )
-            t0 = time.monotonic()
-            original_sub = await asyncio.to_thread(
-                fetch_manual_subtitle, job.source_url, job.source_lang, work_dir
-            )
-            if original_sub is not None:
-                subtitle_source = SubtitleSource.YOUTUBE_MANUAL
-                log.info(
-                    "step_done",
-                    step="subtitle_fetch",
-                    source="youtube_manual",
-                    entries=len(original_sub.entries),
-                    duration_ms=int((time.monotonic() - t0) * 1000),
-                )
+            work_dir = video_path.parent
+            # ffmpeg audio extraction and the manual-subtitle lookup are
+            # independent, so the subprocess overlaps the network round-trip.
+            # A TaskGroup cancels the sibling as soon as either one fails.
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    audio_task = tg.create_task(
+                        _extract_audio_step(job, video_path, work_dir, log)
+                    )
+                    manual_task = tg.create_task(
+                        _fetch_manual_subtitle_step(job, work_dir, log)
+                    )
+            except ExceptionGroup as group:
+                # Surface the first failure so the handlers below classify it.
+                raise group.exceptions[0] from None
+            audio_path = audio_task.result()
+            original_sub = manual_task.result()
+        else:
+            work_dir = audio_path.parent
+            original_sub = await _fetch_manual_subtitle_step(job, work_dir, log)
+
+        subtitle_source = (
+            SubtitleSource.WHISPER
+            if original_sub is None
+            else SubtitleSource.YOUTUBE_MANUAL
+        )
 
         if original_sub is None:
             _send_progress(
                 job, JobStatus.TRANSCRIBING, 20.0, "transcribe", "Transcribing audio"
             )
-            t0 = time.monotonic()
             whisper_prompt = build_whisper_prompt(video_title=job.video_title)
-            original_sub = await asyncio.to_thread(
-                transcribe_audio,
-                audio_path,
-                language=job.source_lang,
-                prompt=whisper_prompt,
-            )
-            log.info(
-                "step_done",
-                step="transcribe",
-                duration_ms=int((time.monotonic() - t0) * 1000),
-            )
+            with _timed_step(log, "transcribe"):
+                original_sub = await _run_stage(
+                    transcribe_audio,
+                    audio_path,
+                    language=job.source_lang,
+                    prompt=whisper_prompt,
+                )
 
         job.subtitle_source = subtitle_source
         if not isinstance(original_sub, Subtitle):
@@ -526,25 +631,20 @@ async def run_subtitle(job: Job) -> None:
             "Translating subtitles",
             extra={"subtitle_source": str(subtitle_source)},
         )
-        t0 = time.monotonic()
         _on_translate_progress = _make_translate_progress_cb(job)
         _on_rate_limit = _make_rate_limit_cb(job)
-        translated_sub = await asyncio.to_thread(
-            translate_subtitle,
-            original_sub,
-            source_lang=job.source_lang,
-            target_lang=job.target_lang,
-            video_title=job.video_title,
-            video_description=job.video_description,
-            glossary_text=job.glossary_text,
-            on_progress=_on_translate_progress,
-            on_rate_limit=_on_rate_limit,
-        )
-        log.info(
-            "step_done",
-            step="translate",
-            duration_ms=int((time.monotonic() - t0) * 1000),
-        )
+        with _timed_step(log, "translate"):
+            translated_sub = await _run_stage(
+                translate_subtitle,
+                original_sub,
+                source_lang=job.source_lang,
+                target_lang=job.target_lang,
+                video_title=job.video_title,
+                video_description=job.video_description,
+                glossary_text=job.glossary_text,
+                on_progress=_on_translate_progress,
+                on_rate_limit=_on_rate_limit,
+            )
 
         await _merge_and_serialize(job, original_sub, translated_sub, work_dir, log)
 
@@ -598,22 +698,8 @@ def _prepare_burn_subtitle(
                 if not orig_text:
                     orig_text = "\u200b"
 
-                original_entries.append(
-                    SubtitleEntry(
-                        index=entry.index,
-                        start=entry.start,
-                        end=entry.end,
-                        text=orig_text,
-                    )
-                )
-                translated_entries.append(
-                    SubtitleEntry(
-                        index=entry.index,
-                        start=entry.start,
-                        end=entry.end,
-                        text=trans_text,
-                    )
-                )
+                original_entries.append(entry.with_text(orig_text))
+                translated_entries.append(entry.with_text(trans_text))
 
             original_sub = Subtitle(entries=original_entries)
             translated_sub = Subtitle(entries=translated_entries)
@@ -635,7 +721,7 @@ def _prepare_burn_subtitle(
 
 async def run_burn(job: Job, srt_content: str) -> None:
     """Burn user-edited SRT into the source video."""
-    log = logger.bind(job_id=job.id)
+    log = job.log
     try:
         source_video = job.output_files[FileType.SOURCE_VIDEO]
         work_dir = source_video.parent
@@ -658,7 +744,7 @@ async def run_burn(job: Job, srt_content: str) -> None:
             )
 
         # Prepare the subtitle path (convert to ASS if bilingual)
-        burn_subtitle_path = await asyncio.to_thread(
+        burn_subtitle_path = await _run_stage(
             _prepare_burn_subtitle,
             srt_content,
             work_dir,
@@ -668,7 +754,7 @@ async def run_burn(job: Job, srt_content: str) -> None:
             log,
         )
 
-        await asyncio.to_thread(
+        await _run_stage(
             burn_subtitles,
             source_video,
             burn_subtitle_path,
@@ -680,7 +766,7 @@ async def run_burn(job: Job, srt_content: str) -> None:
         if has_channel:
             intro_path = work_dir / "intro.mp4"
             try:
-                await asyncio.to_thread(
+                await _run_stage(
                     generate_intro,
                     intro_path,
                     width=job.video_width,
@@ -699,14 +785,14 @@ async def run_burn(job: Job, srt_content: str) -> None:
                         f"Generating intro ({p:.0f}%)",
                     ),
                 )
-                job.output_files[FileType.INTRO_VIDEO] = intro_path
+                job.set_output_file(FileType.INTRO_VIDEO, intro_path)
             except FFmpegError as exc:
                 log.warning("intro_generation_failed", error=str(exc))
                 # Degrade gracefully: skip intro, use subtitle-only main video
             else:
                 final_path = work_dir / "final.mp4"
                 try:
-                    await asyncio.to_thread(
+                    await _run_stage(
                         concat_videos,
                         intro_path,
                         output_video,
@@ -724,7 +810,7 @@ async def run_burn(job: Job, srt_content: str) -> None:
                 except FFmpegError as exc:
                     log.warning("concat_failed", error=str(exc))
 
-        job.output_files[FileType.VIDEO] = output_video
+        job.set_output_file(FileType.VIDEO, output_video)
         _send_complete(job)
         log.info("burn_complete", job_id=job.id)
     except Exception as exc:
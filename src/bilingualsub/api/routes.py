@@ -3,19 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import os
 import re
-import tempfile
+import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, cast
 
 import structlog
 from fastapi import APIRouter, Form, Request, UploadFile
 from fastapi.responses import FileResponse
+from pydantic_core import to_json
 from sse_starlette.sse import EventSourceResponse
 
 from bilingualsub.api.constants import (
     SSE_KEEPALIVE_SECONDS,
+    SSE_SEND_TIMEOUT_SECONDS,
+    WORK_ROOT,
     FileType,
     JobStatus,
     ProcessingMode,
@@ -53,16 +56,23 @@ if TYPE_CHECKING:
 router = APIRouter(prefix="/api")
 logger = structlog.get_logger()
 
-_ALLOWED_UPLOAD_EXTENSIONS = {
-    ".mp4",
-    ".avi",
-    ".mov",
-    ".mkv",
-    ".mp3",
-    ".wav",
-    ".m4a",
-    ".webm",
-}
+_ALLOWED_UPLOAD_EXTENSIONS = frozenset(
+    {
+        ".mp4",
+        ".avi",
+        ".mov",
+        ".mkv",
+        ".mp3",
+        ".wav",
+        ".m4a",
+        ".webm",
+    }
+)
+
+# Choice lists for validation error details, joined once at import.
+_ALLOWED_UPLOAD_EXTENSIONS_TEXT = ", ".join(sorted(_ALLOWED_UPLOAD_EXTENSIONS))
+_FILE_TYPE_CHOICES_TEXT = ", ".join(FileType)
+_PROCESSING_MODE_CHOICES_TEXT = ", ".join(ProcessingMode)
 
 _DEFAULT_FILENAME = "video"
 _SUFFIX_ORIGINAL = "(original)"
@@ -86,6 +96,21 @@ _FILE_META: dict[FileType, _FileMeta] = {
 _FILENAME_BAD_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
 
 _MAX_UPLOAD_BYTES = 500 * 1024 * 1024  # 500 MB
+_UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+
+# SSE frames are assembled from pre-encoded "event:" headers, matching the
+# wire format EventSourceResponse produces with its default "\r\n" separator.
+_SSE_SEP = b"\r\n"
+_SSE_FRAME_PREFIX: dict[SSEEvent, bytes] = {
+    event: b"event: " + event.value.encode() + _SSE_SEP + b"data: "
+    for event in SSEEvent
+}
+_SSE_FRAME_SUFFIX = _SSE_SEP * 2
+
+
+def _encode_sse(event: SSEEvent, data: bytes) -> bytes:
+    """Encode a single-line SSE frame without building a ServerSentEvent."""
+    return _SSE_FRAME_PREFIX[event] + data + _SSE_FRAME_SUFFIX
 
 
 def _sanitize_filename(name: str) -> str:
@@ -95,6 +120,37 @@ def _sanitize_filename(name: str) -> str:
     return truncated.rstrip(" .") or _DEFAULT_FILENAME
 
 
+def _advise_sequential(src: BinaryIO) -> None:
+    """Hint the kernel to read ahead aggressively on a disk-backed upload."""
+    if sys.platform != "linux":
+        return
+    # Same check Starlette's UploadFile uses; fileno() on an in-memory
+    # SpooledTemporaryFile would force it to roll over to disk.
+    if not getattr(src, "_rolled", True):
+        return
+    try:
+        fd = src.fileno()
+    except (AttributeError, OSError):
+        return
+    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _copy_upload(src: BinaryIO, dest: Path, max_size: int) -> bool:
+    """Copy an uploaded file to *dest*; returns False once it exceeds max_size.
+
+    Runs in a worker thread so the chunked disk writes stay off the event loop.
+    """
+    _advise_sequential(src)
+    bytes_written = 0
+    with dest.open("wb") as buf:
+        while chunk := src.read(_UPLOAD_CHUNK_BYTES):
+            bytes_written += len(chunk)
+            if bytes_written > max_size:
+                return False
+            buf.write(chunk)
+    return True
+
+
 def _build_download_filename(job: Job, file_type: FileType) -> str:
     """Build a human-readable download filename for the given job and file type."""
     base = _sanitize_filename(job.video_title or _DEFAULT_FILENAME)
@@ -131,14 +187,17 @@ def _get_glossary_manager(request: Request) -> GlossaryManager:
     return manager
 
 
-def _start_background_task(request: Request, coro: Any) -> None:
-    """Start a coroutine as a background task, preventing GC."""
-    request.app.state._background_tasks = getattr(
-        request.app.state, "_background_tasks", set()
-    )
+def _start_background_task(request: Request, job: Job, coro: Any) -> None:
+    """Start a job's pipeline phase as a background task, preventing GC.
+
+    The task is recorded on the job so expiry leaves it alone while it runs.
+    """
+    # The loop only keeps weak references to tasks, so the set must hold them.
+    background_tasks: set[asyncio.Task[None]] = request.app.state.background_tasks
     task = asyncio.create_task(coro)
-    request.app.state._background_tasks.add(task)
-    task.add_done_callback(request.app.state._background_tasks.discard)
+    job.task = task
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
 
 
 @router.post("/jobs", response_model=JobCreateResponse)
@@ -153,7 +212,7 @@ async def create_job(body: JobCreateRequest, request: Request) -> JobCreateRespo
         end_time=body.end_time,
         processing_mode=ProcessingMode(body.processing_mode),
     )
-    _start_background_task(request, run_download(job))
+    _start_background_task(request, job, run_download(job))
     return JobCreateResponse(job_id=job.id)
 
 
@@ -169,39 +228,32 @@ async def create_job_from_upload(
     request: Request,
 ) -> JobCreateResponse:
     """Create a subtitle generation job from an uploaded file."""
-    filename = file.filename or ""
-    suffix = Path(filename).suffix.lower()
+    upload_name = Path(file.filename or "")
+    suffix = upload_name.suffix.lower()
     if suffix not in _ALLOWED_UPLOAD_EXTENSIONS:
         raise InvalidRequestError(
             f"Unsupported file type: {suffix}",
-            detail=f"Allowed: {', '.join(sorted(_ALLOWED_UPLOAD_EXTENSIONS))}",
+            detail=f"Allowed: {_ALLOWED_UPLOAD_EXTENSIONS_TEXT}",
         )
 
-    safe_name = Path(filename).name or f"upload{suffix}"
+    safe_name = upload_name.name or f"upload{suffix}"
 
     try:
         mode = ProcessingMode(processing_mode)
     except ValueError as err:
         raise InvalidRequestError(
             "Invalid processing_mode",
-            detail=f"Must be one of: {', '.join(ProcessingMode)}",
+            detail=f"Must be one of: {_PROCESSING_MODE_CHOICES_TEXT}",
         ) from err
 
     max_size = _MAX_UPLOAD_BYTES
-    tmp_dir = Path(tempfile.mkdtemp(prefix="bilingualsub_upload_"))
-    saved_path = tmp_dir / safe_name
-    bytes_written = 0
-    with saved_path.open("wb") as buf:
-        while chunk := await file.read(1024 * 1024):
-            bytes_written += len(chunk)
-            if bytes_written > max_size:
-                saved_path.unlink(missing_ok=True)
-                tmp_dir.rmdir()
-                raise InvalidRequestError(
-                    "File too large",
-                    detail="Maximum file size is 500 MB",
-                )
-            buf.write(chunk)
+    too_large = InvalidRequestError(
+        "File too large",
+        detail="Maximum file size is 500 MB",
+    )
+    # The multipart parser already knows the size; reject before copying.
+    if file.size is not None and file.size > max_size:
+        raise too_large
 
     manager = _get_job_manager(request)
     job = manager.create_job(
@@ -209,10 +261,17 @@ async def create_job_from_upload(
         target_lang=target_lang,
         start_time=start_time,
         end_time=end_time,
-        local_video_path=saved_path,
         processing_mode=mode,
     )
-    _start_background_task(request, run_download(job))
+    # The upload lives in the job's work dir, so expiry removes it as well.
+    job.work_dir = WORK_ROOT / job.id
+    saved_path = job.work_dir / safe_name
+    await asyncio.to_thread(job.work_dir.mkdir, parents=True)
+    if not await asyncio.to_thread(_copy_upload, file.file, saved_path, max_size):
+        manager.remove_job(job.id)
+        raise too_large
+    job.local_video_path = saved_path
+    _start_background_task(request, job, run_download(job))
     return JobCreateResponse(job_id=job.id)
 
 
@@ -233,7 +292,7 @@ async def get_job_status(job_id: str, request: Request) -> JobStatusResponse:
         progress=job.progress,
         current_step=job.current_step,
         error=error,
-        output_files={ft: str(p) for ft, p in job.output_files.items()},
+        output_files=job.output_files_str,
     )
 
 
@@ -242,25 +301,31 @@ async def job_events(job_id: str, request: Request) -> EventSourceResponse:
     """SSE stream of job progress events."""
     job = _get_job_or_404(request, job_id)
 
-    async def event_generator() -> AsyncIterator[dict[str, str]]:
+    async def event_generator() -> AsyncIterator[bytes]:
+        last_progress: bytes | None = None
         while True:
-            try:
-                event = await asyncio.wait_for(
-                    job.event_queue.get(), timeout=SSE_KEEPALIVE_SECONDS
-                )
-                yield {
-                    "event": str(event["event"]),
-                    "data": json.dumps(event["data"]),
-                }
-                # Stop streaming on terminal events
-                if event["event"] in (SSEEvent.COMPLETE, SSEEvent.ERROR):
-                    return
-                # download_complete does NOT close the stream
-            except TimeoutError:
-                # Send keepalive ping
-                yield {"event": SSEEvent.PING, "data": ""}
-
-    return EventSourceResponse(event_generator())
+            event = await job.event_queue.get()
+            sse_event = cast("SSEEvent", event["event"])
+            payload = to_json(event["data"], fallback=str)
+            if sse_event == SSEEvent.PROGRESS:
+                # Identical consecutive progress frames carry no new information.
+                if payload == last_progress:
+                    continue
+                last_progress = payload
+            yield _encode_sse(sse_event, payload)
+            # Stop streaming on terminal events
+            if sse_event in (SSEEvent.COMPLETE, SSEEvent.ERROR):
+                return
+            # download_complete does NOT close the stream
+
+    # Keepalives are SSE comment lines written by sse-starlette's ping task;
+    # EventSource ignores them, so no listener wakes up for a ping. A client
+    # that stops reading is dropped after SSE_SEND_TIMEOUT_SECONDS.
+    return EventSourceResponse(
+        event_generator(),
+        ping=SSE_KEEPALIVE_SECONDS,
+        send_timeout=SSE_SEND_TIMEOUT_SECONDS,
+    )
 
 
 @router.get("/jobs/{job_id}/download/{file_type}")
@@ -272,12 +337,18 @@ async def download_file(job_id: str, file_type: str, request: Request) -> FileRe
     except ValueError as err:
         raise InvalidRequestError(
             f"Invalid file type: {file_type}",
-            detail=f"Must be one of: {', '.join(FileType)}",
+            detail=f"Must be one of: {_FILE_TYPE_CHOICES_TEXT}",
         ) from err
 
     job = _get_job_or_404(request, job_id)
     path = job.output_files.get(ft)
-    if path is None or not path.exists():
+    # One stat both checks existence and feeds FileResponse, which would
+    # otherwise stat the file again before sending it.
+    try:
+        stat_result = path.stat() if path is not None else None
+    except FileNotFoundError:
+        stat_result = None
+    if path is None or stat_result is None:
         raise InvalidRequestError(
             f"File not available: {file_type}",
             detail="Job may not have completed this step",
@@ -287,6 +358,7 @@ async def download_file(job_id: str, file_type: str, request: Request) -> FileRe
         path=path,
         media_type=_FILE_META[ft].media_type,
         filename=_build_download_filename(job, ft),
+        stat_result=stat_result,
     )
 
 
@@ -312,7 +384,7 @@ async def start_subtitle(
             job.processing_mode = ProcessingMode(body.processing_mode)
     glossary_manager = _get_glossary_manager(request)
     job.glossary_text = glossary_manager.format_for_prompt()
-    _start_background_task(request, run_subtitle(job))
+    _start_background_task(request, job, run_subtitle(job))
     return {"status": "subtitle_started"}
 
 
@@ -327,8 +399,10 @@ async def burn_job(job_id: str, body: BurnRequest, request: Request) -> dict[str
 
     job.status = JobStatus.BURNING
     job.progress = 0.0
-    job.event_queue = asyncio.Queue()
-    _start_background_task(request, run_burn(job, body.srt_content))
+    # Clear in place: an SSE stream still open since download_complete keeps
+    # reading this queue and must receive the burn events.
+    job.event_queue.clear()
+    _start_background_task(request, job, run_burn(job, body.srt_content))
     return {"status": "burning"}
 
 
@@ -348,11 +422,7 @@ async def partial_retranslate(
         results = await asyncio.to_thread(
             retranslate_entries,
             entries=[
-                RetranslateEntry(
-                    index=entry.index,
-                    original=entry.original,
-                    translated=entry.translated,
-                )
+                RetranslateEntry(entry.index, entry.original, entry.translated)
                 for entry in body.entries
             ],
             selected_indices=body.selected_indices,
@@ -2,10 +2,14 @@
 
 from typing import Literal, Self
 
-from pydantic import BaseModel, ConfigDict, HttpUrl, model_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, model_validator
 
 from bilingualsub.api.constants import FileType, JobStatus
 
+# Upper bound for an edited SRT body; enforced by pydantic-core before the
+# payload reaches Python code.
+MAX_SRT_CONTENT_CHARS = 10_000_000
+
 
 class JobCreateRequest(BaseModel):
     """Request body for creating a new subtitle generation job."""
@@ -64,7 +68,7 @@ class JobStatusResponse(BaseModel):
 class BurnRequest(BaseModel):
     """Request body for on-demand subtitle burn."""
 
-    srt_content: str
+    srt_content: str = Field(max_length=MAX_SRT_CONTENT_CHARS)
 
 
 class StartSubtitleRequest(BaseModel):
@@ -1,30 +1,90 @@
-"""Core business logic modules."""
-
-from bilingualsub.core.downloader import (
-    DownloadError,
-    VideoMetadata,
-    download_video,
-)
-from bilingualsub.core.glossary import GlossaryEntry, GlossaryError, GlossaryManager
-from bilingualsub.core.merger import merge_subtitles
-from bilingualsub.core.subtitle import Subtitle, SubtitleEntry
-from bilingualsub.core.subtitle_fetcher import SubtitleFetchError, fetch_manual_subtitle
-from bilingualsub.core.transcriber import (
-    TranscriptionError,
-    build_whisper_prompt,
-    transcribe_audio,
-)
-from bilingualsub.core.translator import (
-    RetranslateEntry,
-    RetranslateResult,
-    TranslationError,
-    retranslate_entries,
-    translate_subtitle,
-)
-from bilingualsub.core.visual_describer import (
-    VisualDescriptionError,
-    describe_video,
-)
+"""Core business logic modules.
+
+Submodules are imported lazily on first attribute access so that importing a
+light module such as ``bilingualsub.core.subtitle`` does not pull in yt-dlp,
+agno, and the speech-to-text clients.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from bilingualsub.core.downloader import (
+        DownloadError,
+        VideoMetadata,
+        download_video,
+    )
+    from bilingualsub.core.glossary import (
+        GlossaryEntry,
+        GlossaryError,
+        GlossaryManager,
+    )
+    from bilingualsub.core.merger import merge_subtitles
+    from bilingualsub.core.subtitle import Subtitle, SubtitleEntry
+    from bilingualsub.core.subtitle_fetcher import (
+        SubtitleFetchError,
+        fetch_manual_subtitle,
+    )
+    from bilingualsub.core.transcriber import (
+        TranscriptionError,
+        build_whisper_prompt,
+        transcribe_audio,
+    )
+    from bilingualsub.core.translator import (
+        RetranslateEntry,
+        RetranslateResult,
+        TranslationError,
+        iter_translated_entries,
+        retranslate_entries,
+        translate_subtitle,
+        translate_subtitles,
+    )
+    from bilingualsub.core.visual_describer import (
+        VisualDescriptionError,
+        describe_video,
+    )
+
+_EXPORTS: dict[str, str] = {
+    "DownloadError": "downloader",
+    "VideoMetadata": "downloader",
+    "download_video": "downloader",
+    "GlossaryEntry": "glossary",
+    "GlossaryError": "glossary",
+    "GlossaryManager": "glossary",
+    "merge_subtitles": "merger",
+    "Subtitle": "subtitle",
+    "SubtitleEntry": "subtitle",
+    "SubtitleFetchError": "subtitle_fetcher",
+    "fetch_manual_subtitle": "subtitle_fetcher",
+    "TranscriptionError": "transcriber",
+    "build_whisper_prompt": "transcriber",
+    "transcribe_audio": "transcriber",
+    "RetranslateEntry": "translator",
+    "RetranslateResult": "translator",
+    "TranslationError": "translator",
+    "iter_translated_entries": "translator",
+    "retranslate_entries": "translator",
+    "translate_subtitle": "translator",
+    "translate_subtitles": "translator",
+    "VisualDescriptionError": "visual_describer",
+    "describe_video": "visual_describer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "DownloadError",
@@ -44,8 +104,10 @@ __all__ = [
     "describe_video",
     "download_video",
     "fetch_manual_subtitle",
+    "iter_translated_entries",
     "merge_subtitles",
     "retranslate_entries",
     "transcribe_audio",
     "translate_subtitle",
+    "translate_subtitles",
 ]
@@ -1,19 +1,23 @@
 """Video downloader (via yt-dlp) with metadata extraction."""
 
-import json
+import mmap
 import os
 import shutil
+import struct
 import subprocess  # nosec B404
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yt_dlp
+from pydantic_core import from_json
 from yt_dlp.extractor import gen_extractor_classes
 from yt_dlp.utils import download_range_func
 
+from bilingualsub.utils.ffmpeg import FFPROBE_BIN
+
 
 class DownloadError(Exception):
     """Raised when video download or metadata extraction fails."""
@@ -97,7 +101,9 @@ def download_video(
         raise DownloadError(f"Failed to download video: {e}") from e
 
     try:
-        metadata = _extract_metadata_with_ffprobe(output_path)
+        metadata = _extract_metadata_from_mp4(
+            output_path
+        ) or _extract_metadata_with_ffprobe(output_path)
     except (FileNotFoundError, OSError, subprocess.CalledProcessError):
         # FFprobe not available or failed, use info_dict as fallback
         try:
@@ -143,15 +149,26 @@ def _extract_channel_from_info(info_dict: dict[str, Any]) -> tuple[str, str]:
     return channel, channel_url
 
 
-_SUPPORTED_EXTRACTOR_CLASSES: list[type] = [
-    cls for cls in gen_extractor_classes() if cls.IE_NAME != "generic"
-]
+@lru_cache(maxsize=1)
+def _supported_extractor_classes() -> tuple[type, ...]:
+    """Return yt-dlp's dedicated extractors, built on first use.
+
+    Instantiating the full extractor registry is slow, so it is deferred from
+    import time to the first URL check.
+    """
+    return tuple(cls for cls in gen_extractor_classes() if cls.IE_NAME != "generic")
 
 
 @lru_cache(maxsize=256)
 def _is_supported_url(url: str) -> bool:
     """Check if yt-dlp has a dedicated extractor for this URL."""
-    return any(cls.suitable(url) for cls in _SUPPORTED_EXTRACTOR_CLASSES)  # type: ignore[attr-defined]
+    return any(cls.suitable(url) for cls in _supported_extractor_classes())  # type: ignore[attr-defined]
+
+
+_OUTPUT_EXTENSIONS = (".mp4", ".webm", ".mkv", ".mov", ".avi")
+# Fragments fetched in parallel for DASH/HLS formats (yt-dlp's default is 1).
+# Jobs already download concurrently, so keep the per-video fan-out modest.
+_CONCURRENT_FRAGMENT_DOWNLOADS = 4
 
 
 def _download_video(
@@ -205,6 +222,7 @@ def _download_video(
             "no_warnings": True,
             "progress_hooks": [_progress_hook],
             "js_runtimes": js_runtimes,
+            "concurrent_fragment_downloads": _CONCURRENT_FRAGMENT_DOWNLOADS,
         }
     else:
         # Fallback format (no merge required, works without FFmpeg)
@@ -215,6 +233,7 @@ def _download_video(
             "no_warnings": True,
             "progress_hooks": [_progress_hook],
             "js_runtimes": js_runtimes,
+            "concurrent_fragment_downloads": _CONCURRENT_FRAGMENT_DOWNLOADS,
         }
 
     # Optional: allow authenticated downloads for environments affected by
@@ -240,22 +259,24 @@ def _download_video(
             raise DownloadError("Failed to extract video info")
         info_dict: dict[str, Any] = info_dict_result
 
-    # yt-dlp may add different extensions depending on format
-    possible_extensions = [".mp4", ".webm", ".mkv", ".mov", ".avi"]
-    actual_output = None
-    for ext in possible_extensions:
-        candidate = output_path.with_suffix("").with_suffix(ext)
-        if candidate.exists():
-            actual_output = candidate
-            break
+    # yt-dlp may add different extensions depending on format. One directory
+    # listing replaces a stat() per candidate name.
+    no_suffix = output_path.with_suffix("")
+    produced = {p.name for p in output_path.parent.iterdir()}
+    actual_output = next(
+        (
+            no_suffix.with_suffix(ext)
+            for ext in _OUTPUT_EXTENSIONS
+            if no_suffix.name + ext in produced
+        ),
+        None,
+    )
 
     if actual_output and actual_output != output_path:
         actual_output.rename(output_path)
-    elif not output_path.exists():
-        # Check if file exists without suffix (some formats)
-        no_suffix = output_path.with_suffix("")
-        if no_suffix.exists():
-            no_suffix.rename(output_path)
+    elif output_path.name not in produced and no_suffix.name in produced:
+        # File written without suffix (some formats)
+        no_suffix.rename(output_path)
 
     return info_dict
 
@@ -328,26 +349,152 @@ def _extract_metadata_from_info_dict(
     )
 
 
+_MP4_CONTAINER_BOXES = frozenset({b"moov", b"trak", b"mdia", b"minf", b"stbl"})
+
+
+def _iter_mp4_boxes(
+    buf: mmap.mmap, start: int, end: int
+) -> Iterator[tuple[bytes, int, int]]:
+    """Yield ``(type, payload_start, box_end)`` for each box in ``buf[start:end]``."""
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", buf, offset)
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack_from(">Q", buf, offset + 8)
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header or offset + size > end:
+            return
+        yield box_type, offset + header, offset + size
+        offset += size
+
+
+def _find_mp4_box(buf: mmap.mmap, start: int, end: int, path: bytes) -> int | None:
+    """Return the payload offset of the box at ``path`` (e.g. ``b"mdia/hdlr"``)."""
+    head, _, rest = path.partition(b"/")
+    for box_type, payload, box_end in _iter_mp4_boxes(buf, start, end):
+        if box_type == head:
+            return payload if not rest else _find_mp4_box(buf, payload, box_end, rest)
+    return None
+
+
+def _read_mp4_timescale_and_duration(buf: mmap.mmap, payload: int) -> tuple[int, int]:
+    """Read timescale and duration from a version 0/1 ``mvhd`` or ``mdhd`` box."""
+    if buf[payload] == 1:
+        return struct.unpack_from(">IQ", buf, payload + 20)
+    return struct.unpack_from(">II", buf, payload + 12)
+
+
+def _extract_metadata_from_mp4(video_path: Path) -> VideoMetadata | None:
+    """Read video metadata straight from the MP4 ``moov`` box.
+
+    Covers the progressive MP4 files yt-dlp writes without spawning ffprobe.
+    Returns None for anything it cannot fully parse (other containers,
+    fragmented files, missing boxes) so the caller can fall back to ffprobe.
+    """
+    try:
+        with (
+            video_path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf,
+        ):
+            if buf[4:8] != b"ftyp":
+                return None
+            moov = next(
+                (
+                    (payload, box_end)
+                    for box_type, payload, box_end in _iter_mp4_boxes(buf, 0, len(buf))
+                    if box_type == b"moov"
+                ),
+                None,
+            )
+            if moov is None:
+                return None
+
+            video: tuple[int, int, float] | None = None
+            has_audio = False
+            movie_duration = 0.0
+            for box_type, payload, box_end in _iter_mp4_boxes(buf, *moov):
+                if box_type == b"mvhd":
+                    timescale, duration = _read_mp4_timescale_and_duration(buf, payload)
+                    movie_duration = duration / timescale if timescale else 0.0
+                if box_type != b"trak":
+                    continue
+                hdlr = _find_mp4_box(buf, payload, box_end, b"mdia/hdlr")
+                if hdlr is None:
+                    continue
+                handler = buf[hdlr + 8 : hdlr + 12]
+                if handler == b"soun":
+                    has_audio = True
+                elif handler == b"vide" and video is None:
+                    video = _read_mp4_video_track(buf, payload, box_end)
+    except (OSError, ValueError, IndexError, struct.error):
+        return None
+
+    if video is None or movie_duration <= 0:
+        return None
+    width, height, fps = video
+    try:
+        return VideoMetadata(
+            title=video_path.stem,
+            duration=movie_duration,
+            width=width,
+            height=height,
+            fps=fps,
+            has_audio=has_audio,
+        )
+    except ValueError:
+        return None
+
+
+def _read_mp4_video_track(
+    buf: mmap.mmap, trak: int, trak_end: int
+) -> tuple[int, int, float] | None:
+    """Return ``(width, height, fps)`` for a video ``trak`` box."""
+    mdhd = _find_mp4_box(buf, trak, trak_end, b"mdia/mdhd")
+    stsd = _find_mp4_box(buf, trak, trak_end, b"mdia/minf/stbl/stsd")
+    stts = _find_mp4_box(buf, trak, trak_end, b"mdia/minf/stbl/stts")
+    if mdhd is None or stsd is None or stts is None:
+        return None
+
+    # The first visual sample entry starts after stsd's version/flags and
+    # entry count; coded width/height sit 32 bytes into the entry.
+    width, height = struct.unpack_from(">HH", buf, stsd + 8 + 32)
+
+    timescale, _ = _read_mp4_timescale_and_duration(buf, mdhd)
+    (entry_count,) = struct.unpack_from(">I", buf, stts + 4)
+    samples = 0
+    ticks = 0
+    for sample_count, sample_delta in struct.iter_unpack(
+        ">II", buf[stts + 8 : stts + 8 + entry_count * 8]
+    ):
+        samples += sample_count
+        ticks += sample_count * sample_delta
+    if not ticks or not timescale:
+        return None
+    return width, height, samples * timescale / ticks
+
+
 def _extract_metadata_with_ffprobe(video_path: Path) -> VideoMetadata:
     """Extract video metadata using ffprobe."""
     cmd = [
-        "ffprobe",
+        FFPROBE_BIN,
         "-v",
         "quiet",
         "-print_format",
         "json",
-        "-show_format",
-        "-show_streams",
+        "-show_entries",
+        "format=duration:format_tags=title:stream=codec_type,width,height,r_frame_rate",
         str(video_path),
     ]
 
     result = subprocess.run(  # nosec B603
         cmd,
         capture_output=True,
-        text=True,
         check=True,
     )
-    data = json.loads(result.stdout)
+    data = from_json(result.stdout)
 
     # Find video stream
     video_stream = None
@@ -34,15 +34,11 @@ def merge_subtitles(
             f"translated has {len(translated)} entries"
         )
 
-    merged = []
-    for orig, trans in zip(original, translated, strict=True):
-        bilingual_text = f"{trans.text}\n{orig.text}"
-        merged_entry = SubtitleEntry(
-            index=orig.index,
-            start=orig.start,
-            end=orig.end,
-            text=bilingual_text,
+    # Index and timing come from validated originals and the text contains the
+    # original's non-blank text, so the entries skip re-validation.
+    return [
+        SubtitleEntry._unchecked(
+            orig.index, orig.start, orig.end, f"{trans.text}\n{orig.text}"
         )
-        merged.append(merged_entry)
-
-    return merged
+        for orig, trans in zip(original, translated, strict=True)
+    ]
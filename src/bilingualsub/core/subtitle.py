@@ -3,9 +3,10 @@
 from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import timedelta
+from itertools import pairwise
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleEntry:
     """Single subtitle entry with timing and text."""
 
@@ -25,6 +26,35 @@ class SubtitleEntry:
         if not self.text.strip():
             raise ValueError("Text cannot be empty or whitespace-only")
 
+    @classmethod
+    def _unchecked(
+        cls, index: int, start: timedelta, end: timedelta, text: str
+    ) -> "SubtitleEntry":
+        """Build an entry without ``__post_init__`` validation.
+
+        Only for values derived from already-validated entries, where the
+        checks cannot fail.
+        """
+        entry = object.__new__(cls)
+        entry.index = index
+        entry.start = start
+        entry.end = end
+        entry.text = text
+        return entry
+
+    def with_text(self, text: str) -> "SubtitleEntry":
+        """Return a copy with the same index and timing but different text.
+
+        Only the new text is validated; index and timing were checked when
+        this entry was built.
+
+        Raises:
+            ValueError: If text is empty or whitespace-only.
+        """
+        if not text.strip():
+            raise ValueError("Text cannot be empty or whitespace-only")
+        return SubtitleEntry._unchecked(self.index, self.start, self.end, text)
+
 
 @dataclass
 class Subtitle:
@@ -46,9 +76,7 @@ class Subtitle:
                 )
 
         # Validate no overlapping time ranges
-        for i in range(len(self.entries) - 1):
-            current = self.entries[i]
-            next_entry = self.entries[i + 1]
+        for current, next_entry in pairwise(self.entries):
             if current.end > next_entry.start:
                 raise ValueError(
                     f"Overlapping time ranges detected: "
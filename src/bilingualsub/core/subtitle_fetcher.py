@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+_VTT_TIMESTAMP_RE = re.compile(r"(\d{2}:\d{2}:\d{2})\.(\d{3})")
+_VTT_TAG_RE = re.compile(r"<[^>]+>")
+
 
 class SubtitleFetchError(Exception):
     """Raised when subtitle fetching fails."""
@@ -124,14 +127,14 @@ def vtt_to_srt(vtt_content: str) -> str:
                 fixed_parts.append(stripped)
             timing = " --> ".join(fixed_parts)
             # Fix timestamp separators: . → , (after hour-padding so regex matches)
-            timing = re.sub(r"(\d{2}:\d{2}:\d{2})\.(\d{3})", r"\1,\2", timing)
+            timing = _VTT_TIMESTAMP_RE.sub(r"\1,\2", timing)
 
             srt_lines.append(str(block_num))
             srt_lines.append(timing)
             i += 1
             while i < len(lines) and lines[i].strip() and "-->" not in lines[i]:
                 # Strip VTT positioning tags like <c> </c> and alignment tags
-                text = re.sub(r"<[^>]+>", "", lines[i].strip())
+                text = _VTT_TAG_RE.sub("", lines[i].strip())
                 if text:
                     srt_lines.append(text)
                 i += 1
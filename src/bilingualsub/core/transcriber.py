@@ -1,7 +1,14 @@
 """Audio transcription using Whisper API (Groq or OpenAI)."""
 
+import hashlib
+import json
 import re
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,9 +17,15 @@ from openai import OpenAI
 
 from bilingualsub.core.subtitle import Subtitle, SubtitleEntry
 from bilingualsub.utils.config import get_groq_api_key, get_openai_api_key, get_settings
-from bilingualsub.utils.ffmpeg import split_audio
+from bilingualsub.utils.ffmpeg import iter_audio_chunks
 
 _MAX_WHISPER_PROMPT_CHARS = 800
+# Upper bound on chunk uploads in flight at once; keeps a long video from
+# tripping the provider's per-minute request limit.
+_MAX_CONCURRENT_CHUNKS = 4
+_TRANSCRIPT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+# Break after sentence and clause punctuation, ASCII or full-width
+_CLAUSE_BREAK_RE = re.compile(r"(?<=[.?!,;\uff0c\uff1b\u3002\uff01\uff1f\u3001])\s*")
 
 
 class TranscriptionError(Exception):
@@ -38,36 +51,63 @@ def build_whisper_prompt(
     return title
 
 
+@lru_cache(maxsize=4)
+def _shared_client(client_cls: Any, api_key: str) -> Any:
+    """Return one long-lived client per provider class and API key.
+
+    The SDK clients own an HTTP connection pool, so keeping them alive lets
+    later transcriptions reuse warm TCP/TLS connections.
+    """
+    return client_cls(api_key=api_key)
+
+
+def _build_client(settings: Any) -> Any:
+    """Return the Whisper API client for the configured provider.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        A Groq or OpenAI client, shared across calls
+
+    Raises:
+        ValueError: If API key is missing or provider is unknown
+    """
+    provider = settings.transcriber_provider
+    if provider == "groq":
+        return _shared_client(Groq, get_groq_api_key())
+    if provider == "openai":
+        return _shared_client(OpenAI, get_openai_api_key())
+    raise ValueError(
+        f"Unknown transcriber provider: {provider}. Use 'groq' or 'openai'."
+    )
+
+
 def _transcribe_single(
-    audio_path: Path, *, language: str, settings: Any, prompt: str | None = None
+    audio_path: Path,
+    *,
+    client: Any,
+    language: str,
+    settings: Any,
+    prompt: str | None = None,
+    time_offset: float = 0.0,
 ) -> Subtitle:
     """Transcribe a single audio file (must be <= 25MB).
 
     Args:
         audio_path: Path to audio file
+        client: Whisper API client from _build_client
         language: ISO 639-1 language code
         settings: Application settings
         prompt: Optional hint text to guide transcription accuracy
+        time_offset: Seconds added to every segment (start of this chunk)
 
     Returns:
         Subtitle object with transcribed entries
 
     Raises:
         TranscriptionError: If transcription fails
-        ValueError: If API key is missing or provider is unknown
     """
-    provider = settings.transcriber_provider
-
-    client: Any
-    if provider == "groq":
-        client = Groq(api_key=get_groq_api_key())
-    elif provider == "openai":
-        client = OpenAI(api_key=get_openai_api_key())
-    else:
-        raise ValueError(
-            f"Unknown transcriber provider: {provider}. Use 'groq' or 'openai'."
-        )
-
     try:
         with audio_path.open("rb") as audio_file:
             create_kwargs: dict[str, Any] = {
@@ -87,18 +127,21 @@ def _transcribe_single(
         if not segments:
             raise TranscriptionError("Transcription returned no segments")
 
-        entries = [
-            SubtitleEntry(
-                index=i,
-                start=timedelta(seconds=seg["start"]),
-                end=timedelta(seconds=seg["end"]),
-                text=seg["text"].strip(),
-            )
-            for i, seg in enumerate(
-                (s for s in segments if s["start"] < s["end"] and s["text"].strip()),
-                start=1,
-            )
-        ]
+        entries: list[SubtitleEntry] = []
+        for seg in segments:
+            start, end = seg["start"], seg["end"]
+            if start >= end:
+                continue
+            text = seg["text"].strip()
+            if text:
+                entries.append(
+                    SubtitleEntry(
+                        index=len(entries) + 1,
+                        start=timedelta(seconds=start + time_offset),
+                        end=timedelta(seconds=end + time_offset),
+                        text=text,
+                    )
+                )
 
         if not entries:
             raise TranscriptionError("No valid segments after filtering")
@@ -110,6 +153,79 @@ def _transcribe_single(
         raise TranscriptionError(f"Failed to parse transcription result: {e}") from e
 
 
+def _transcript_cache_path(
+    audio_path: Path, *, language: str, settings: Any, prompt: str | None
+) -> Path | None:
+    """Return the cache file for this audio and request, or None if disabled.
+
+    The key covers the audio bytes and every input that changes the Whisper
+    output, so a hit is only possible for an identical request.
+    """
+    if not settings.transcript_cache_dir:
+        return None
+    with audio_path.open("rb") as audio_file:
+        audio_digest = hashlib.file_digest(audio_file, "sha256").hexdigest()
+    key = "\0".join(
+        (
+            audio_digest,
+            settings.transcriber_provider,
+            settings.transcriber_model,
+            language,
+            prompt or "",
+        )
+    )
+    name = hashlib.sha256(key.encode()).hexdigest()
+    return Path(settings.transcript_cache_dir) / f"{name}.json"
+
+
+def _load_cached_entries(cache_path: Path) -> list[SubtitleEntry] | None:
+    """Load cached transcript entries, or None on a miss or stale/corrupt file."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > _TRANSCRIPT_CACHE_TTL_SECONDS:
+            return None
+        rows = json.loads(cache_path.read_text(encoding="utf-8"))
+        return [
+            SubtitleEntry(
+                index=i,
+                start=timedelta(seconds=start),
+                end=timedelta(seconds=end),
+                text=text,
+            )
+            for i, (start, end, text) in enumerate(rows, start=1)
+        ]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_entries(cache_path: Path, entries: list[SubtitleEntry]) -> None:
+    """Write transcript entries to the cache; failures only cost a future miss.
+
+    Expired files in the cache directory are removed at the same time, so the
+    directory does not grow without bound.
+    """
+    rows = [
+        [entry.start.total_seconds(), entry.end.total_seconds(), entry.text]
+        for entry in entries
+    ]
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(rows, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+    _prune_stale_cache_files(cache_path.parent)
+
+
+def _prune_stale_cache_files(cache_dir: Path) -> None:
+    """Delete cached transcripts past the TTL, which no lookup would serve."""
+    cutoff = time.time() - _TRANSCRIPT_CACHE_TTL_SECONDS
+    for path in cache_dir.glob("*.json"):
+        with suppress(OSError):
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+
+
 def _has_cjk(text: str) -> bool:
     """Check if the text contains CJK characters (Chinese, Japanese, or Korean)."""
     return any(
@@ -222,20 +338,15 @@ def _split_long_entries(
         duration = (entry.end - entry.start).total_seconds()
         if duration <= max_duration_sec and len(entry.text) <= max_chars:
             new_entries.append(
-                SubtitleEntry(
-                    index=current_index,
-                    start=entry.start,
-                    end=entry.end,
-                    text=entry.text,
+                SubtitleEntry._unchecked(
+                    current_index, entry.start, entry.end, entry.text
                 )
             )
             current_index += 1
             continue
 
         # Split by punctuation first (sentences and clauses)
-        raw_parts = re.split(
-            r"(?<=[.?!,;\uff0c\uff1b\u3002\uff01\uff1f\u3001])\s*", entry.text
-        )
+        raw_parts = _CLAUSE_BREAK_RE.split(entry.text)
         parts = [p.strip() for p in raw_parts if p.strip()]
 
         # Merge adjacent parts that are too short,
@@ -282,11 +393,8 @@ def _split_long_entries(
         total_len = sum(len(p) for p in refined_parts)
         if total_len == 0:
             new_entries.append(
-                SubtitleEntry(
-                    index=current_index,
-                    start=entry.start,
-                    end=entry.end,
-                    text=entry.text,
+                SubtitleEntry._unchecked(
+                    current_index, entry.start, entry.end, entry.text
                 )
             )
             current_index += 1
@@ -316,6 +424,60 @@ def _split_long_entries(
     return new_entries
 
 
+def _transcribe_entries(
+    audio_path: Path, *, language: str, settings: Any, prompt: str | None
+) -> list[SubtitleEntry]:
+    """Transcribe audio via Whisper, splitting files over 25MB into chunks."""
+    client = _build_client(settings)
+    file_size_mb = audio_path.stat().st_size / (1024 * 1024)
+    if file_size_mb <= 25:
+        subtitle = _transcribe_single(
+            audio_path,
+            client=client,
+            language=language,
+            settings=settings,
+            prompt=prompt,
+        )
+        all_entries = subtitle.entries
+    else:
+        # Large file: split into chunks and transcribe each. Chunks are
+        # submitted as ffmpeg finishes cutting them, so uploads overlap the
+        # remaining cuts.
+        chunks = iter_audio_chunks(audio_path, output_dir=audio_path.parent)
+
+        def _transcribe_chunk(chunk_path: Path, time_offset: float) -> Subtitle:
+            return _transcribe_single(
+                chunk_path,
+                client=client,
+                language=language,
+                settings=settings,
+                prompt=prompt,
+                time_offset=time_offset,
+            )
+
+        # Results are collected in submission order so entries are numbered
+        # in playback order below.
+        with ThreadPoolExecutor(
+            max_workers=_MAX_CONCURRENT_CHUNKS,
+            thread_name_prefix="bilingualsub-whisper",
+        ) as pool:
+            futures = [
+                pool.submit(_transcribe_chunk, chunk_path, time_offset)
+                for chunk_path, time_offset in chunks
+            ]
+            chunk_subtitles = [future.result() for future in futures]
+
+        # Chunk entries already carry absolute timing and belong to this call
+        # only, so they are renumbered in place rather than rebuilt.
+        all_entries = []
+        for subtitle in chunk_subtitles:
+            for entry in subtitle.entries:
+                entry.index = len(all_entries) + 1
+                all_entries.append(entry)
+
+    return all_entries
+
+
 def transcribe_audio(
     audio_path: Path, *, language: str = "en", prompt: str | None = None
 ) -> Subtitle:
@@ -323,6 +485,8 @@ def transcribe_audio(
     Transcribe audio file to subtitle using Whisper API.
 
     For files > 25MB, automatically splits into chunks and merges results.
+    When ``transcript_cache_dir`` is configured, identical requests made within
+    seven days reuse the cached transcript instead of calling the API.
 
     Args:
         audio_path: Path to audio/video file
@@ -346,32 +510,16 @@ def transcribe_audio(
     language = language.split("-", maxsplit=1)[0]
     settings = get_settings()
 
-    file_size_mb = audio_path.stat().st_size / (1024 * 1024)
-    if file_size_mb <= 25:
-        subtitle = _transcribe_single(
+    cache_path = _transcript_cache_path(
+        audio_path, language=language, settings=settings, prompt=prompt
+    )
+    all_entries = None if cache_path is None else _load_cached_entries(cache_path)
+    if all_entries is None:
+        all_entries = _transcribe_entries(
             audio_path, language=language, settings=settings, prompt=prompt
         )
-        all_entries = subtitle.entries
-    else:
-        # Large file: split into chunks and transcribe each
-        chunks = split_audio(audio_path, output_dir=audio_path.parent)
-        all_entries = []
-        idx = 1
-        for chunk_path, time_offset in chunks:
-            subtitle = _transcribe_single(
-                chunk_path, language=language, settings=settings, prompt=prompt
-            )
-            offset_td = timedelta(seconds=time_offset)
-            for entry in subtitle.entries:
-                all_entries.append(
-                    SubtitleEntry(
-                        index=idx,
-                        start=entry.start + offset_td,
-                        end=entry.end + offset_td,
-                        text=entry.text,
-                    )
-                )
-                idx += 1
+        if cache_path is not None:
+            _store_cached_entries(cache_path, all_entries)
 
     # Split long entries before returning
     split_entries = _split_long_entries(all_entries)
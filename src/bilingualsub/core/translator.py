@@ -1,15 +1,27 @@
 """LLM-based subtitle translation using Agno."""
 
+import hashlib
+import random
 import re
+import sqlite3
+import threading
 import time
-from collections.abc import Callable
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from json import JSONDecodeError, loads
+from pathlib import Path
+from typing import Any, cast
 from urllib.parse import urlparse
 
 import structlog
 from agno.agent import Agent
 from agno.models.base import Model
+from agno.models.groq import Groq
 from agno.models.openai import OpenAIChat
 
 from bilingualsub.core.subtitle import Subtitle, SubtitleEntry
@@ -23,15 +35,64 @@ from bilingualsub.utils.config import (
 logger = structlog.get_logger()
 
 _BATCH_SIZE = 10
+_MAX_ADAPTIVE_BATCH_SIZE = 80
+_BATCH_CHAR_BUDGET = 1500  # Close a batch early once its source text is this long
+_MIN_SPLIT_BATCH_SIZE = 6  # Smaller failed batches go straight to one-by-one
 _CONTEXT_SIZE = 5  # Number of previous entries to include as context
 _LOOKAHEAD_SIZE = 3  # Number of upcoming entries to include as forward context
 _MAX_RETRIES = 5
+_TRANSIENT_RETRIES = 2  # Extra batch attempts after a network or server error
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_MAX_SECONDS = 16.0
+_RATE_LIMIT_BACKOFF_MAX_SECONDS = 60.0
+_HTTP_REQUEST_TIMEOUT = 408
+_HTTP_SERVER_ERROR = 500
 _PARTIAL_CONTEXT_WINDOW = 5
 _MAX_METADATA_TITLE_CHARS = 200
 _MAX_METADATA_DESC_CHARS = 1200
 _GROQ_PREFIX = "groq:"
 _OPENAI_PREFIX = "openai:"
 _PROXY_PLACEHOLDER_API_KEY = "dummy"  # pragma: allowlist secret
+# Agents kept per thread for each translator API key (one per system prompt).
+_AGENTS_PER_THREAD_PER_KEY = 4
+
+_thread_agents = threading.local()
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_NUMBER_PREFIX_RE = re.compile(r"^\s*\d+\s*[.):\uff0e]\s*")
+# Horizontal whitespace only, so a match never runs into the next line
+_BATCH_LINE_RE = re.compile(
+    r"^[^\S\n]*(\d+)[^\S\n]*[.):\uff0e][^\S\n]*(.+)$", re.MULTILINE
+)
+_JSON_START_RE = re.compile(r"\s*[{\[`]")
+_RETRY_AFTER_RE = re.compile(r"try again in (?:(\d+)m)?(\d+(?:\.\d+)?)s")
+_LEADING_PUNCT_RE = re.compile(r"^[，。？！、,.:;!?\s]+")  # noqa: RUF001
+_TRAILING_PUNCT_RE = re.compile(r"([，。？！、,.:;!?\s]+)$")  # noqa: RUF001
+
+# The fixed instructions lead the prompt so consecutive batches share the
+# longest possible prefix with the system prompt (provider prompt caching);
+# only the context, lines and lookahead that follow vary per batch.
+_BATCH_PROMPT_TEMPLATE = (
+    "將以下編號字幕從{source_lang}翻譯成{target_lang}。\n"
+    "只回傳編號翻譯，每行一條，編號與原文一致。\n"  # noqa: RUF001
+    "若原文專有名詞疑似語音辨識錯字，請依上文、下文、影片背景與術語表修正後翻譯。"  # noqa: RUF001
+    "例如同一影片已出現的品牌、人名、產品名與網域應保持一致。\n"
+)
+_JSON_BATCH_PROMPT_TEMPLATE = (
+    "將以下編號字幕從{source_lang}翻譯成{target_lang}。\n"
+    '只回傳一個 JSON 物件：{{"translations": ["第 1 行翻譯", "第 2 行翻譯", ...]}}，'  # noqa: RUF001
+    "陣列依編號順序排列、長度與字幕行數一致；不要加 Markdown 或任何說明。\n"  # noqa: RUF001
+    "若原文專有名詞疑似語音辨識錯字，請依上文、下文、影片背景與術語表修正後翻譯。"  # noqa: RUF001
+    "例如同一影片已出現的品牌、人名、產品名與網域應保持一致。\n"
+)
+_RETRANSLATE_PROMPT_TEMPLATE = (
+    "請將以下字幕從{source_lang}翻譯成{target_lang}。\n"
+    "只回傳一個 JSON 物件，不要加 Markdown、引號外文字或任何說明。\n"  # noqa: RUF001
+    '格式：{{"index": 數字, "original": "修正後原文", '  # noqa: RUF001
+    '"translated": "目標語言翻譯"}}。\n'
+    "若原文專有名詞疑似語音辨識錯字，請依上文、下文、影片背景、術語表與使用者補充上下文修正後翻譯。"  # noqa: RUF001
+    "例如同一影片已出現的品牌、人名、產品名與網域應保持一致。"
+)
 
 
 class TranslationError(Exception):
@@ -46,7 +107,247 @@ class RateLimitError(TranslationError):
         super().__init__(message or f"Rate limited, retry after {retry_after:.0f}s")
 
 
-@dataclass
+class _TranslationCache:
+    """Translations of single subtitle lines for one model and language pair.
+
+    Hits are served from memory first, so a line repeated within a file is
+    only sent to the LLM once. When ``path`` is set, misses fall through to an
+    SQLite table that survives across runs. Storage errors only cost a miss.
+    """
+
+    def __init__(self, namespace: str, path: str = "") -> None:
+        self._namespace = namespace
+        self._memory: dict[str, str] = {}
+        # Guards the memory map and the connection, which worker threads share.
+        self._lock = threading.Lock()
+        self._conn = self._connect(Path(path).expanduser()) if path else None
+        if self._conn is not None:
+            weakref.finalize(self, self._conn.close)
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection | None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(key TEXT PRIMARY KEY, translated TEXT NOT NULL)"
+            )
+        except (OSError, sqlite3.Error):
+            return None
+        return conn
+
+    def _key(self, text: str) -> str:
+        return hashlib.blake2b(
+            f"{self._namespace}\0{text}".encode(), digest_size=16
+        ).hexdigest()
+
+    def get_many(self, texts: list[str]) -> dict[str, str]:
+        """Return cached translations for the given source lines."""
+        with self._lock:
+            found = {text: self._memory[text] for text in texts if text in self._memory}
+        missing = {self._key(text): text for text in texts if text not in found}
+        if self._conn is None or not missing:
+            return found
+        placeholders = ",".join("?" * len(missing))
+        with self._lock:
+            try:
+                rows = self._conn.execute(
+                    "SELECT key, translated FROM translations "
+                    f"WHERE key IN ({placeholders})",
+                    list(missing),
+                ).fetchall()
+            except sqlite3.Error:
+                return found
+            stored = {missing[key]: translated for key, translated in rows}
+            self._memory.update(stored)
+        return found | stored
+
+    def put_many(self, pairs: list[tuple[str, str]]) -> None:
+        """Remember translations of source lines."""
+        with self._lock:
+            self._memory.update(pairs)
+            if self._conn is None:
+                return
+            with suppress(sqlite3.Error), self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO translations VALUES (?, ?)",
+                    [(self._key(text), translated) for text, translated in pairs],
+                )
+
+
+class _RateLimiter:
+    """Thread-safe token bucket refilled continuously at ``per_minute``."""
+
+    def __init__(self, per_minute: int) -> None:
+        self._capacity = float(per_minute)
+        self._rate = per_minute / 60
+        self._available = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Block until ``amount`` units are available, then take them."""
+        amount = min(amount, self._capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._available = min(
+                    self._capacity,
+                    self._available + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._available >= amount:
+                    self._available -= amount
+                    return
+                wait = (amount - self._available) / self._rate
+            time.sleep(wait)
+
+
+@lru_cache(maxsize=8)
+def _shared_rate_limiter(kind: str, per_minute: int) -> _RateLimiter:
+    """Return the process-wide limiter for a quota, so concurrent jobs share it.
+
+    ``kind`` keeps the request and token quotas apart when their limits match.
+    """
+    del kind
+    return _RateLimiter(per_minute)
+
+
+class _ApiKeyRing:
+    """Hands out translator API keys round-robin, skipping rate-limited ones.
+
+    A key that hit the provider's rate limit is benched until its
+    ``retry_after`` has passed. When every key is benched, the one that
+    recovers first is handed out and the caller's own retry logic waits.
+    """
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self._keys = keys
+        self._ready_at = dict.fromkeys(keys, 0.0)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def acquire(self) -> str:
+        with self._lock:
+            now = time.monotonic()
+            for offset in range(len(self._keys)):
+                position = (self._next + offset) % len(self._keys)
+                key = self._keys[position]
+                if self._ready_at[key] <= now:
+                    self._next = (position + 1) % len(self._keys)
+                    return key
+            return min(self._keys, key=self._ready_at.__getitem__)
+
+    def cool_down(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._ready_at[key] = max(self._ready_at[key], time.monotonic() + seconds)
+
+
+@lru_cache(maxsize=8)
+def _shared_key_ring(keys: tuple[str, ...]) -> _ApiKeyRing:
+    """Return the process-wide ring so benched keys stay benched across jobs."""
+    return _ApiKeyRing(keys)
+
+
+def _estimate_tokens(text: str) -> int:
+    """Roughly estimate LLM tokens: ~4 ASCII chars or 1 CJK char per token."""
+    ascii_chars = sum(ch.isascii() for ch in text)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+class _TranslatorPool:
+    """Runs translator prompts through the calling thread's Agent.
+
+    ``get_translator`` is called with an API key (empty for the configured
+    default) and must return an Agent owned by the calling thread (see
+    :func:`_thread_local_agent`), since an Agent keeps per-run state. A semaphore
+    caps the number of requests in flight across batch workers and their
+    one-by-one fallbacks at ``max_concurrency``. When the provider quota is
+    configured, each request first waits on the shared requests-per-minute
+    and tokens-per-minute buckets.
+
+    With several ``api_keys`` requests rotate over them, and a rate-limited
+    reply is retried at once on the next available key instead of making the
+    caller sleep. Only when every key is limited does the reply go back to
+    the caller's backoff.
+    """
+
+    def __init__(
+        self,
+        get_translator: Callable[[str], Agent],
+        max_concurrency: int = 1,
+        *,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        system_prompt: str = "",
+        json_output: bool = False,
+        api_keys: tuple[str, ...] = (),
+    ) -> None:
+        self._get_translator = get_translator
+        self._key_ring = _shared_key_ring(api_keys) if api_keys else None
+        self.max_concurrency = max(1, max_concurrency)
+        self.json_output = json_output
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._request_limiter = (
+            _shared_rate_limiter("requests", requests_per_minute)
+            if requests_per_minute > 0
+            else None
+        )
+        self._token_limiter = (
+            _shared_rate_limiter("tokens", tokens_per_minute)
+            if tokens_per_minute > 0
+            else None
+        )
+        self._system_prompt_tokens = _estimate_tokens(system_prompt)
+
+    def _acquire_quota(self, prompt: str) -> None:
+        """Wait until the shared quotas allow one more request for ``prompt``."""
+        if self._request_limiter is not None:
+            self._request_limiter.acquire()
+        if self._token_limiter is not None:
+            self._token_limiter.acquire(
+                self._system_prompt_tokens + _estimate_tokens(prompt)
+            )
+
+    def run(self, prompt: str) -> Any:
+        if self._key_ring is None:
+            self._acquire_quota(prompt)
+            with self._slots:
+                return self._get_translator("").run(prompt)
+
+        for attempt in range(1, len(self._key_ring) + 1):
+            # Every failover attempt is a real request against the quota.
+            self._acquire_quota(prompt)
+            key = self._key_ring.acquire()
+            translator = self._get_translator(key)
+            with self._slots:
+                response = translator.run(prompt)
+            retry_after = _rate_limit_retry_after(str(response.content or ""))
+            if retry_after is None or attempt == len(self._key_ring):
+                break
+            self._key_ring.cool_down(key, retry_after)
+            logger.warning(
+                "translator_key_rate_limited",
+                attempt=attempt,
+                key_count=len(self._key_ring),
+                retry_after_seconds=retry_after,
+            )
+        return response
+
+
+class _IncompleteBatchError(TranslationError):
+    """Raised when a batch response is well-formed but skips some lines."""
+
+    def __init__(self, partial: list[str | None], message: str) -> None:
+        self.partial = partial
+        super().__init__(message)
+
+
+@dataclass(slots=True)
 class RetranslateEntry:
     """Subtitle row used by partial re-translation."""
 
@@ -55,7 +356,7 @@ class RetranslateEntry:
     translated: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RetranslateResult:
     """Structured result from partial re-translation."""
 
@@ -68,23 +369,32 @@ def _is_openai_model(model_str: str) -> bool:
     return model_str.strip().lower().startswith(_OPENAI_PREFIX)
 
 
+def _translator_api_keys(settings: Settings) -> tuple[str, ...]:
+    """Return the ``TRANSLATOR_API_KEYS`` pool, in configured order."""
+    keys = (part.strip() for part in settings.translator_api_keys.split(","))
+    return tuple(key for key in keys if key)
+
+
 def _ensure_translator_api_key(settings: Settings) -> None:
     """Validate API key for managed translator providers.
 
-    Skips the OpenAI key check when a proxy base URL is configured,
-    since proxies supply their own authentication.
+    Skips the check when a translator key pool is configured, and the OpenAI
+    key check when a proxy base URL is configured, since proxies supply their
+    own authentication.
 
     Raises:
         ValueError: If required provider key is missing.
     """
     model_str = settings.translator_model
+    if _translator_api_keys(settings):
+        return
     if model_str.strip().lower().startswith(_GROQ_PREFIX):
         get_groq_api_key()
     elif _is_openai_model(model_str) and not settings.openai_base_url:
         get_openai_api_key()
 
 
-def _build_model(settings: Settings) -> str | Model:
+def _build_model(settings: Settings, api_key: str = "") -> str | Model:
     """Build an Agno model instance or model string for the translator.
 
     When the translator model has an ``openai:`` prefix AND a custom
@@ -92,21 +402,61 @@ def _build_model(settings: Settings) -> str | Model:
     pointed at the proxy endpoint.  This allows OpenAI-compatible proxies
     (e.g. CLIProxyAPI) to be used without touching the Agno provider registry.
 
+    An explicit ``api_key`` (one from ``TRANSLATOR_API_KEYS``) builds the
+    Groq or OpenAI model with that key instead of the provider's default.
+
     In all other cases the raw model string is returned and Agno handles
     provider resolution itself (existing behavior).
     """
     model_str = settings.translator_model
-    if _is_openai_model(model_str) and settings.openai_base_url:
+    if _is_openai_model(model_str) and (settings.openai_base_url or api_key):
         # _is_openai_model lowercases; slice original to preserve casing
         model_id = model_str.strip()[len(_OPENAI_PREFIX) :]
         return OpenAIChat(
             id=model_id,
-            base_url=settings.openai_base_url,
-            api_key=settings.openai_api_key or _PROXY_PLACEHOLDER_API_KEY,
+            base_url=settings.openai_base_url or None,
+            api_key=api_key or settings.openai_api_key or _PROXY_PLACEHOLDER_API_KEY,
         )
+    if api_key and model_str.strip().lower().startswith(_GROQ_PREFIX):
+        return Groq(id=model_str.strip()[len(_GROQ_PREFIX) :], api_key=api_key)
     return model_str
 
 
+def _thread_local_agent(
+    settings: Settings, description: str, api_key: str = ""
+) -> Agent:
+    """Return the calling thread's Agent for this model and system prompt.
+
+    Agents keep per-run state, so they are never shared between threads, but
+    each thread reuses its own across batches, jobs and re-translation
+    requests, which keeps the model client and its HTTP connections warm.
+    """
+    agents: OrderedDict[tuple[str, ...], Agent] | None = getattr(
+        _thread_agents, "agents", None
+    )
+    if agents is None:
+        agents = _thread_agents.agents = OrderedDict()
+    key = (
+        settings.translator_model,
+        settings.openai_base_url,
+        settings.openai_api_key,
+        api_key,
+        description,
+    )
+    agent = agents.get(key)
+    if agent is None:
+        agent = Agent(model=_build_model(settings, api_key), description=description)
+        agents[key] = agent
+        # Key rotation touches every key in turn, so the cache must hold an
+        # Agent per key or each rotation would rebuild one.
+        key_count = max(1, len(_translator_api_keys(settings)))
+        if len(agents) > _AGENTS_PER_THREAD_PER_KEY * key_count:
+            agents.popitem(last=False)
+    else:
+        agents.move_to_end(key)
+    return agent
+
+
 def _model_log_metadata(settings: Settings) -> dict[str, str | None]:
     """Return safe model metadata for structured logs."""
     model_str = settings.translator_model.strip()
@@ -131,7 +481,7 @@ def _model_log_metadata(settings: Settings) -> dict[str, str | None]:
 
 def _compact_text(text: str) -> str:
     """Normalize whitespace while preserving readable punctuation."""
-    return re.sub(r"\s+", " ", text).strip()
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
 
 def _truncate_text(text: str, max_chars: int) -> str:
@@ -193,7 +543,7 @@ def _build_translator_description(
 
 def _strip_number_prefix(text: str) -> str:
     """Remove optional leading numbering (e.g. '1. ...') from model output."""
-    return re.sub(r"^\s*\d+\s*[.):\uff0e]\s*", "", text, count=1)
+    return _NUMBER_PREFIX_RE.sub("", text, count=1)
 
 
 def _strip_json_fence(text: str) -> str:
@@ -253,6 +603,20 @@ def _parse_retranslate_response(
     return RetranslateResult(index=index, original=original, translated=translated)
 
 
+def _rate_limit_retry_after(response_text: str) -> float | None:
+    """Return the advertised wait for a rate-limit reply, or None otherwise."""
+    if "rate_limit_exceeded" not in response_text:
+        return None
+
+    # Parse "Please try again in 4m25.248s" or "1m6.095s"
+    match = _RETRY_AFTER_RE.search(response_text)
+    if match:
+        minutes = int(match.group(1) or 0)
+        seconds = float(match.group(2))
+        return minutes * 60 + seconds
+    return 60.0  # Default fallback
+
+
 def _check_rate_limit(response_text: str) -> None:
     """Raise RateLimitError if response contains rate limit error.
 
@@ -262,24 +626,47 @@ def _check_rate_limit(response_text: str) -> None:
     Raises:
         RateLimitError: If rate limit detected, with parsed retry_after seconds
     """
-    if "rate_limit_exceeded" not in response_text:
-        return
-
-    # Parse "Please try again in 4m25.248s" or "1m6.095s"
-    match = re.search(r"try again in (?:(\d+)m)?(\d+(?:\.\d+)?)s", response_text)
-    if match:
-        minutes = int(match.group(1) or 0)
-        seconds = float(match.group(2))
-        retry_after = minutes * 60 + seconds
-    else:
-        retry_after = 60.0  # Default fallback
+    retry_after = _rate_limit_retry_after(response_text)
+    if retry_after is not None:
+        raise RateLimitError(retry_after=retry_after, message=response_text)
+
+
+def _parse_json_translations(
+    response_text: str, expected_count: int
+) -> list[str] | None:
+    """Parse a JSON batch reply, or return None if the reply is not JSON."""
+    # Peek without copying, so numbered replies skip the strip entirely
+    if not _JSON_START_RE.match(response_text):
+        return None
+    cleaned = _strip_json_fence(response_text)
+    if not cleaned.startswith(("{", "[")):
+        return None
+    try:
+        payload = loads(cleaned)
+    except JSONDecodeError:
+        return None
+    items = payload.get("translations") if isinstance(payload, dict) else payload
+    if not isinstance(items, list) or not all(isinstance(i, str) for i in items):
+        return None
 
-    raise RateLimitError(retry_after=retry_after, message=response_text)
+    if len(items) != expected_count:
+        raise TranslationError(
+            f"Expected {expected_count} translations, got {len(items)}"
+        )
+    result = [item.strip() or None for item in items]
+    if None in result:
+        raise _IncompleteBatchError(
+            result, f"Empty translations in JSON reply for {expected_count} lines"
+        )
+    return cast("list[str]", result)
 
 
 def _parse_batch_response(response_text: str, expected_count: int) -> list[str]:
     """Parse numbered batch translation response into a list of translated strings.
 
+    A ``{"translations": [...]}`` JSON reply (or a bare JSON array) is read
+    directly; anything else goes through the numbered-line parser.
+
     Args:
         response_text: Raw response text with numbered lines like "1. translated text"
         expected_count: Expected number of translations
@@ -288,34 +675,40 @@ def _parse_batch_response(response_text: str, expected_count: int) -> list[str]:
         List of translated strings in order
 
     Raises:
-        TranslationError: If parsing fails or count doesn't match
+        TranslationError: If parsing fails or count doesn't match; the
+            ``_IncompleteBatchError`` subclass when only some lines are missing
     """
-    pattern = re.compile(r"^\s*(\d+)\s*[.):\uff0e]\s*(.+)$")
-    translations: dict[int, str] = {}
+    json_result = _parse_json_translations(response_text, expected_count)
+    if json_result is not None:
+        return json_result
 
-    for line in response_text.strip().splitlines():
-        match = pattern.match(line)
-        if match:
-            num = int(match.group(1))
-            text = match.group(2).strip()
-            translations[num] = text
+    result: list[str | None] = [None] * expected_count
+    out_of_range: set[int] = set()
 
-    if len(translations) != expected_count:
-        raise TranslationError(
-            f"Expected {expected_count} translations, got {len(translations)}"
-        )
+    for match in _BATCH_LINE_RE.finditer(response_text):
+        num = int(match.group(1))
+        if 1 <= num <= expected_count:
+            result[num - 1] = match.group(2).strip()
+        else:
+            out_of_range.add(num)
 
-    result = []
-    for i in range(1, expected_count + 1):
-        if i not in translations:
-            raise TranslationError(f"Missing translation for line {i}")
-        result.append(translations[i])
+    missing_count = result.count(None)
+    if missing_count or out_of_range:
+        found_count = expected_count - missing_count + len(out_of_range)
+        if found_count == expected_count:
+            raise TranslationError(
+                f"Missing translation for line {result.index(None) + 1}"
+            )
+        message = f"Expected {expected_count} translations, got {found_count}"
+        if found_count and not out_of_range:
+            raise _IncompleteBatchError(result, message)
+        raise TranslationError(message)
 
-    return result
+    return cast("list[str]", result)
 
 
 def _translate_batch(
-    translator: Agent,
+    pool: _TranslatorPool,
     batch: list[SubtitleEntry],
     source_lang: str,
     target_lang: str,
@@ -325,11 +718,12 @@ def _translate_batch(
     """Translate a batch of subtitle entries in a single API call.
 
     Args:
-        translator: Agno Agent instance
+        pool: Translator pool that runs the prompt
         batch: List of SubtitleEntry to translate
         source_lang: Source language code
         target_lang: Target language code
-        context: Optional list of (original, translated) pairs from previous batch
+        context: Optional list of (original, translated) pairs from previous batch;
+            an empty translation renders the original line alone
         lookahead: Optional list of upcoming SubtitleEntry for forward context
 
     Returns:
@@ -338,29 +732,24 @@ def _translate_batch(
     Raises:
         TranslationError: If batch translation or parsing fails
     """
-    context_section = ""
+    template = (
+        _JSON_BATCH_PROMPT_TEMPLATE if pool.json_output else _BATCH_PROMPT_TEMPLATE
+    )
+    # Collect every line and join once; empty strings become blank lines
+    parts = [template.format(source_lang=source_lang, target_lang=target_lang)]
     if context:
-        context_lines = "\n".join(f"- {orig} → {trans}" for orig, trans in context)
-        context_section = f"【上文參考】\n{context_lines}\n\n"
-
-    numbered_lines = "\n".join(f"{i}. {entry.text}" for i, entry in enumerate(batch, 1))
-
-    lookahead_section = ""
-    if lookahead:
-        lookahead_lines = "\n".join(f"- {entry.text}" for entry in lookahead)
-        lookahead_section = (
-            f"\n\n【下文參考（僅供理解語意，不需翻譯）】\n{lookahead_lines}"  # noqa: RUF001
+        parts.append("【上文參考】")
+        parts.extend(
+            f"- {orig} → {trans}" if trans else f"- {orig}" for orig, trans in context
         )
-
-    prompt = (
-        f"{context_section}"
-        f"將以下編號字幕從{source_lang}翻譯成{target_lang}。\n"
-        f"只回傳編號翻譯，每行一條，編號與原文一致。\n"  # noqa: RUF001
-        "若原文專有名詞疑似語音辨識錯字，請依上文、下文、影片背景與術語表修正後翻譯。"  # noqa: RUF001
-        "例如同一影片已出現的品牌、人名、產品名與網域應保持一致。\n\n"
-        f"{numbered_lines}"
-        f"{lookahead_section}"
-    )
+        parts.append("")
+    parts.append("【待翻譯字幕】")
+    parts.extend(f"{i}. {entry.text}" for i, entry in enumerate(batch, 1))
+    if lookahead:
+        parts.append("")
+        parts.append("【下文參考（僅供理解語意，不需翻譯）】")  # noqa: RUF001
+        parts.extend(f"- {entry.text}" for entry in lookahead)
+    prompt = "\n".join(parts)
 
     logger.debug(
         "translation_batch_request",
@@ -374,7 +763,7 @@ def _translate_batch(
     )
 
     started_at = time.monotonic()
-    response = translator.run(prompt)
+    response = pool.run(prompt)
     duration_ms = round((time.monotonic() - started_at) * 1000)
     response_text = response.content.strip() if response.content else ""
     if not response_text:
@@ -396,16 +785,106 @@ def _translate_batch(
     return _parse_batch_response(response_text, len(batch))
 
 
+def _is_transient_error(exc: Exception) -> bool:
+    """Return True for failures that a plain retry may fix (network, 408, 5xx)."""
+    if isinstance(exc, ConnectionError | TimeoutError):
+        return True
+    status_code = getattr(exc, "status_code", None)
+    return isinstance(status_code, int) and (
+        status_code == _HTTP_REQUEST_TIMEOUT or status_code >= _HTTP_SERVER_ERROR
+    )
+
+
+def _translate_batch_with_backoff(
+    pool: _TranslatorPool,
+    batch: list[SubtitleEntry],
+    source_lang: str,
+    target_lang: str,
+    context: list[tuple[str, str]] | None = None,
+    lookahead: list[SubtitleEntry] | None = None,
+) -> list[str]:
+    """Call :func:`_translate_batch`, retrying transient errors with jitter.
+
+    Parse errors are raised immediately since the same prompt tends to
+    produce the same malformed output; callers fall back instead.
+    """
+    attempt = 0
+    while True:
+        try:
+            return _translate_batch(
+                pool,
+                batch,
+                source_lang,
+                target_lang,
+                context=context,
+                lookahead=lookahead,
+            )
+        except Exception as exc:
+            if attempt >= _TRANSIENT_RETRIES or not _is_transient_error(exc):
+                raise
+            delay = random.uniform(
+                0, min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * 2**attempt)
+            )
+            attempt += 1
+            logger.warning(
+                "translation_batch_transient_error",
+                batch_start_index=batch[0].index,
+                batch_end_index=batch[-1].index,
+                attempt=attempt,
+                max_retries=_TRANSIENT_RETRIES,
+                retry_after_seconds=round(delay, 2),
+                error_type=type(exc).__name__,
+            )
+            time.sleep(delay)
+
+
+def _rate_limit_delay(retry_after: float, attempt: int) -> float:
+    """Return the wait before rate-limit retry ``attempt`` (counting from 0).
+
+    The provider's ``retry_after`` is a floor, since retrying sooner only
+    earns another 429. Repeated limits back off exponentially past a short
+    hint, and up to 50% jitter keeps workers that were limited together from
+    retrying in lockstep.
+    """
+    backoff = min(_RATE_LIMIT_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * 2.0**attempt)
+    return max(retry_after, backoff) * random.uniform(1.0, 1.5)
+
+
+def _wait_after_rate_limit(
+    event: str,
+    exc: RateLimitError,
+    attempt: int,
+    log_fields: Mapping[str, object],
+    *,
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+) -> None:
+    """Log, report and sleep out a rate limit before retry ``attempt + 1``."""
+    delay = _rate_limit_delay(exc.retry_after, attempt)
+    logger.warning(
+        event,
+        **log_fields,
+        attempt=attempt + 1,
+        max_retries=_MAX_RETRIES,
+        retry_after_seconds=round(delay, 2),
+    )
+    if on_rate_limit is not None:
+        on_rate_limit(delay, attempt + 1, _MAX_RETRIES)
+    time.sleep(delay)
+
+
 def _translate_one_by_one(
-    translator: Agent,
+    pool: _TranslatorPool,
     batch: list[SubtitleEntry],
     source_lang: str,
     target_lang: str,
 ) -> list[str]:
     """Translate subtitle entries one at a time as fallback.
 
+    Entries are requested in parallel when the pool allows more than one
+    request in flight; results keep the batch order.
+
     Args:
-        translator: Agno Agent instance
+        pool: Translator pool that runs the prompts
         batch: List of SubtitleEntry to translate
         source_lang: Source language code
         target_lang: Target language code
@@ -416,10 +895,10 @@ def _translate_one_by_one(
     Raises:
         TranslationError: If any individual translation fails
     """
-    results = []
-    for entry in batch:
+
+    def translate_entry(entry: SubtitleEntry) -> str:
         try:
-            response = translator.run(
+            response = pool.run(
                 f"將這段字幕從{source_lang}翻譯成{target_lang}：{entry.text}"  # noqa: RUF001
             )
         except Exception as exc:
@@ -440,8 +919,495 @@ def _translate_one_by_one(
             target_lang=target_lang,
             response_chars=len(translated_text),
         )
-        results.append(translated_text)
-    return results
+        return translated_text
+
+    workers = min(pool.max_concurrency, len(batch))
+    if workers <= 1:
+        return [translate_entry(entry) for entry in batch]
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="translate-entry"
+    ) as executor:
+        return list(executor.map(translate_entry, batch))
+
+
+def _translate_batch_with_retries(
+    pool: _TranslatorPool,
+    batch: list[SubtitleEntry],
+    source_lang: str,
+    target_lang: str,
+    *,
+    context: list[tuple[str, str]] | None,
+    lookahead: list[SubtitleEntry] | None,
+    model_metadata: dict[str, str | None],
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+) -> list[str]:
+    """Translate one batch, retrying on rate limits and falling back on errors.
+
+    Returns:
+        List of translated strings for the batch
+
+    Raises:
+        TranslationError: If the rate limit persists or translation fails
+    """
+    for attempt in range(_MAX_RETRIES + 1):
+        try:
+            # Try batch translation first
+            try:
+                return _translate_batch_with_backoff(
+                    pool,
+                    batch,
+                    source_lang,
+                    target_lang,
+                    context=context,
+                    lookahead=lookahead,
+                )
+            except RateLimitError:
+                raise  # Don't fallback on rate limit
+            except _IncompleteBatchError as exc:
+                return _fill_missing_lines(
+                    pool,
+                    batch,
+                    exc.partial,
+                    source_lang,
+                    target_lang,
+                    model_metadata=model_metadata,
+                    on_rate_limit=on_rate_limit,
+                )
+            except (TranslationError, Exception) as exc:
+                # Fallback to halves, then one-by-one, for non-rate-limit errors
+                split = len(batch) >= _MIN_SPLIT_BATCH_SIZE
+                logger.warning(
+                    "translation_batch_fallback",
+                    **model_metadata,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    batch_start_index=batch[0].index,
+                    batch_end_index=batch[-1].index,
+                    entry_count=len(batch),
+                    error_type=type(exc).__name__,
+                    fallback="split" if split else "one_by_one",
+                )
+                if split:
+                    return _translate_batch_halves(
+                        pool,
+                        batch,
+                        source_lang,
+                        target_lang,
+                        context=context,
+                        lookahead=lookahead,
+                        model_metadata=model_metadata,
+                        on_rate_limit=on_rate_limit,
+                    )
+                logger.debug(
+                    "translation_one_by_one_fallback_started",
+                    batch_start_index=batch[0].index,
+                    batch_end_index=batch[-1].index,
+                )
+                return _translate_one_by_one(pool, batch, source_lang, target_lang)
+
+        except RateLimitError as exc:
+            if attempt < _MAX_RETRIES:
+                _wait_after_rate_limit(
+                    "translation_rate_limited",
+                    exc,
+                    attempt,
+                    {
+                        **model_metadata,
+                        "batch_start_index": batch[0].index,
+                        "batch_end_index": batch[-1].index,
+                    },
+                    on_rate_limit=on_rate_limit,
+                )
+            else:
+                raise TranslationError(
+                    f"Rate limit exceeded after {_MAX_RETRIES} retries "
+                    f"for entries {batch[0].index}-{batch[-1].index}"
+                ) from exc
+    raise TranslationError(
+        f"Failed to translate entries {batch[0].index}-{batch[-1].index}"
+    )
+
+
+def _fill_missing_lines(
+    pool: _TranslatorPool,
+    batch: list[SubtitleEntry],
+    partial: list[str | None],
+    source_lang: str,
+    target_lang: str,
+    *,
+    model_metadata: dict[str, str | None],
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+) -> list[str]:
+    """Re-request only the lines a batch response skipped and splice them in.
+
+    The follow-up goes through the normal batch path, so lines that are still
+    missing afterwards end up in the one-by-one fallback.
+    """
+    missing_positions = [i for i, text in enumerate(partial) if text is None]
+    first_missing = missing_positions[0]
+    context = [
+        (batch[i].text, text)
+        for i in range(max(0, first_missing - _CONTEXT_SIZE), first_missing)
+        if (text := partial[i]) is not None
+    ]
+    logger.warning(
+        "translation_batch_incomplete",
+        **model_metadata,
+        batch_start_index=batch[0].index,
+        batch_end_index=batch[-1].index,
+        entry_count=len(batch),
+        missing_count=len(missing_positions),
+    )
+    filled = iter(
+        _translate_batch_with_retries(
+            pool,
+            [batch[i] for i in missing_positions],
+            source_lang,
+            target_lang,
+            context=context or None,
+            lookahead=None,
+            model_metadata=model_metadata,
+            on_rate_limit=on_rate_limit,
+        )
+    )
+    return [text if text is not None else next(filled) for text in partial]
+
+
+def _translate_batch_halves(
+    pool: _TranslatorPool,
+    batch: list[SubtitleEntry],
+    source_lang: str,
+    target_lang: str,
+    *,
+    context: list[tuple[str, str]] | None,
+    lookahead: list[SubtitleEntry] | None,
+    model_metadata: dict[str, str | None],
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+) -> list[str]:
+    """Translate a batch that failed to parse as two smaller batches.
+
+    The second half is prompted with the first half's translations as
+    context, matching how consecutive batches are chained.
+    """
+    middle = len(batch) // 2
+    head, tail = batch[:middle], batch[middle:]
+    head_texts = _translate_batch_with_retries(
+        pool,
+        head,
+        source_lang,
+        target_lang,
+        context=context,
+        lookahead=tail[:_LOOKAHEAD_SIZE],
+        model_metadata=model_metadata,
+        on_rate_limit=on_rate_limit,
+    )
+    tail_context = [
+        (entry.text, text)
+        for entry, text in zip(
+            head[-_CONTEXT_SIZE:], head_texts[-_CONTEXT_SIZE:], strict=True
+        )
+    ]
+    tail_texts = _translate_batch_with_retries(
+        pool,
+        tail,
+        source_lang,
+        target_lang,
+        context=tail_context,
+        lookahead=lookahead,
+        model_metadata=model_metadata,
+        on_rate_limit=on_rate_limit,
+    )
+    return head_texts + tail_texts
+
+
+def _is_passthrough(text: str) -> bool:
+    """Return True for lines without letters, e.g. "♪ ♪", "...", "1999"."""
+    return not any(ch.isalpha() for ch in text)
+
+
+def _translate_batch_cached(
+    cache: _TranslationCache,
+    pool: _TranslatorPool,
+    batch: list[SubtitleEntry],
+    source_lang: str,
+    target_lang: str,
+    *,
+    context: list[tuple[str, str]] | None,
+    lookahead: list[SubtitleEntry] | None,
+    model_metadata: dict[str, str | None],
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+) -> list[str]:
+    """Translate a batch, sending only lines missing from the cache to the LLM.
+
+    Lines are matched after collapsing whitespace, so identical lines that
+    differ only in spacing or line breaks are sent once and share the
+    translation. Lines with nothing to translate are kept verbatim.
+    """
+    keys = [_compact_text(entry.text) for entry in batch]
+    translated = cache.get_many(keys)
+    pending: dict[str, SubtitleEntry] = {}
+    for key, entry in zip(keys, batch, strict=True):
+        if key in translated:
+            continue
+        if _is_passthrough(entry.text):
+            translated[key] = entry.text
+        else:
+            pending.setdefault(key, entry)
+    if len(pending) < len(batch):
+        logger.debug(
+            "translation_batch_reused_lines",
+            batch_start_index=batch[0].index,
+            batch_end_index=batch[-1].index,
+            resolved_count=sum(key in translated for key in keys),
+            pending_count=len(pending),
+        )
+
+    if pending:
+        fresh = _translate_batch_with_retries(
+            pool,
+            list(pending.values()),
+            source_lang,
+            target_lang,
+            context=context,
+            lookahead=lookahead,
+            model_metadata=model_metadata,
+            on_rate_limit=on_rate_limit,
+        )
+        fresh_pairs = list(zip(pending, fresh, strict=True))
+        cache.put_many(fresh_pairs)
+        translated.update(fresh_pairs)
+    return [translated[key] for key in keys]
+
+
+def _batch_size_for(entries: list[SubtitleEntry], configured: int) -> int:
+    """Return the entries-per-batch cap for a subtitle.
+
+    A positive ``configured`` size is used as is. Zero sizes batches from the
+    average line length, so a file of short dialogue fills each request up to
+    the character budget instead of stopping at ``_BATCH_SIZE`` lines.
+    """
+    if configured > 0:
+        return configured
+    if not entries:
+        return _BATCH_SIZE
+    average_chars = sum(len(entry.text) for entry in entries) / len(entries)
+    # Floor the average so one-word lines do not produce huge prompts
+    fitted = int(_BATCH_CHAR_BUDGET / max(average_chars, 20))
+    return max(_BATCH_SIZE, min(_MAX_ADAPTIVE_BATCH_SIZE, fitted))
+
+
+def _pack_batches(
+    entries: list[SubtitleEntry], batch_size: int = _BATCH_SIZE
+) -> list[tuple[int, int]]:
+    """Group entries into ``(start, end)`` batches bounded by count and length.
+
+    A batch holds at most ``batch_size`` entries and is closed early once its
+    text would exceed ``_BATCH_CHAR_BUDGET``, so long lines produce smaller
+    prompts that are less likely to come back malformed. A single entry over
+    the budget still gets a batch of its own. Lines without letters are kept
+    verbatim rather than sent, so they ride along without using up the count
+    or the budget.
+    """
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    count = 0
+    chars = 0
+    for i, entry in enumerate(entries):
+        if _is_passthrough(entry.text):
+            continue
+        if count and (
+            count >= batch_size or chars + len(entry.text) > _BATCH_CHAR_BUDGET
+        ):
+            bounds.append((start, i))
+            start = i
+            count = 0
+            chars = 0
+        count += 1
+        chars += len(entry.text)
+    if start < len(entries):
+        bounds.append((start, len(entries)))
+    return bounds
+
+
+def _lookahead_for(
+    entries: list[SubtitleEntry], end: int
+) -> list[SubtitleEntry] | None:
+    """Return the upcoming entries used as forward context for a batch."""
+    return entries[end : end + _LOOKAHEAD_SIZE] or None
+
+
+def _log_batch_started(
+    batch: list[SubtitleEntry],
+    batch_number: int,
+    batch_count: int,
+    source_lang: str,
+    target_lang: str,
+    model_metadata: dict[str, str | None],
+) -> None:
+    logger.debug(
+        "translation_batch_started",
+        **model_metadata,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        batch_number=batch_number,
+        batch_count=batch_count,
+        batch_start_index=batch[0].index,
+        batch_end_index=batch[-1].index,
+        entry_count=len(batch),
+    )
+
+
+def _iter_sequential_batches(
+    pool: _TranslatorPool,
+    cache: _TranslationCache,
+    entries: list[SubtitleEntry],
+    batch_bounds: list[tuple[int, int]],
+    source_lang: str,
+    target_lang: str,
+    *,
+    model_metadata: dict[str, str | None],
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+) -> Iterator[list[str]]:
+    """Translate batches in order, quoting earlier translations as context."""
+    # Rolling (original, translated) pairs from the previous batches
+    context: deque[tuple[str, str]] = deque(maxlen=_CONTEXT_SIZE)
+    for batch_number, (start, end) in enumerate(batch_bounds, 1):
+        batch = entries[start:end]
+        _log_batch_started(
+            batch,
+            batch_number,
+            len(batch_bounds),
+            source_lang,
+            target_lang,
+            model_metadata,
+        )
+
+        batch_translations = _translate_batch_cached(
+            cache,
+            pool,
+            batch,
+            source_lang,
+            target_lang,
+            context=list(context) or None,
+            lookahead=_lookahead_for(entries, end),
+            model_metadata=model_metadata,
+            on_rate_limit=on_rate_limit,
+        )
+        context.extend(
+            (entry.text, text)
+            for entry, text in zip(batch, batch_translations, strict=True)
+        )
+        yield batch_translations
+
+
+def _iter_concurrent_batches(
+    pool: _TranslatorPool,
+    cache: _TranslationCache,
+    files: list[list[SubtitleEntry]],
+    batch_bounds: list[list[tuple[int, int]]],
+    source_lang: str,
+    target_lang: str,
+    *,
+    model_metadata: dict[str, str | None],
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+) -> Iterator[tuple[int, list[str]]]:
+    """Translate every file's batches with ``pool.max_concurrency`` in flight.
+
+    All files share one work queue, so a short file does not leave workers
+    idle while a long one is still running. Context and lookahead never cross
+    file boundaries. ``(file_index, batch_translations)`` pairs are yielded
+    in submission order, as soon as every earlier batch is done. Closing the
+    iterator early cancels the batches that have not started yet.
+    """
+    work = [
+        (file_index, start, end)
+        for file_index, bounds in enumerate(batch_bounds)
+        for start, end in bounds
+    ]
+    if not work:
+        return
+
+    def run_batch(
+        batch_number: int, file_index: int, start: int, end: int
+    ) -> list[str]:
+        entries = files[file_index]
+        batch = entries[start:end]
+        _log_batch_started(
+            batch,
+            batch_number,
+            len(work),
+            source_lang,
+            target_lang,
+            model_metadata,
+        )
+        context_start = max(0, start - _CONTEXT_SIZE)
+        return _translate_batch_cached(
+            cache,
+            pool,
+            batch,
+            source_lang,
+            target_lang,
+            context=[(entry.text, "") for entry in entries[context_start:start]]
+            or None,
+            lookahead=_lookahead_for(entries, end),
+            model_metadata=model_metadata,
+            on_rate_limit=on_rate_limit,
+        )
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(pool.max_concurrency, len(work)),
+        thread_name_prefix="translate-batch",
+    )
+    try:
+        futures = [
+            (file_index, executor.submit(run_batch, number, file_index, start, end))
+            for number, (file_index, start, end) in enumerate(work, 1)
+        ]
+        for file_index, future in futures:
+            yield file_index, future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _iter_translated_batches(
+    pool: _TranslatorPool,
+    cache: _TranslationCache,
+    entries: list[SubtitleEntry],
+    batch_bounds: list[tuple[int, int]],
+    source_lang: str,
+    target_lang: str,
+    *,
+    model_metadata: dict[str, str | None],
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+) -> Iterator[list[str]]:
+    """Yield one subtitle's batch translations in order.
+
+    Batches run one after another unless the pool allows concurrency and
+    there is more than one batch to share out.
+    """
+    if pool.max_concurrency > 1 and len(batch_bounds) > 1:
+        for _file_index, batch_translations in _iter_concurrent_batches(
+            pool,
+            cache,
+            [entries],
+            [batch_bounds],
+            source_lang,
+            target_lang,
+            model_metadata=model_metadata,
+            on_rate_limit=on_rate_limit,
+        ):
+            yield batch_translations
+    else:
+        yield from _iter_sequential_batches(
+            pool,
+            cache,
+            entries,
+            batch_bounds,
+            source_lang,
+            target_lang,
+            model_metadata=model_metadata,
+            on_rate_limit=on_rate_limit,
+        )
 
 
 def _repair_cjk_split_boundaries(translated_texts: list[str]) -> list[str]:
@@ -469,11 +1435,11 @@ def _repair_cjk_split_boundaries(translated_texts: list[str]) -> list[str]:
 
         if moved_text:
             new_curr = curr[len(moved_text) :].strip()
-            had_leading_punc = bool(re.match(r"^[，。？！、,.:;!?\s]", new_curr))  # noqa: RUF001
-            new_curr = re.sub(r"^[，。？！、,.:;!?\s]+", "", new_curr)  # noqa: RUF001
+            had_leading_punc = bool(_LEADING_PUNCT_RE.match(new_curr))
+            new_curr = _LEADING_PUNCT_RE.sub("", new_curr)
 
             # Find trailing punctuation in prev
-            m = re.search(r"([，。？！、,.:;!?\s]+)$", prev)  # noqa: RUF001
+            m = _TRAILING_PUNCT_RE.search(prev)
             if m:
                 punc = m.group(1)
                 base_prev = prev[: -len(punc)].strip()
@@ -497,11 +1463,23 @@ def translate_subtitle(
     glossary_text: str = "",
     on_progress: Callable[[int, int], None] | None = None,
     on_rate_limit: Callable[[float, int, int], None] | None = None,
+    max_concurrency: int | None = None,
 ) -> Subtitle:
     """Translate all entries in a subtitle using LLM.
 
-    Uses batch translation (10 entries per API call) for efficiency.
-    Falls back to one-by-one translation if batch parsing fails.
+    Uses batch translation (up to ``TRANSLATOR_BATCH_SIZE`` entries per API
+    call, fewer when lines are long) for efficiency. A batch whose response
+    cannot be parsed is retried as two halves before falling back to
+    one-by-one translation.
+
+    Batches run one after another by default so each prompt can quote the
+    previous batch's translations. With ``max_concurrency`` above 1 up to that
+    many batches are in flight at once; their context then carries the
+    preceding source lines only. The same limit applies to the one-by-one
+    fallback, whose per-entry requests then also run in parallel.
+
+    Lines already translated earlier in the file, or in a previous run when
+    ``translation_cache_path`` is configured, are reused without an API call.
 
     Args:
         subtitle: The subtitle to translate
@@ -513,6 +1491,8 @@ def translate_subtitle(
             (completed_count, total_count) after each batch.
         on_rate_limit: Optional callback when rate limited. Called with
             (retry_after_seconds, attempt, max_retries).
+        max_concurrency: Maximum number of batches translated in parallel.
+            Defaults to the ``TRANSLATOR_MAX_CONCURRENCY`` setting.
 
     Returns:
         New Subtitle object with translated text
@@ -521,150 +1501,357 @@ def translate_subtitle(
         TranslationError: If translation fails
         ValueError: If provider API key is missing
     """
-    settings = get_settings()
-    _ensure_translator_api_key(settings)
-    model_metadata = _model_log_metadata(settings)
-    translator = Agent(
-        model=_build_model(settings),
-        description=_build_translator_description(
-            source_lang=source_lang,
-            target_lang=target_lang,
-            video_title=video_title,
-            video_description=video_description,
-            glossary_text=glossary_text,
-        ),
+    run = _prepare_run(
+        source_lang=source_lang,
+        target_lang=target_lang,
+        video_title=video_title,
+        video_description=video_description,
+        glossary_text=glossary_text,
+        max_concurrency=max_concurrency,
     )
 
     entries = subtitle.entries
-    translated_texts: list[str] = []
+    batch_size = _batch_size_for(entries, run.settings.translator_batch_size)
+    batch_bounds = _pack_batches(entries, batch_size)
     logger.info(
         "translation_started",
-        **model_metadata,
+        **run.model_metadata,
         source_lang=source_lang,
         target_lang=target_lang,
         entry_count=len(entries),
-        batch_size=_BATCH_SIZE,
+        batch_size=batch_size,
+        batch_count=len(batch_bounds),
+        max_concurrency=run.max_concurrency,
     )
     started_at = time.monotonic()
 
-    for i in range(0, len(entries), _BATCH_SIZE):
-        batch = entries[i : i + _BATCH_SIZE]
+    translated_texts: list[str] = []
+    for batch_translations in _iter_translated_batches(
+        run.pool,
+        run.cache,
+        entries,
+        batch_bounds,
+        source_lang,
+        target_lang,
+        model_metadata=run.model_metadata,
+        on_rate_limit=on_rate_limit,
+    ):
+        translated_texts.extend(batch_translations)
+        if on_progress is not None:
+            on_progress(len(translated_texts), len(entries))
+
+    result = _apply_translations(subtitle, translated_texts, target_lang)
 
-        logger.debug(
-            "translation_batch_started",
-            **model_metadata,
-            source_lang=source_lang,
-            target_lang=target_lang,
-            batch_number=i // _BATCH_SIZE + 1,
-            batch_count=(len(entries) + _BATCH_SIZE - 1) // _BATCH_SIZE,
-            batch_start_index=batch[0].index,
-            batch_end_index=batch[-1].index,
-            entry_count=len(batch),
-        )
+    logger.info(
+        "translation_completed",
+        **run.model_metadata,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        entry_count=len(entries),
+        duration_ms=round((time.monotonic() - started_at) * 1000),
+    )
 
-        # Collect context from previously translated entries
-        context_start = max(0, i - _CONTEXT_SIZE)
-        context: list[tuple[str, str]] | None = (
-            [(entries[j].text, translated_texts[j]) for j in range(context_start, i)]
-            if i > 0
-            else None
-        )
+    return result
 
-        # Collect lookahead entries for forward context
-        lookahead_end = min(i + _BATCH_SIZE + _LOOKAHEAD_SIZE, len(entries))
-        lookahead = (
-            entries[i + _BATCH_SIZE : lookahead_end]
-            if i + _BATCH_SIZE < len(entries)
-            else None
-        )
 
-        for attempt in range(_MAX_RETRIES + 1):
-            try:
-                # Try batch translation first
-                try:
-                    batch_translations = _translate_batch(
-                        translator,
-                        batch,
-                        source_lang,
-                        target_lang,
-                        context=context,
-                        lookahead=lookahead,
-                    )
-                except RateLimitError:
-                    raise  # Don't fallback on rate limit
-                except (TranslationError, Exception) as exc:
-                    # Fallback to one-by-one for non-rate-limit errors
-                    logger.warning(
-                        "translation_batch_fallback",
-                        **model_metadata,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        batch_start_index=batch[0].index,
-                        batch_end_index=batch[-1].index,
-                        entry_count=len(batch),
-                        error_type=type(exc).__name__,
-                    )
-                    logger.debug(
-                        "translation_one_by_one_fallback_started",
-                        batch_start_index=batch[0].index,
-                        batch_end_index=batch[-1].index,
-                    )
-                    batch_translations = _translate_one_by_one(
-                        translator, batch, source_lang, target_lang
-                    )
+def translate_subtitles(
+    subtitles: list[Subtitle],
+    *,
+    source_lang: str = "en",
+    target_lang: str = "zh-TW",
+    video_title: str = "",
+    video_description: str = "",
+    glossary_text: str = "",
+    on_progress: Callable[[int, int, int, int], None] | None = None,
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+    max_concurrency: int | None = None,
+) -> list[Subtitle]:
+    """Translate several subtitles that share languages, context and glossary.
 
-                translated_texts.extend(batch_translations)
-                if on_progress is not None:
-                    on_progress(len(translated_texts), len(entries))
-                break  # Success, exit retry loop
+    Equivalent to calling :func:`translate_subtitle` on each file, but the
+    files share one translator pool, rate limit and line cache. With
+    ``max_concurrency`` above 1 the batches of all files are fed to a single
+    worker pool, so small files do not leave workers idle; otherwise the
+    files are translated one after another with full sequential context.
 
-            except RateLimitError as exc:
-                if attempt < _MAX_RETRIES:
-                    logger.warning(
-                        "translation_rate_limited",
-                        **model_metadata,
-                        batch_start_index=batch[0].index,
-                        batch_end_index=batch[-1].index,
-                        attempt=attempt + 1,
-                        max_retries=_MAX_RETRIES,
-                        retry_after_seconds=exc.retry_after,
-                    )
-                    if on_rate_limit is not None:
-                        on_rate_limit(exc.retry_after, attempt + 1, _MAX_RETRIES)
-                    time.sleep(exc.retry_after)
-                else:
-                    raise TranslationError(
-                        f"Rate limit exceeded after {_MAX_RETRIES} retries "
-                        f"for entries {batch[0].index}-{batch[-1].index}"
-                    ) from exc
-        else:
-            raise TranslationError(
-                f"Failed to translate entries {batch[0].index}-{batch[-1].index}"
+    Args:
+        subtitles: The subtitles to translate
+        source_lang: Source language code (default: "en")
+        target_lang: Target language code (default: "zh-TW")
+        video_title: Video title for translation context.
+        video_description: Video description for translation context.
+        glossary_text: Glossary prompt text shared by all files.
+        on_progress: Optional callback for progress updates. Called with
+            (files_done, total_files, entries_done, entries_total) after
+            each batch.
+        on_rate_limit: Optional callback when rate limited. Called with
+            (retry_after_seconds, attempt, max_retries).
+        max_concurrency: Maximum number of batches translated in parallel.
+            Defaults to the ``TRANSLATOR_MAX_CONCURRENCY`` setting.
+
+    Returns:
+        New Subtitle objects with translated text, in input order
+
+    Raises:
+        TranslationError: If translation fails
+        ValueError: If provider API key is missing
+    """
+    run = _prepare_run(
+        source_lang=source_lang,
+        target_lang=target_lang,
+        video_title=video_title,
+        video_description=video_description,
+        glossary_text=glossary_text,
+        max_concurrency=max_concurrency,
+    )
+
+    files = [subtitle.entries for subtitle in subtitles]
+    entries_total = sum(len(entries) for entries in files)
+    done_per_file = [0] * len(files)
+
+    def report(file_index: int, done: int) -> None:
+        done_per_file[file_index] = done
+        if on_progress is not None:
+            files_done = sum(
+                count == len(entries)
+                for count, entries in zip(done_per_file, files, strict=True)
             )
+            on_progress(files_done, len(files), sum(done_per_file), entries_total)
 
-    if target_lang.lower().startswith("zh"):
-        translated_texts = _repair_cjk_split_boundaries(translated_texts)
+    logger.info(
+        "bulk_translation_started",
+        **run.model_metadata,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        file_count=len(files),
+        entry_count=entries_total,
+        max_concurrency=run.max_concurrency,
+    )
+    started_at = time.monotonic()
 
-    translated_entries = [
-        SubtitleEntry(
-            index=entry.index,
-            start=entry.start,
-            end=entry.end,
-            text=text,
-        )
-        for entry, text in zip(entries, translated_texts, strict=True)
+    max_batch_size = run.settings.translator_batch_size
+    batch_bounds = [
+        _pack_batches(entries, _batch_size_for(entries, max_batch_size))
+        for entries in files
+    ]
+    translated: list[list[str]] = [[] for _ in files]
+    if run.max_concurrency > 1:
+        for file_index, batch_translations in _iter_concurrent_batches(
+            run.pool,
+            run.cache,
+            files,
+            batch_bounds,
+            source_lang,
+            target_lang,
+            model_metadata=run.model_metadata,
+            on_rate_limit=on_rate_limit,
+        ):
+            translated[file_index].extend(batch_translations)
+            report(file_index, len(translated[file_index]))
+    else:
+        for file_index, entries in enumerate(files):
+            for batch_translations in _iter_sequential_batches(
+                run.pool,
+                run.cache,
+                entries,
+                batch_bounds[file_index],
+                source_lang,
+                target_lang,
+                model_metadata=run.model_metadata,
+                on_rate_limit=on_rate_limit,
+            ):
+                translated[file_index].extend(batch_translations)
+                report(file_index, len(translated[file_index]))
+
+    results = [
+        _apply_translations(subtitle, texts, target_lang)
+        for subtitle, texts in zip(subtitles, translated, strict=True)
     ]
 
     logger.info(
-        "translation_completed",
-        **model_metadata,
+        "bulk_translation_completed",
+        **run.model_metadata,
         source_lang=source_lang,
         target_lang=target_lang,
-        entry_count=len(entries),
+        file_count=len(files),
+        entry_count=entries_total,
         duration_ms=round((time.monotonic() - started_at) * 1000),
     )
 
-    return Subtitle(entries=translated_entries)
+    return results
+
+
+def iter_translated_entries(
+    subtitle: Subtitle,
+    *,
+    source_lang: str = "en",
+    target_lang: str = "zh-TW",
+    video_title: str = "",
+    video_description: str = "",
+    glossary_text: str = "",
+    on_rate_limit: Callable[[float, int, int], None] | None = None,
+    max_concurrency: int | None = None,
+) -> Iterator[SubtitleEntry]:
+    """Yield translated entries in subtitle order as batches complete.
+
+    Translates like :func:`translate_subtitle`, but hands out each entry as
+    soon as it and everything before it is ready, so callers can write
+    partial results or show them while later batches are still running.
+    For Chinese targets the last entry of a batch is held back until the
+    next batch arrives, because boundary repair may move text into it.
+
+    Closing the iterator early (``break``, ``close()``, or an exception in
+    the consumer) cancels batches that have not started; batches already
+    in flight are allowed to finish.
+
+    Args:
+        subtitle: The subtitle to translate
+        source_lang: Source language code (default: "en")
+        target_lang: Target language code (default: "zh-TW")
+        video_title: Video title for translation context.
+        video_description: Video description for translation context.
+        glossary_text: Glossary prompt text.
+        on_rate_limit: Optional callback when rate limited. Called with
+            (retry_after_seconds, attempt, max_retries).
+        max_concurrency: Maximum number of batches translated in parallel.
+            Defaults to the ``TRANSLATOR_MAX_CONCURRENCY`` setting.
+
+    Yields:
+        Translated copies of the subtitle entries, in order
+
+    Raises:
+        TranslationError: If translation fails
+        ValueError: If provider API key is missing
+    """
+    run = _prepare_run(
+        source_lang=source_lang,
+        target_lang=target_lang,
+        video_title=video_title,
+        video_description=video_description,
+        glossary_text=glossary_text,
+        max_concurrency=max_concurrency,
+    )
+
+    entries = subtitle.entries
+    repair = target_lang.lower().startswith("zh")
+    position = 0
+    held: list[str] = []
+    for batch_translations in _iter_translated_batches(
+        run.pool,
+        run.cache,
+        entries,
+        _pack_batches(
+            entries, _batch_size_for(entries, run.settings.translator_batch_size)
+        ),
+        source_lang,
+        target_lang,
+        model_metadata=run.model_metadata,
+        on_rate_limit=on_rate_limit,
+    ):
+        texts = held + batch_translations
+        if repair:
+            texts = _repair_cjk_split_boundaries(texts)
+            held = texts[-1:]
+            texts = texts[:-1]
+        for text in texts:
+            yield entries[position].with_text(text)
+            position += 1
+    for text in held:
+        yield entries[position].with_text(text)
+
+
+@dataclass(slots=True)
+class _TranslationRun:
+    """Settings, translator pool and line cache shared by one translation call."""
+
+    settings: Settings
+    model_metadata: dict[str, str | None]
+    max_concurrency: int
+    pool: _TranslatorPool
+    cache: _TranslationCache
+
+
+def _build_pool(
+    settings: Settings,
+    *,
+    source_lang: str,
+    target_lang: str,
+    video_title: str,
+    video_description: str,
+    glossary_text: str,
+    max_concurrency: int,
+) -> _TranslatorPool:
+    """Create the translator pool for one call, sharing the process quotas."""
+    description = _build_translator_description(
+        source_lang=source_lang,
+        target_lang=target_lang,
+        video_title=video_title,
+        video_description=video_description,
+        glossary_text=glossary_text,
+    )
+    return _TranslatorPool(
+        partial(_thread_local_agent, settings, description),
+        max_concurrency,
+        requests_per_minute=settings.translator_requests_per_minute,
+        tokens_per_minute=settings.translator_tokens_per_minute,
+        system_prompt=description,
+        json_output=settings.translator_json_output,
+        api_keys=_translator_api_keys(settings),
+    )
+
+
+def _prepare_run(
+    *,
+    source_lang: str,
+    target_lang: str,
+    video_title: str,
+    video_description: str,
+    glossary_text: str,
+    max_concurrency: int | None,
+) -> _TranslationRun:
+    """Load settings and create the translator pool and line cache for a run.
+
+    Raises:
+        ValueError: If provider API key is missing
+    """
+    settings = get_settings()
+    _ensure_translator_api_key(settings)
+    if max_concurrency is None:
+        max_concurrency = settings.translator_max_concurrency
+    pool = _build_pool(
+        settings,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        video_title=video_title,
+        video_description=video_description,
+        glossary_text=glossary_text,
+        max_concurrency=max_concurrency,
+    )
+    cache = _TranslationCache(
+        "\0".join((settings.translator_model, source_lang, target_lang, glossary_text)),
+        settings.translation_cache_path,
+    )
+    return _TranslationRun(
+        settings=settings,
+        model_metadata=_model_log_metadata(settings),
+        max_concurrency=max_concurrency,
+        pool=pool,
+        cache=cache,
+    )
+
+
+def _apply_translations(
+    subtitle: Subtitle, translated_texts: list[str], target_lang: str
+) -> Subtitle:
+    """Return a copy of ``subtitle`` carrying the translated texts."""
+    if target_lang.lower().startswith("zh"):
+        translated_texts = _repair_cjk_split_boundaries(translated_texts)
+    return Subtitle(
+        entries=[
+            entry.with_text(text)
+            for entry, text in zip(subtitle.entries, translated_texts, strict=True)
+        ]
+    )
 
 
 def _build_retranslate_prompt(
@@ -672,11 +1859,13 @@ def _build_retranslate_prompt(
     target_entry: RetranslateEntry,
     prev_entries: list[RetranslateEntry],
     next_entries: list[RetranslateEntry],
-    normalized_user_context: str,
-    source_lang: str,
-    target_lang: str,
+    instructions: str,
 ) -> str:
-    """Build the partial re-translation prompt for one selected entry."""
+    """Build the partial re-translation prompt for one selected entry.
+
+    ``instructions`` is the part shared by every entry of a request (user
+    context and task description), built once by the caller.
+    """
     sections: list[str] = []
     if prev_entries:
         prev_lines = "\n".join(
@@ -692,93 +1881,51 @@ def _build_retranslate_prompt(
         )
         sections.append(f"【下文參考】\n{next_lines}")
 
-    if normalized_user_context:
-        sections.append(f"【使用者補充上下文】\n{normalized_user_context}")
-
-    prompt_sections = "\n\n".join(sections)
-    instruction = (
-        f"請將以下字幕從{source_lang}翻譯成{target_lang}。\n"
-        "只回傳一個 JSON 物件，不要加 Markdown、引號外文字或任何說明。\n"  # noqa: RUF001
-        '格式：{"index": 數字, "original": "修正後原文", '  # noqa: RUF001
-        '"translated": "目標語言翻譯"}。\n'
-        "若原文專有名詞疑似語音辨識錯字，請依上文、下文、影片背景、術語表與使用者補充上下文修正後翻譯。"  # noqa: RUF001
-        "例如同一影片已出現的品牌、人名、產品名與網域應保持一致。\n\n"
+    sections.append(instructions)
+    sections.append(
         f"index: {target_entry.index}\n"
         f"原文: {target_entry.original}\n"
         f"目前翻譯（可修正）: {target_entry.translated or '(空)'}"  # noqa: RUF001
     )
-    return (f"{prompt_sections}\n\n" if prompt_sections else "") + instruction
+    return "\n\n".join(sections)
 
 
-def retranslate_entries(
-    *,
+def _retranslate_selected(
+    pool: _TranslatorPool,
     entries: list[RetranslateEntry],
-    selected_indices: list[int],
-    source_lang: str = "en",
-    target_lang: str = "zh-TW",
-    video_title: str = "",
-    video_description: str = "",
-    glossary_text: str = "",
-    user_context: str | None = None,
-) -> dict[int, RetranslateResult]:
-    """Re-translate selected subtitle entries with local context.
+    ordered_indices: list[int],
+    position_by_index: dict[int, int],
+    *,
+    instructions: str,
+    has_user_context: bool,
+    model_metadata: Mapping[str, object],
+    source_lang: str,
+    target_lang: str,
+) -> list[RetranslateResult]:
+    """Re-translate the selected entries, each with its neighbouring lines.
+
+    Entries are requested in parallel when the pool allows more than one
+    request in flight; results keep the order of ``ordered_indices``.
 
     Args:
-        entries: Full subtitle rows in current editor order.
-        selected_indices: Entry indices that should be re-translated.
-        source_lang: Source language code.
-        target_lang: Target language code.
-        video_title: Video title for translation context.
-        video_description: Video description for translation context.
-        user_context: Optional extra context provided by user.
+        pool: Translator pool that runs the prompts
+        entries: Full subtitle rows in current editor order
+        ordered_indices: Deduplicated entry indices to re-translate
+        position_by_index: Entry index -> position in ``entries``
+        instructions: Re-translation instructions, including user context
+        has_user_context: Whether the instructions carry user context
+        model_metadata: Model fields attached to every log event
+        source_lang: Source language code
+        target_lang: Target language code
 
     Returns:
-        Mapping: entry index -> structured result containing corrected source and
-            translated text.
+        One result per index in ``ordered_indices``
 
     Raises:
-        ValueError: If request payload is invalid.
-        ValueError: If provider API key is missing.
-        TranslationError: If translation fails after retries.
+        TranslationError: If an entry fails after retries
     """
-    if not entries:
-        raise ValueError("entries cannot be empty")
-    if not selected_indices:
-        raise ValueError("selected_indices cannot be empty")
 
-    ordered_indices = list(dict.fromkeys(selected_indices))
-    position_by_index = {entry.index: i for i, entry in enumerate(entries)}
-    missing = [idx for idx in ordered_indices if idx not in position_by_index]
-    if missing:
-        raise ValueError(f"selected_indices not found: {missing}")
-
-    settings = get_settings()
-    _ensure_translator_api_key(settings)
-    model_metadata = _model_log_metadata(settings)
-    translator = Agent(
-        model=_build_model(settings),
-        description=_build_translator_description(
-            source_lang=source_lang,
-            target_lang=target_lang,
-            video_title=video_title,
-            video_description=video_description,
-            glossary_text=glossary_text,
-        ),
-    )
-
-    normalized_user_context = _compact_text(user_context or "")
-    results: dict[int, RetranslateResult] = {}
-    logger.info(
-        "retranslation_started",
-        **model_metadata,
-        source_lang=source_lang,
-        target_lang=target_lang,
-        entry_count=len(entries),
-        selected_indices_count=len(ordered_indices),
-    )
-    retranslation_started_at = time.monotonic()
-
-    for target_index in ordered_indices:
+    def retranslate_one(target_index: int) -> RetranslateResult:
         entry_started_at = time.monotonic()
         position = position_by_index[target_index]
         target_entry = entries[position]
@@ -788,9 +1935,7 @@ def retranslate_entries(
             target_entry=target_entry,
             prev_entries=prev_entries,
             next_entries=next_entries,
-            normalized_user_context=normalized_user_context,
-            source_lang=source_lang,
-            target_lang=target_lang,
+            instructions=instructions,
         )
 
         logger.debug(
@@ -801,19 +1946,19 @@ def retranslate_entries(
             index=target_index,
             previous_context_count=len(prev_entries),
             next_context_count=len(next_entries),
-            has_user_context=bool(normalized_user_context),
+            has_user_context=has_user_context,
         )
 
         for attempt in range(_MAX_RETRIES + 1):
             try:
-                response = translator.run(prompt)
+                response = pool.run(prompt)
                 response_text = response.content.strip() if response.content else ""
                 if not response_text:
                     raise TranslationError(
                         f"Empty re-translation response for entry {target_index}"
                     )
                 _check_rate_limit(response_text)
-                results[target_index] = _parse_retranslate_response(
+                result = _parse_retranslate_response(
                     response_text,
                     expected_index=target_index,
                 )
@@ -826,25 +1971,125 @@ def retranslate_entries(
                     duration_ms=round((time.monotonic() - entry_started_at) * 1000),
                     response_chars=len(response_text),
                 )
-                break
+                return result
             except RateLimitError as exc:
                 if attempt < _MAX_RETRIES:
-                    logger.warning(
+                    _wait_after_rate_limit(
                         "retranslation_rate_limited",
-                        **model_metadata,
-                        index=target_index,
-                        attempt=attempt + 1,
-                        max_retries=_MAX_RETRIES,
-                        retry_after_seconds=exc.retry_after,
+                        exc,
+                        attempt,
+                        {**model_metadata, "index": target_index},
                     )
-                    time.sleep(exc.retry_after)
                 else:
                     raise TranslationError(
                         f"Rate limit exceeded after {_MAX_RETRIES} retries "
                         f"for entry {target_index}"
                     ) from exc
-        else:
-            raise TranslationError(f"Failed to re-translate entry {target_index}")
+        raise TranslationError(f"Failed to re-translate entry {target_index}")
+
+    workers = min(pool.max_concurrency, len(ordered_indices))
+    if workers <= 1:
+        return [retranslate_one(index) for index in ordered_indices]
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="retranslate-entry"
+    ) as executor:
+        return list(executor.map(retranslate_one, ordered_indices))
+
+
+def retranslate_entries(
+    *,
+    entries: list[RetranslateEntry],
+    selected_indices: list[int],
+    source_lang: str = "en",
+    target_lang: str = "zh-TW",
+    video_title: str = "",
+    video_description: str = "",
+    glossary_text: str = "",
+    user_context: str | None = None,
+    max_concurrency: int | None = None,
+) -> dict[int, RetranslateResult]:
+    """Re-translate selected subtitle entries with local context.
+
+    Each selected entry is an independent request, so up to
+    ``max_concurrency`` entries are re-translated in parallel. The shared
+    request and token quotas still apply to every request.
+
+    Args:
+        entries: Full subtitle rows in current editor order.
+        selected_indices: Entry indices that should be re-translated.
+        source_lang: Source language code.
+        target_lang: Target language code.
+        video_title: Video title for translation context.
+        video_description: Video description for translation context.
+        user_context: Optional extra context provided by user.
+        max_concurrency: Maximum number of entries re-translated in parallel.
+            Defaults to the ``TRANSLATOR_RETRANSLATE_CONCURRENCY`` setting.
+
+    Returns:
+        Mapping: entry index -> structured result containing corrected source and
+            translated text.
+
+    Raises:
+        ValueError: If request payload is invalid.
+        ValueError: If provider API key is missing.
+        TranslationError: If translation fails after retries.
+    """
+    if not entries:
+        raise ValueError("entries cannot be empty")
+    if not selected_indices:
+        raise ValueError("selected_indices cannot be empty")
+
+    ordered_indices = list(dict.fromkeys(selected_indices))
+    position_by_index = {entry.index: i for i, entry in enumerate(entries)}
+    missing = [idx for idx in ordered_indices if idx not in position_by_index]
+    if missing:
+        raise ValueError(f"selected_indices not found: {missing}")
+
+    settings = get_settings()
+    _ensure_translator_api_key(settings)
+    model_metadata = _model_log_metadata(settings)
+    if max_concurrency is None:
+        max_concurrency = settings.translator_retranslate_concurrency
+    pool = _build_pool(
+        settings,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        video_title=video_title,
+        video_description=video_description,
+        glossary_text=glossary_text,
+        max_concurrency=max_concurrency,
+    )
+
+    normalized_user_context = _compact_text(user_context or "")
+    instructions = _RETRANSLATE_PROMPT_TEMPLATE.format(
+        source_lang=source_lang, target_lang=target_lang
+    )
+    if normalized_user_context:
+        instructions = (
+            f"【使用者補充上下文】\n{normalized_user_context}\n\n{instructions}"
+        )
+    logger.info(
+        "retranslation_started",
+        **model_metadata,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        entry_count=len(entries),
+        selected_indices_count=len(ordered_indices),
+    )
+    retranslation_started_at = time.monotonic()
+
+    translated = _retranslate_selected(
+        pool,
+        entries,
+        ordered_indices,
+        position_by_index,
+        instructions=instructions,
+        has_user_context=bool(normalized_user_context),
+        model_metadata=model_metadata,
+        source_lang=source_lang,
+        target_lang=target_lang,
+    )
+    results = dict(zip(ordered_indices, translated, strict=True))
 
     logger.info(
         "retranslation_completed",
@@ -1,11 +1,17 @@
 """Subtitle format handlers."""
 
 from bilingualsub.formats.ass import serialize_bilingual_ass
-from bilingualsub.formats.srt import SRTParseError, parse_srt, serialize_srt
+from bilingualsub.formats.srt import (
+    SRTParseError,
+    parse_srt,
+    serialize_srt,
+    write_bilingual_srt,
+)
 
 __all__ = [
     "SRTParseError",
     "parse_srt",
     "serialize_bilingual_ass",
     "serialize_srt",
+    "write_bilingual_srt",
 ]
@@ -1,10 +1,17 @@
 """SRT format parser and serializer."""
 
 import re
+from collections.abc import Sequence
 from datetime import timedelta
+from pathlib import Path
 
 from bilingualsub.core.subtitle import Subtitle, SubtitleEntry
 
+_BLOCK_SEPARATOR_RE = re.compile(r"\n\n+")
+_TIMING_RE = re.compile(
+    r"(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})"
+)
+
 
 class SRTParseError(Exception):
     """Exception raised when SRT parsing fails."""
@@ -26,7 +33,7 @@ def parse_srt(content: str) -> Subtitle:
         raise SRTParseError("Content cannot be empty")
 
     # Split into blocks by double newlines
-    blocks = re.split(r"\n\n+", content.strip())
+    blocks = _BLOCK_SEPARATOR_RE.split(content.strip())
 
     entries = []
     for block_num, block in enumerate(blocks, start=1):
@@ -49,10 +56,7 @@ def parse_srt(content: str) -> Subtitle:
 
         # Parse timing line
         timing_line = lines[1].strip()
-        timing_match = re.match(
-            r"(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})",
-            timing_line,
-        )
+        timing_match = _TIMING_RE.match(timing_line)
 
         if not timing_match:
             raise SRTParseError(
@@ -92,6 +96,22 @@ def parse_srt(content: str) -> Subtitle:
         raise SRTParseError(f"Invalid subtitle structure: {e}") from e
 
 
+def _format_timestamp(value: timedelta) -> str:
+    """Format a timedelta as an SRT timestamp (HH:MM:SS,mmm)."""
+    # Use total_seconds() to handle durations > 24 hours
+    total_seconds = int(value.total_seconds())
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+    millis = value.microseconds // 1000
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
+
+
+def _format_block(index: int, start: timedelta, end: timedelta, text: str) -> str:
+    """Format a single SRT block (without the trailing blank line)."""
+    return f"{index}\n{_format_timestamp(start)} --> {_format_timestamp(end)}\n{text}"
+
+
 def serialize_srt(subtitle: Subtitle) -> str:
     """Serialize Subtitle object to SRT format string.
 
@@ -101,28 +121,46 @@ def serialize_srt(subtitle: Subtitle) -> str:
     Returns:
         SRT format string
     """
-    blocks = []
-
-    for entry in subtitle.entries:
-        # Format timing - use total_seconds() to handle durations > 24 hours
-        total_start_seconds = int(entry.start.total_seconds())
-        start_hours = total_start_seconds // 3600
-        start_minutes = (total_start_seconds % 3600) // 60
-        start_seconds = total_start_seconds % 60
-        start_millis = entry.start.microseconds // 1000
-
-        total_end_seconds = int(entry.end.total_seconds())
-        end_hours = total_end_seconds // 3600
-        end_minutes = (total_end_seconds % 3600) // 60
-        end_seconds = total_end_seconds % 60
-        end_millis = entry.end.microseconds // 1000
-
-        start_str = f"{start_hours:02d}:{start_minutes:02d}:{start_seconds:02d}"
-        end_str = f"{end_hours:02d}:{end_minutes:02d}:{end_seconds:02d}"
-        timing = f"{start_str},{start_millis:03d} --> {end_str},{end_millis:03d}"
-
-        # Build block
-        block = f"{entry.index}\n{timing}\n{entry.text}"
-        blocks.append(block)
-
+    blocks = [
+        _format_block(entry.index, entry.start, entry.end, entry.text)
+        for entry in subtitle.entries
+    ]
     return "\n\n".join(blocks) + "\n"
+
+
+def write_bilingual_srt(
+    original: Sequence[SubtitleEntry],
+    translated: Sequence[SubtitleEntry],
+    path: Path,
+) -> None:
+    """Merge and serialize bilingual subtitles straight to an SRT file.
+
+    Produces the same output as ``serialize_srt`` on the result of
+    ``merge_subtitles``, but in a single pass without materializing the merged
+    entries or the full document string.
+
+    Args:
+        original: Original subtitle entries (source of timing)
+        translated: Translated subtitle entries
+        path: Destination SRT file
+
+    Raises:
+        ValueError: If entry counts don't match
+    """
+    if len(original) != len(translated):
+        raise ValueError(
+            f"Entry count mismatch: original has {len(original)} entries, "
+            f"translated has {len(translated)} entries"
+        )
+
+    with path.open("w", encoding="utf-8") as f:
+        separator = ""
+        for orig, trans in zip(original, translated, strict=True):
+            f.write(separator)
+            f.write(
+                _format_block(
+                    orig.index, orig.start, orig.end, f"{trans.text}\n{orig.text}"
+                )
+            )
+            separator = "\n\n"
+        f.write("\n")
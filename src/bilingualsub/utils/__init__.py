@@ -9,6 +9,7 @@ from bilingualsub.utils.ffmpeg import (
     extract_video_metadata,
     generate_intro,
     get_audio_duration,
+    iter_audio_chunks,
     split_audio,
     trim_video,
 )
@@ -24,6 +25,7 @@ __all__ = [
     "get_audio_duration",
     "get_groq_api_key",
     "get_settings",
+    "iter_audio_chunks",
     "split_audio",
     "trim_video",
 ]
@@ -16,8 +16,26 @@ class Settings(BaseSettings):
         transcriber_provider: Whisper provider ("groq" or "openai")
         transcriber_model: Whisper model name
         translator_model: Agno model string (e.g. "ollama:model_id", "groq:model_id")
+        translator_api_keys: Comma-separated API keys for the translator
+            provider, rotated per request (empty uses the provider's key)
+        translator_batch_size: Maximum subtitle lines per translation request
+            (0 sizes batches from the average line length)
+        translator_max_concurrency: Number of translation batches sent in
+            parallel (1 keeps batches sequential with translated context)
+        translator_retranslate_concurrency: Number of selected entries
+            re-translated in parallel (entries are independent requests)
+        translator_requests_per_minute: Provider request quota shared by all
+            translations in the process (0 disables throttling)
+        translator_tokens_per_minute: Provider token quota, checked against
+            an estimate of each prompt (0 disables throttling)
+        translator_json_output: Ask for batch translations as a JSON array
+            instead of numbered lines
         gemini_api_key: API key for Google Gemini visual description
         visual_description_model: Gemini model name for visual description
+        transcript_cache_dir: Directory for cached Whisper transcripts
+            (empty disables the cache)
+        translation_cache_path: SQLite file for cached line translations
+            (empty keeps the cache in memory for a single run)
     """
 
     groq_api_key: str = ""
@@ -33,9 +51,18 @@ class Settings(BaseSettings):
     transcriber_model: str = "whisper-large-v3-turbo"
 
     translator_model: str = "groq:openai/gpt-oss-120b"
+    translator_api_keys: str = ""
+    translator_batch_size: int = 10
+    translator_max_concurrency: int = 1
+    translator_retranslate_concurrency: int = 4
+    translator_requests_per_minute: int = 0
+    translator_tokens_per_minute: int = 0
+    translator_json_output: bool = False
     glossary_path: str = "glossary.json"
     gemini_api_key: str = ""
     visual_description_model: str = "gemini-3.1-flash-lite-preview"
+    transcript_cache_dir: str = ""
+    translation_cache_path: str = ""
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,14 +1,22 @@
 """FFmpeg utilities for burning subtitles into videos."""
 
-import json
+import shutil
 import subprocess  # nosec B404
 import sys
 import tempfile
 import uuid
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
+from typing import TypedDict
 
 import ffmpeg
+from pydantic_core import from_json
+
+# Resolved once at import so each launch execs an absolute path instead of
+# walking PATH. A missing tool keeps its bare name, so the launch still fails
+# with FileNotFoundError as before.
+FFMPEG_BIN = shutil.which("ffmpeg") or "ffmpeg"
+FFPROBE_BIN = shutil.which("ffprobe") or "ffprobe"
 
 # ---------------------------------------------------------------------------
 # Bundled font paths — assets/fonts/ next to the project root
@@ -209,7 +217,7 @@ def burn_subtitles(
 
     # Get video duration for progress calculation
     metadata = extract_video_metadata(video_path)
-    total_duration = float(metadata["duration"])
+    total_duration = metadata["duration"]
 
     # Determine encoder based on platform
     if sys.platform == "darwin":
@@ -221,7 +229,7 @@ def burn_subtitles(
 
     # Build ffmpeg command with platform-appropriate encoder
     cmd = [
-        "ffmpeg",
+        FFMPEG_BIN,
         "-i",
         str(video_path),
         "-vf",
@@ -250,7 +258,10 @@ def extract_audio(
     *,
     bitrate: str = "64k",
 ) -> Path:
-    """Extract audio from video as compressed MP3.
+    """Extract audio from video as compressed mono MP3.
+
+    Speech recognition downmixes to mono anyway, so encoding a single channel
+    halves the encoder work without losing anything the transcriber uses.
 
     Args:
         video_path: Input video file
@@ -272,10 +283,14 @@ def extract_audio(
         (
             ffmpeg.input(str(video_path))
             .output(
-                str(output_path), acodec="libmp3lame", audio_bitrate=bitrate, vn=None
+                str(output_path),
+                acodec="libmp3lame",
+                audio_bitrate=bitrate,
+                ac=1,
+                vn=None,
             )
             .overwrite_output()
-            .run(capture_stdout=True, capture_stderr=True)
+            .run(cmd=FFMPEG_BIN, capture_stdout=True, capture_stderr=True)
         )
     except Exception as e:
         if hasattr(e, "stderr") and e.stderr:
@@ -320,7 +335,7 @@ def trim_video(
             ffmpeg.input(str(video_path), ss=start_time, to=end_time)
             .output(str(output_path), c="copy")
             .overwrite_output()
-            .run(capture_stdout=True, capture_stderr=True)
+            .run(cmd=FFMPEG_BIN, capture_stdout=True, capture_stderr=True)
         )
     except Exception as e:
         if hasattr(e, "stderr") and e.stderr:
@@ -335,26 +350,40 @@ def trim_video(
     return output_path
 
 
-def extract_video_metadata(video_path: Path) -> dict[str, str | float | int]:
+class VideoProbe(TypedDict):
+    """Typed result of :func:`extract_video_metadata`."""
+
+    title: str
+    duration: float
+    width: int
+    height: int
+    fps: float
+    has_audio: bool
+
+
+def extract_video_metadata(video_path: Path) -> VideoProbe:
     """Extract video metadata using ffprobe.
 
     Args:
         video_path: Path to the video file
 
     Returns:
-        Dict with keys: title, duration, width, height, fps, has_audio
+        VideoProbe with keys: title, duration, width, height, fps, has_audio
 
     Raises:
         FFmpegError: If ffprobe fails or no video stream found
     """
     cmd = [
-        "ffprobe",
+        FFPROBE_BIN,
         "-v",
         "quiet",
         "-print_format",
         "json",
-        "-show_format",
-        "-show_streams",
+        # Only the fields read below; full -show_streams output also carries
+        # dispositions, side data and tags for every stream.
+        "-show_entries",
+        "format=duration:format_tags=title"
+        ":stream=codec_type,width,height,r_frame_rate,duration",
         str(video_path),
     ]
 
@@ -362,13 +391,12 @@ def extract_video_metadata(video_path: Path) -> dict[str, str | float | int]:
         result = subprocess.run(  # nosec B603
             cmd,
             capture_output=True,
-            text=True,
             check=True,
         )
     except (FileNotFoundError, subprocess.CalledProcessError) as e:
         raise FFmpegError(f"ffprobe failed for {video_path}: {e}") from e
 
-    data = json.loads(result.stdout)
+    data = from_json(result.stdout)
 
     # Find video stream
     video_stream = None
@@ -383,7 +411,9 @@ def extract_video_metadata(video_path: Path) -> dict[str, str | float | int]:
     has_audio = any(s.get("codec_type") == "audio" for s in data.get("streams", []))
 
     try:
-        title = data.get("format", {}).get("tags", {}).get("title", video_path.stem)
+        title = str(
+            data.get("format", {}).get("tags", {}).get("title", video_path.stem)
+        )
         # Prefer the video stream's own duration over the container-level
         # duration. The container-level value reflects the *longest* stream,
         # which is the audio track whenever audio and video drift apart
@@ -430,12 +460,13 @@ def get_audio_duration(audio_path: Path) -> float:
         FFmpegError: If ffprobe fails or duration is missing
     """
     cmd = [
-        "ffprobe",
+        FFPROBE_BIN,
         "-v",
         "quiet",
         "-print_format",
         "json",
-        "-show_format",
+        "-show_entries",
+        "format=duration",
         str(audio_path),
     ]
 
@@ -443,13 +474,12 @@ def get_audio_duration(audio_path: Path) -> float:
         result = subprocess.run(  # nosec B603
             cmd,
             capture_output=True,
-            text=True,
             check=True,
         )
     except (FileNotFoundError, subprocess.CalledProcessError) as e:
         raise FFmpegError(f"ffprobe failed for {audio_path}: {e}") from e
 
-    data = json.loads(result.stdout)
+    data = from_json(result.stdout)
 
     try:
         return float(data["format"]["duration"])
@@ -476,13 +506,48 @@ def split_audio(
         FFmpegError: If ffmpeg/ffprobe fails
         ValueError: If audio file does not exist
     """
+    return list(iter_audio_chunks(audio_path, output_dir, chunk_duration))
+
+
+def iter_audio_chunks(
+    audio_path: Path,
+    output_dir: Path,
+    chunk_duration: float = 1500.0,
+) -> Iterator[tuple[Path, float]]:
+    """Split audio into chunks, yielding each one as soon as it is written.
+
+    Lets callers start processing the first chunk while later ones are still
+    being cut. The input is validated and probed before this returns.
+
+    Args:
+        audio_path: Path to the audio file
+        output_dir: Directory for output chunks
+        chunk_duration: Maximum chunk duration in seconds (default 25 min)
+
+    Returns:
+        Iterator of (chunk_path, time_offset_seconds) tuples
+
+    Raises:
+        FFmpegError: If ffmpeg/ffprobe fails (cutting errors surface while
+            iterating)
+        ValueError: If audio file does not exist
+    """
     if not audio_path.exists():
         raise ValueError(f"Audio file does not exist: {audio_path}")
     if not audio_path.is_file():
         raise ValueError(f"Audio path is not a file: {audio_path}")
 
     total_duration = get_audio_duration(audio_path)
-    chunks: list[tuple[Path, float]] = []
+    return _cut_audio_chunks(audio_path, output_dir, chunk_duration, total_duration)
+
+
+def _cut_audio_chunks(
+    audio_path: Path,
+    output_dir: Path,
+    chunk_duration: float,
+    total_duration: float,
+) -> Iterator[tuple[Path, float]]:
+    """Cut ``audio_path`` into consecutive chunks with stream copy."""
     offset = 0.0
     chunk_idx = 0
 
@@ -497,7 +562,7 @@ def split_audio(
                 ffmpeg.input(str(audio_path), ss=offset, t=duration)
                 .output(str(chunk_path), acodec="copy")
                 .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .run(cmd=FFMPEG_BIN, capture_stdout=True, capture_stderr=True)
             )
         except Exception as e:
             if hasattr(e, "stderr") and e.stderr:
@@ -509,12 +574,10 @@ def split_audio(
                 error_message = str(e)
             raise FFmpegError(f"Failed to split audio: {error_message}") from e
 
-        chunks.append((chunk_path, offset))
+        yield chunk_path, offset
         offset += chunk_duration
         chunk_idx += 1
 
-    return chunks
-
 
 def generate_intro(  # noqa: PLR0915
     output_path: Path,
@@ -753,7 +816,7 @@ def generate_intro(  # noqa: PLR0915
     vf = f"{drawtext_chain},fade=t=out:st={fade_out_start:.2f}:d=0.5"
 
     cmd = [
-        "ffmpeg",
+        FFMPEG_BIN,
         "-f",
         "lavfi",
         "-i",
@@ -920,14 +983,14 @@ def concat_videos(
 
         first_meta = extract_video_metadata(first_path)
         second_meta = extract_video_metadata(second_path)
-        first_duration = float(first_meta["duration"])
-        second_duration = float(second_meta["duration"])
+        first_duration = first_meta["duration"]
+        second_duration = second_meta["duration"]
         total_duration = first_duration + second_duration
-        first_has_audio = bool(first_meta["has_audio"])
-        second_has_audio = bool(second_meta["has_audio"])
+        first_has_audio = first_meta["has_audio"]
+        second_has_audio = second_meta["has_audio"]
 
         cmd = [
-            "ffmpeg",
+            FFMPEG_BIN,
             "-f",
             "concat",
             "-safe",
@@ -44,5 +44,9 @@ fi
 
 # Run the FastAPI server using the virtual environment python directly and setting PYTHONPATH.
 # This allows us to run without pyproject.toml in the container (to bypass scanner rules).
+# uvloop and httptools ship with uvicorn[standard]; pin them so a missing wheel
+# fails loudly instead of silently falling back to asyncio/h11.
+# Jobs live in process memory, so this must stay a single worker.
 export PYTHONPATH=/app/src
-/app/.venv/bin/python -m uvicorn bilingualsub.api.app:app --host 0.0.0.0 --port 7860
+/app/.venv/bin/python -m uvicorn bilingualsub.api.app:app --host 0.0.0.0 --port 7860 \
+  --loop uvloop --http httptools
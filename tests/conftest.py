@@ -1,11 +1,26 @@
 """Pytest configuration and shared fixtures."""
 
+import sys
 from collections.abc import Generator
 from pathlib import Path
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def reset_translator_agents() -> Generator[None, None, None]:
+    """Drop per-thread translator Agents so tests that patch Agent see new ones."""
+
+    def clear() -> None:
+        translator = sys.modules.get("bilingualsub.core.translator")
+        if translator is not None:
+            vars(translator._thread_agents).clear()
+
+    clear()
+    yield
+    clear()
+
+
 @pytest.fixture
 def fixtures_dir() -> Path:
     """Return the path to the test fixtures directory."""
@@ -100,7 +100,7 @@ def completed_job_factory(tmp_path: Path) -> Generator[Any, None, None]:
             ):
                 p = job_tmp / f"{ft.value}.bin"
                 p.write_bytes(b"x")
-                job.output_files[ft] = p
+                job.set_output_file(ft, p)
 
             return _client, job.id
 
@@ -159,8 +159,8 @@ class TestVisualDescriptionPipeline:
 
             job.status = JobStatus.DOWNLOAD_COMPLETE
             job.video_duration = 60.0
-            job.output_files[FileType.SOURCE_VIDEO] = video_path
-            job.output_files[FileType.AUDIO] = audio_path
+            job.set_output_file(FileType.SOURCE_VIDEO, video_path)
+            job.set_output_file(FileType.AUDIO, audio_path)
 
             # Step 3 + 4: mock pipeline functions, then trigger subtitle step
             with (
@@ -247,7 +247,7 @@ class TestVisualDescriptionPipeline:
 
             job.status = JobStatus.DOWNLOAD_COMPLETE
             job.video_duration = 5401.0
-            job.output_files[FileType.SOURCE_VIDEO] = video_path
+            job.set_output_file(FileType.SOURCE_VIDEO, video_path)
 
             # Step 3: trigger subtitle step
             subtitle_resp = client.post(
@@ -318,8 +318,8 @@ class TestVisualDescriptionPipeline:
 
             job.status = JobStatus.DOWNLOAD_COMPLETE
             job.video_duration = 60.0
-            job.output_files[FileType.SOURCE_VIDEO] = video_path
-            job.output_files[FileType.AUDIO] = audio_path
+            job.set_output_file(FileType.SOURCE_VIDEO, video_path)
+            job.set_output_file(FileType.AUDIO, audio_path)
 
             # Step 4: trigger subtitle step (no mock — real describe_video will
             # raise ValueError because GEMINI_API_KEY is absent)
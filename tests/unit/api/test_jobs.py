@@ -1,11 +1,30 @@
 """Tests for job manager."""
 
+import asyncio
 import time
+from unittest.mock import patch
 
 import pytest
 
-from bilingualsub.api.constants import JOB_TTL_SECONDS, JobStatus
-from bilingualsub.api.jobs import Job, JobManager
+from bilingualsub.api.constants import JOB_TTL_SECONDS, FileType, JobStatus, SSEEvent
+from bilingualsub.api.errors import JobStoreFullError
+from bilingualsub.api.jobs import (
+    EventQueue,
+    Job,
+    JobManager,
+    _removal_tasks,
+)
+
+
+def _progress(step: str, progress: float, **extra: object) -> dict[str, object]:
+    return {
+        "event": SSEEvent.PROGRESS,
+        "data": {"current_step": step, "progress": progress, **extra},
+    }
+
+
+async def _wait(event: asyncio.Event) -> None:
+    await event.wait()
 
 
 @pytest.mark.unit
@@ -66,3 +85,216 @@ class TestJobManager:
         removed = manager.cleanup_expired()
         assert removed == 0
         assert manager.get_job(job.id) is not None
+
+    def test_cleanup_removes_expired_idle_jobs_in_any_status(self) -> None:
+        manager = JobManager()
+        jobs = [
+            manager.create_job("https://youtube.com/watch?v=test", "en", "zh-TW")
+            for _ in range(3)
+        ]
+        for job, status in zip(
+            jobs,
+            (JobStatus.DOWNLOAD_COMPLETE, JobStatus.PENDING, JobStatus.COMPLETED),
+            strict=True,
+        ):
+            job.status = status
+            job.created_at = time.monotonic() - JOB_TTL_SECONDS - 1
+
+        assert manager.cleanup_expired() == 3
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_expired_jobs_with_running_task(self) -> None:
+        manager = JobManager()
+        job = manager.create_job("https://youtube.com/watch?v=test", "en", "zh-TW")
+        release = asyncio.Event()
+        job.task = asyncio.create_task(_wait(release))
+        job.created_at = time.monotonic() - JOB_TTL_SECONDS - 1
+
+        assert manager.cleanup_expired() == 0
+        assert manager.get_job(job.id) is job
+
+        release.set()
+        await job.task
+        assert manager.cleanup_expired() == 1
+        assert manager.get_job(job.id) is None
+
+
+@pytest.mark.unit
+class TestEventQueue:
+    def test_coalesces_progress_for_same_step(self) -> None:
+        queue = EventQueue()
+        queue.publish(_progress("translate", 50.0, subtitle_source="whisper"))
+        queue.publish(_progress("translate", 55.0))
+
+        assert queue.qsize() == 1
+        event = queue.get_nowait()
+        assert event["data"] == {
+            "current_step": "translate",
+            "progress": 55.0,
+            "subtitle_source": "whisper",
+        }
+
+    def test_keeps_progress_for_different_steps(self) -> None:
+        queue = EventQueue()
+        queue.publish(_progress("transcribe", 20.0))
+        queue.publish(_progress("translate", 50.0))
+
+        assert queue.qsize() == 2
+
+    def test_full_queue_drops_oldest_progress(self) -> None:
+        queue = EventQueue(maxsize=2)
+        queue.publish(_progress("download", 5.0))
+        queue.publish(_progress("extract_audio", 15.0))
+        queue.publish({"event": SSEEvent.COMPLETE, "data": {"progress": 100}})
+
+        events = [queue.get_nowait(), queue.get_nowait()]
+        assert [e["event"] for e in events] == [SSEEvent.PROGRESS, SSEEvent.COMPLETE]
+        assert events[0]["data"]["current_step"] == "extract_audio"
+
+    def test_full_queue_never_drops_terminal_events_for_progress(self) -> None:
+        queue = EventQueue(maxsize=1)
+        queue.publish({"event": SSEEvent.ERROR, "data": {"code": "x"}})
+        queue.publish(_progress("burn", 10.0))
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait()["event"] == SSEEvent.ERROR
+
+    def test_full_queue_grows_for_terminal_events(self) -> None:
+        queue = EventQueue(maxsize=1)
+        queue.publish({"event": SSEEvent.DOWNLOAD_COMPLETE, "data": {}})
+        queue.publish({"event": SSEEvent.ERROR, "data": {"code": "x"}})
+
+        assert queue.qsize() == 2
+        assert queue.get_nowait()["event"] == SSEEvent.DOWNLOAD_COMPLETE
+        assert queue.get_nowait()["event"] == SSEEvent.ERROR
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_queued_events(self) -> None:
+        queue = EventQueue()
+        queue.publish(_progress("download", 5.0))
+        queue.publish({"event": SSEEvent.DOWNLOAD_COMPLETE, "data": {}})
+
+        queue.clear()
+
+        assert queue.empty()
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_join_returns_after_dropped_progress(self) -> None:
+        queue = EventQueue(maxsize=1)
+        queue.publish(_progress("download", 5.0))
+        queue.publish({"event": SSEEvent.COMPLETE, "data": {"progress": 100}})
+
+        queue.get_nowait()
+        queue.task_done()
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+
+@pytest.mark.unit
+class TestJobManagerExpiry:
+    def test_get_expired_job_returns_none(self) -> None:
+        manager = JobManager()
+        job = manager.create_job("https://youtube.com/watch?v=test", "en", "zh-TW")
+        job.created_at = time.monotonic() - JOB_TTL_SECONDS - 1
+
+        assert manager.get_job(job.id) is None
+
+    def test_create_job_sweeps_expired_jobs(self) -> None:
+        manager = JobManager()
+        old = manager.create_job("https://youtube.com/watch?v=old", "en", "zh-TW")
+        old.created_at = time.monotonic() - JOB_TTL_SECONDS - 1
+
+        manager.create_job("https://youtube.com/watch?v=new", "en", "zh-TW")
+
+        assert manager.cleanup_expired() == 0
+        assert manager.get_job(old.id) is None
+
+    def test_create_job_evicts_oldest_when_full(self) -> None:
+        manager = JobManager()
+        with patch("bilingualsub.api.jobs.MAX_JOBS", 2):
+            first = manager.create_job("https://youtube.com/watch?v=1", "en", "zh-TW")
+            second = manager.create_job("https://youtube.com/watch?v=2", "en", "zh-TW")
+            third = manager.create_job("https://youtube.com/watch?v=3", "en", "zh-TW")
+
+        assert manager.get_job(first.id) is None
+        assert manager.get_job(second.id) is second
+        assert manager.get_job(third.id) is third
+
+    @pytest.mark.asyncio
+    async def test_create_job_never_evicts_running_jobs(self) -> None:
+        manager = JobManager()
+        release = asyncio.Event()
+        with patch("bilingualsub.api.jobs.MAX_JOBS", 2):
+            first = manager.create_job("https://youtube.com/watch?v=1", "en", "zh-TW")
+            first.task = asyncio.create_task(_wait(release))
+            second = manager.create_job("https://youtube.com/watch?v=2", "en", "zh-TW")
+            third = manager.create_job("https://youtube.com/watch?v=3", "en", "zh-TW")
+
+        assert manager.get_job(first.id) is first
+        assert manager.get_job(second.id) is None
+        assert manager.get_job(third.id) is third
+        release.set()
+        await first.task
+
+    @pytest.mark.asyncio
+    async def test_create_job_refuses_when_every_job_is_running(self) -> None:
+        manager = JobManager()
+        release = asyncio.Event()
+        with patch("bilingualsub.api.jobs.MAX_JOBS", 1):
+            first = manager.create_job("https://youtube.com/watch?v=1", "en", "zh-TW")
+            first.task = asyncio.create_task(_wait(release))
+            with pytest.raises(JobStoreFullError):
+                manager.create_job("https://youtube.com/watch?v=2", "en", "zh-TW")
+
+        assert manager.get_job(first.id) is first
+        release.set()
+        await first.task
+
+    def test_expired_job_work_dir_is_removed(self, tmp_path) -> None:
+        manager = JobManager()
+        job = manager.create_job("https://youtube.com/watch?v=test", "en", "zh-TW")
+        job.work_dir = tmp_path / job.id
+        job.work_dir.mkdir()
+        (job.work_dir / "video.mp4").write_bytes(b"fake")
+        job.created_at = time.monotonic() - JOB_TTL_SECONDS - 1
+
+        assert manager.cleanup_expired() == 1
+        assert not job.work_dir.exists()
+
+    @pytest.mark.asyncio
+    async def test_work_dir_removed_off_loop(self, tmp_path) -> None:
+        manager = JobManager()
+        job = manager.create_job("https://youtube.com/watch?v=test", "en", "zh-TW")
+        job.work_dir = tmp_path / job.id
+        job.work_dir.mkdir()
+        job.created_at = time.monotonic() - JOB_TTL_SECONDS - 1
+
+        assert manager.cleanup_expired() == 1
+        assert len(_removal_tasks) == 1
+
+        await asyncio.gather(*_removal_tasks)
+        assert not job.work_dir.exists()
+
+
+@pytest.mark.unit
+class TestOutputFiles:
+    def test_set_output_file_keeps_string_form_in_step(self, tmp_path) -> None:
+        job = Job(id="files")
+        srt = tmp_path / "subtitle.srt"
+        video = tmp_path / "output.mp4"
+
+        job.set_output_file(FileType.SRT, srt)
+        job.set_output_file(FileType.VIDEO, video)
+
+        assert job.output_files == {FileType.SRT: srt, FileType.VIDEO: video}
+        assert job.output_files_str == {
+            FileType.SRT: str(srt),
+            FileType.VIDEO: str(video),
+        }
+
+    def test_set_output_file_replaces_existing_entry(self, tmp_path) -> None:
+        job = Job(id="files")
+        job.set_output_file(FileType.VIDEO, tmp_path / "old.mp4")
+        job.set_output_file(FileType.VIDEO, tmp_path / "new.mp4")
+
+        assert job.output_files_str == {FileType.VIDEO: str(tmp_path / "new.mp4")}
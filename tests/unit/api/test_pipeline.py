@@ -1,5 +1,6 @@
 """Tests for the async pipeline runner."""
 
+from collections.abc import Generator
 from datetime import timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -8,12 +9,27 @@ import pytest
 
 from bilingualsub.api.constants import FileType, JobStatus, ProcessingMode, SSEEvent
 from bilingualsub.api.jobs import Job
-from bilingualsub.api.pipeline import run_burn, run_download, run_subtitle
+from bilingualsub.api.pipeline import (
+    _is_youtube_url,
+    _make_translate_progress_cb,
+    _to_pipeline_error,
+    run_burn,
+    run_download,
+    run_subtitle,
+)
 from bilingualsub.core.downloader import DownloadError, VideoMetadata
 from bilingualsub.core.subtitle import Subtitle, SubtitleEntry
+from bilingualsub.core.translator import RateLimitError
 from bilingualsub.utils.ffmpeg import FFmpegError
 
 
+@pytest.fixture(autouse=True)
+def work_root(tmp_path: Path) -> Generator[Path, None, None]:
+    """Give every test its own WORK_ROOT so fixed job IDs never collide."""
+    with patch("bilingualsub.api.pipeline.WORK_ROOT", tmp_path / "work"):
+        yield tmp_path / "work"
+
+
 def _make_job_with_time_range() -> Job:
     return Job(
         id="test456",
@@ -61,8 +77,7 @@ def _make_metadata() -> VideoMetadata:
 @pytest.mark.asyncio
 class TestRunPipeline:
     @patch("bilingualsub.api.pipeline.serialize_bilingual_ass")
-    @patch("bilingualsub.api.pipeline.serialize_srt")
-    @patch("bilingualsub.api.pipeline.merge_subtitles")
+    @patch("bilingualsub.api.pipeline.write_bilingual_srt")
     @patch("bilingualsub.api.pipeline.translate_subtitle")
     @patch("bilingualsub.api.pipeline.transcribe_audio")
     @patch("bilingualsub.api.pipeline.extract_audio")
@@ -73,8 +88,7 @@ class TestRunPipeline:
         mock_extract_audio,
         mock_transcribe,
         mock_translate,
-        mock_merge,
-        mock_serialize_srt,
+        mock_write_srt,
         mock_serialize_ass,
         tmp_path: Path,
     ) -> None:
@@ -82,8 +96,6 @@ class TestRunPipeline:
         mock_download.return_value = _make_metadata()
         mock_transcribe.return_value = sub
         mock_translate.return_value = sub
-        mock_merge.return_value = sub.entries
-        mock_serialize_srt.return_value = "1\n00:00:00,000 --> 00:00:04,000\nLine 1"
         mock_serialize_ass.return_value = "[Script Info]\n..."
 
         job = _make_job()
@@ -268,16 +280,14 @@ class TestRunDownload:
 @pytest.mark.asyncio
 class TestRunSubtitle:
     @patch("bilingualsub.api.pipeline.serialize_bilingual_ass")
-    @patch("bilingualsub.api.pipeline.serialize_srt")
-    @patch("bilingualsub.api.pipeline.merge_subtitles")
+    @patch("bilingualsub.api.pipeline.write_bilingual_srt")
     @patch("bilingualsub.api.pipeline.translate_subtitle")
     @patch("bilingualsub.api.pipeline.transcribe_audio")
     async def test_run_subtitle_sends_complete(
         self,
         mock_transcribe,
         mock_translate,
-        mock_merge,
-        mock_srt,
+        mock_write_srt,
         mock_ass,
         tmp_path,
     ) -> None:
@@ -285,8 +295,6 @@ class TestRunSubtitle:
         sub = _make_subtitle()
         mock_transcribe.return_value = sub
         mock_translate.return_value = sub
-        mock_merge.return_value = sub.entries
-        mock_srt.return_value = "1\n00:00:00,000 --> 00:00:04,000\nLine 1"
         mock_ass.return_value = "[Script Info]\n..."
 
         job = _make_job()
@@ -295,8 +303,8 @@ class TestRunSubtitle:
         audio_path.write_bytes(b"fake audio")
         video_path = tmp_path / "video.mp4"
         video_path.write_bytes(b"fake video")
-        job.output_files[FileType.AUDIO] = audio_path
-        job.output_files[FileType.SOURCE_VIDEO] = video_path
+        job.set_output_file(FileType.AUDIO, audio_path)
+        job.set_output_file(FileType.SOURCE_VIDEO, video_path)
         job.video_width = 1920
         job.video_height = 1080
 
@@ -310,6 +318,65 @@ class TestRunSubtitle:
         assert SSEEvent.COMPLETE in event_types
         assert job.status == JobStatus.COMPLETED
 
+    @patch("bilingualsub.api.pipeline.serialize_bilingual_ass")
+    @patch("bilingualsub.api.pipeline.write_bilingual_srt")
+    @patch("bilingualsub.api.pipeline.translate_subtitle")
+    @patch("bilingualsub.api.pipeline.transcribe_audio")
+    @patch("bilingualsub.api.pipeline.fetch_manual_subtitle")
+    @patch("bilingualsub.api.pipeline.extract_audio")
+    async def test_when_audio_missing_then_extracted_alongside_manual_fetch(
+        self,
+        mock_extract_audio,
+        mock_fetch,
+        mock_transcribe,
+        mock_translate,
+        mock_write_srt,
+        mock_ass,
+        tmp_path,
+    ) -> None:
+        sub = _make_subtitle()
+        mock_fetch.return_value = sub
+        mock_translate.return_value = sub
+        mock_ass.return_value = "[Script Info]\n..."
+
+        job = _make_job()
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"fake video")
+        job.set_output_file(FileType.SOURCE_VIDEO, video_path)
+
+        await run_subtitle(job)
+
+        mock_extract_audio.assert_called_once_with(video_path, tmp_path / "audio.mp3")
+        mock_transcribe.assert_not_called()
+        assert job.output_files[FileType.AUDIO] == tmp_path / "audio.mp3"
+        assert job.status == JobStatus.COMPLETED
+
+    @patch("bilingualsub.api.pipeline.fetch_manual_subtitle")
+    @patch("bilingualsub.api.pipeline.extract_audio")
+    async def test_when_audio_extraction_fails_then_error_is_unwrapped(
+        self,
+        mock_extract_audio,
+        mock_fetch,
+        tmp_path,
+    ) -> None:
+        mock_extract_audio.side_effect = FFmpegError("ffmpeg segfault")
+        mock_fetch.return_value = None
+
+        job = _make_job()
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"fake video")
+        job.set_output_file(FileType.SOURCE_VIDEO, video_path)
+
+        await run_subtitle(job)
+
+        events = []
+        while not job.event_queue.empty():
+            events.append(job.event_queue.get_nowait())
+        error_events = [e for e in events if e["event"] == SSEEvent.ERROR]
+        assert len(error_events) == 1
+        assert error_events[0]["data"]["code"] == "burn_failed"
+        assert job.status == JobStatus.FAILED
+
 
 # ---------------------------------------------------------------------------
 # run_burn — watermark + intro + concat + degradation
@@ -333,7 +400,7 @@ def _make_burn_job(tmp_path: Path, *, channel: str = "TestChannel") -> Job:
     # run_burn reads SOURCE_VIDEO to determine work_dir
     video_path = tmp_path / "video.mp4"
     video_path.write_bytes(b"fake")
-    job.output_files[FileType.SOURCE_VIDEO] = video_path
+    job.set_output_file(FileType.SOURCE_VIDEO, video_path)
     return job
 
 
@@ -408,7 +475,6 @@ class TestRunBurn:
         assert job.output_files[FileType.VIDEO] == tmp_path / "output.mp4"
         assert job.status == JobStatus.COMPLETED
 
-    @patch("bilingualsub.api.pipeline.logger")
     @patch("bilingualsub.api.pipeline.concat_videos")
     @patch("bilingualsub.api.pipeline.generate_intro")
     @patch("bilingualsub.api.pipeline.burn_subtitles")
@@ -417,17 +483,15 @@ class TestRunBurn:
         mock_burn: object,
         mock_intro: object,
         mock_concat: object,
-        mock_logger: object,
         tmp_path: Path,
     ) -> None:
         """When generate_intro raises FFmpegError, concat is skipped but job still COMPLETED."""
-        mock_log = MagicMock()
-        mock_logger.bind.return_value = mock_log  # type: ignore[union-attr]
-
         mock_burn.return_value = tmp_path / "output.mp4"
         mock_intro.side_effect = FFmpegError("lavfi failed")
 
         job = _make_burn_job(tmp_path, channel="BadChannel")
+        mock_log = MagicMock()
+        job.log = mock_log
         srt = "1\n00:00:00,000 --> 00:00:04,000\nHello\n"
 
         await run_burn(job, srt)
@@ -442,7 +506,6 @@ class TestRunBurn:
             "intro_generation_failed", error="lavfi failed"
         )
 
-    @patch("bilingualsub.api.pipeline.logger")
     @patch("bilingualsub.api.pipeline.concat_videos")
     @patch("bilingualsub.api.pipeline.generate_intro")
     @patch("bilingualsub.api.pipeline.burn_subtitles")
@@ -451,18 +514,16 @@ class TestRunBurn:
         mock_burn: object,
         mock_intro: object,
         mock_concat: object,
-        mock_logger: object,
         tmp_path: Path,
     ) -> None:
         """When concat_videos raises FFmpegError, job still COMPLETED and VIDEO = output.mp4."""
-        mock_log = MagicMock()
-        mock_logger.bind.return_value = mock_log  # type: ignore[union-attr]
-
         mock_burn.return_value = tmp_path / "output.mp4"
         mock_intro.return_value = tmp_path / "intro.mp4"
         mock_concat.side_effect = FFmpegError("concat failed")
 
         job = _make_burn_job(tmp_path, channel="SomeChannel")
+        mock_log = MagicMock()
+        job.log = mock_log
         srt = "1\n00:00:00,000 --> 00:00:04,000\nHello\n"
 
         await run_burn(job, srt)
@@ -595,3 +656,72 @@ class TestRunDownloadChannel:
 
         assert job.video_channel == "BilibiliUser"
         assert job.video_channel_url == ""  # Non-YouTube → cleared
+
+
+@pytest.mark.unit
+class TestTranslateProgressThrottle:
+    def test_when_many_segments_then_events_capped_by_percentage(self) -> None:
+        job = _make_job()
+        on_progress = _make_translate_progress_cb(job)
+
+        with patch("bilingualsub.api.pipeline._send_progress") as mock_send:
+            for completed in range(1, 1001):
+                on_progress(completed, 1000)
+
+        # 20 percentage points of translate progress at >= 1 point per event
+        assert mock_send.call_count <= 25
+        assert mock_send.call_args.args[2] == 70.0
+
+    def test_when_last_segment_then_always_emitted(self) -> None:
+        job = _make_job()
+        on_progress = _make_translate_progress_cb(job)
+
+        with patch("bilingualsub.api.pipeline._send_progress") as mock_send:
+            on_progress(1, 1000)
+            on_progress(1000, 1000)
+
+        assert mock_send.call_args.args[4] == "Translating subtitles (1000/1000)"
+
+
+@pytest.mark.unit
+class TestToPipelineError:
+    def test_exact_type_maps_to_code(self) -> None:
+        err = _to_pipeline_error(DownloadError("boom"))
+        assert err.code == "download_failed"
+        assert err.detail == "boom"
+
+    def test_subclass_resolves_to_base_entry(self) -> None:
+        err = _to_pipeline_error(RateLimitError(5.0, "slow down"))
+        assert err.code == "translation_failed"
+
+    def test_unknown_type_falls_back(self) -> None:
+        err = _to_pipeline_error(RuntimeError("?"))
+        assert err.code == "pipeline_failed"
+
+
+@pytest.mark.unit
+class TestIsYoutubeUrl:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://youtube.com/watch?v=abc",
+            "https://www.youtube.com/watch?v=abc",
+            "https://m.youtube.com/watch?v=abc",
+            "https://youtu.be/abc",
+            "HTTPS://WWW.YOUTUBE.COM/watch?v=abc",
+        ],
+    )
+    def test_youtube_hosts_match(self, url: str) -> None:
+        assert _is_youtube_url(url) is True
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "",
+            "https://www.bilibili.com/video/BV1234",
+            "https://example.com/?ref=youtube.com",
+            "https://notyoutube.com/watch?v=abc",
+        ],
+    )
+    def test_other_hosts_do_not_match(self, url: str) -> None:
+        assert _is_youtube_url(url) is False
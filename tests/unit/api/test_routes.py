@@ -1,15 +1,22 @@
 """Tests for API routes."""
 
+import io
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sse_starlette.sse import ServerSentEvent
 
 from bilingualsub.api.app import create_app
-from bilingualsub.api.constants import FileType, JobStatus
+from bilingualsub.api.constants import FileType, JobStatus, SSEEvent
 from bilingualsub.api.jobs import Job, JobManager
-from bilingualsub.api.routes import _build_download_filename, _sanitize_filename
+from bilingualsub.api.routes import (
+    _build_download_filename,
+    _copy_upload,
+    _encode_sse,
+    _sanitize_filename,
+)
 from bilingualsub.core import RetranslateResult
 from bilingualsub.core.glossary import GlossaryManager
 
@@ -66,6 +73,31 @@ class TestCreateJob:
         )
         assert response.status_code == 422
 
+    async def test_create_job_records_pipeline_task(
+        self, client: AsyncClient, app
+    ) -> None:
+        response = await client.post(
+            "/api/jobs",
+            json={"source_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"},
+        )
+        job = app.state.job_manager.get_job(response.json()["job_id"])
+        assert job.task is not None
+
+    async def test_upload_is_saved_in_job_work_dir(
+        self, client: AsyncClient, app, tmp_path: Path
+    ) -> None:
+        with patch("bilingualsub.api.routes.WORK_ROOT", tmp_path):
+            response = await client.post(
+                "/api/jobs/upload",
+                files={"file": ("clip.mp4", b"fake video", "video/mp4")},
+            )
+
+        assert response.status_code == 200
+        job = app.state.job_manager.get_job(response.json()["job_id"])
+        assert job.work_dir == tmp_path / job.id
+        assert job.local_video_path == tmp_path / job.id / "clip.mp4"
+        assert job.local_video_path.read_bytes() == b"fake video"
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -110,6 +142,27 @@ class TestDownload:
         response = await client.get("/api/jobs/nonexistent/download/srt")
         assert response.status_code == 404
 
+    async def test_download_existing_file(
+        self, app, client: AsyncClient, tmp_path: Path
+    ) -> None:
+        job = app.state.job_manager.create_job(source_url="https://youtu.be/x")
+        srt_path = tmp_path / "subtitle.srt"
+        srt_path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHi\n")
+        job.set_output_file(FileType.SRT, srt_path)
+
+        response = await client.get(f"/api/jobs/{job.id}/download/srt")
+        assert response.status_code == 200
+        assert response.headers["content-length"] == str(srt_path.stat().st_size)
+
+    async def test_download_missing_file(
+        self, app, client: AsyncClient, tmp_path: Path
+    ) -> None:
+        job = app.state.job_manager.create_job(source_url="https://youtu.be/x")
+        job.set_output_file(FileType.SRT, tmp_path / "gone.srt")
+
+        response = await client.get(f"/api/jobs/{job.id}/download/srt")
+        assert response.status_code == 422
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -124,6 +177,27 @@ class TestErrorResponseFormat:
         assert "detail" in data
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBurn:
+    async def test_burn_keeps_event_queue_for_open_streams(
+        self, client: AsyncClient, app, tmp_path: Path
+    ) -> None:
+        job = app.state.job_manager.create_job(source_url="https://youtu.be/x")
+        job.set_output_file(FileType.SOURCE_VIDEO, tmp_path / "video.mp4")
+        job.event_queue.publish({"event": SSEEvent.DOWNLOAD_COMPLETE, "data": {}})
+        queue = job.event_queue
+
+        with patch("bilingualsub.api.routes.run_burn", new_callable=AsyncMock):
+            response = await client.post(
+                f"/api/jobs/{job.id}/burn", json={"srt_content": ""}
+            )
+
+        assert response.status_code == 200
+        assert job.event_queue is queue
+        assert queue.empty()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestStartSubtitle:
@@ -192,7 +266,7 @@ class TestPartialRetranslate:
         job_id = create_resp.json()["job_id"]
 
         job = app.state.job_manager.get_job(job_id)
-        job.output_files[FileType.SOURCE_VIDEO] = Path("/tmp/source.mp4")
+        job.set_output_file(FileType.SOURCE_VIDEO, Path("/tmp/source.mp4"))
         job.source_lang = "en"
         job.target_lang = "zh-TW"
 
@@ -262,6 +336,30 @@ def _make_job(
     return job
 
 
+@pytest.mark.unit
+class TestCopyUpload:
+    def test_copies_within_limit(self, tmp_path: Path) -> None:
+        dest = tmp_path / "video.mp4"
+        assert _copy_upload(io.BytesIO(b"fake video"), dest, max_size=100) is True
+        assert dest.read_bytes() == b"fake video"
+
+    def test_stops_when_limit_exceeded(self, tmp_path: Path) -> None:
+        dest = tmp_path / "video.mp4"
+        assert _copy_upload(io.BytesIO(b"x" * 101), dest, max_size=100) is False
+
+
+@pytest.mark.unit
+class TestEncodeSSE:
+    def test_matches_server_sent_event_encoding(self) -> None:
+        data = '{"status":"translating","progress":55.0}'
+        expected = ServerSentEvent(data=data, event="progress").encode()
+        assert _encode_sse(SSEEvent.PROGRESS, data.encode()) == expected
+
+    def test_terminal_event_frame(self) -> None:
+        expected = ServerSentEvent(data="{}", event="complete").encode()
+        assert _encode_sse(SSEEvent.COMPLETE, b"{}") == expected
+
+
 @pytest.mark.unit
 class TestSanitizeFilename:
     def test_empty_string_returns_video(self) -> None:
@@ -5,6 +5,8 @@ from pydantic import ValidationError
 
 from bilingualsub.api.constants import JobStatus
 from bilingualsub.api.schemas import (
+    MAX_SRT_CONTENT_CHARS,
+    BurnRequest,
     ErrorDetail,
     JobCreateRequest,
     JobCreateResponse,
@@ -162,6 +164,17 @@ class TestStartSubtitleRequest:
         assert req.target_lang == "ja"
 
 
+@pytest.mark.unit
+class TestBurnRequest:
+    def test_accepts_srt_content(self) -> None:
+        req = BurnRequest(srt_content="1\n00:00:00,000 --> 00:00:01,000\nHi\n")
+        assert req.srt_content.startswith("1\n")
+
+    def test_rejects_oversized_srt_content(self) -> None:
+        with pytest.raises(ValidationError, match="at most"):
+            BurnRequest(srt_content="x" * (MAX_SRT_CONTENT_CHARS + 1))
+
+
 @pytest.mark.unit
 class TestPartialRetranslateRequest:
     def test_valid_payload(self) -> None:
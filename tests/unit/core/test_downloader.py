@@ -1,6 +1,7 @@
 """Unit tests for video downloader."""
 
 import json
+import struct
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -10,6 +11,7 @@ import pytest
 from bilingualsub.core.downloader import (
     DownloadError,
     VideoMetadata,
+    _extract_metadata_from_mp4,
     _is_supported_url,
     download_video,
 )
@@ -540,6 +542,36 @@ class TestDownloadVideo:
         ydl_opts = mock_yt_dlp.YoutubeDL.call_args[0][0]
         assert ydl_opts["cookiefile"] == str(cookie_file)
 
+    def test_download_fetches_fragments_concurrently(
+        self, tmp_path, mock_yt_dlp, mock_subprocess, valid_ffprobe_output
+    ):
+        """Test yt-dlp is asked to fetch DASH/HLS fragments in parallel."""
+        output_path = tmp_path / "video.mp4"
+
+        mock_ydl_instance = MagicMock()
+        mock_yt_dlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl_instance
+
+        def extract_info_side_effect(url, download=True):
+            output_path.touch()
+            return {
+                "title": "Test Video",
+                "duration": 120.0,
+                "width": 1920,
+                "height": 1080,
+                "fps": 30.0,
+            }
+
+        mock_ydl_instance.extract_info.side_effect = extract_info_side_effect
+
+        mock_result = Mock()
+        mock_result.stdout = valid_ffprobe_output
+        mock_subprocess.run.return_value = mock_result
+
+        download_video("https://www.youtube.com/watch?v=dQw4w9WgXcQ", output_path)
+
+        ydl_opts = mock_yt_dlp.YoutubeDL.call_args[0][0]
+        assert ydl_opts["concurrent_fragment_downloads"] == 4
+
     @pytest.mark.unit
     def test_all_youtube_url_formats_accepted(self, tmp_path):
         """Test that all common YouTube URL formats are accepted."""
@@ -850,3 +882,77 @@ class TestIsSupportedUrl:
 
     def test_non_url_string_not_supported(self) -> None:
         assert _is_supported_url("not-a-url") is False
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _trak(handler: bytes, stbl: bytes = b"") -> bytes:
+    mdhd = _box(b"mdhd", bytes(4) + struct.pack(">IIII", 0, 0, 30000, 0) + bytes(4))
+    hdlr = _box(b"hdlr", bytes(8) + handler + bytes(12))
+    minf = _box(b"minf", _box(b"stbl", stbl))
+    return _box(b"trak", _box(b"mdia", mdhd + hdlr + minf))
+
+
+def _make_mp4(*, with_audio: bool = True) -> bytes:
+    """Build a minimal progressive MP4: 1280x720, 300 frames at 30000/1001."""
+    mvhd = _box(b"mvhd", bytes(4) + struct.pack(">IIII", 0, 0, 1000, 10010))
+    sample_entry = (
+        struct.pack(">I4s", 86, b"avc1")
+        + bytes(24)
+        + struct.pack(">HH", 1280, 720)
+        + bytes(50)
+    )
+    stsd = _box(b"stsd", bytes(4) + struct.pack(">I", 1) + sample_entry)
+    stts = _box(b"stts", bytes(4) + struct.pack(">III", 1, 300, 1001))
+    traks = _trak(b"vide", stsd + stts) + (_trak(b"soun") if with_audio else b"")
+    # moov after mdat, as ffmpeg writes it without +faststart
+    return (
+        _box(b"ftyp", b"isom" + bytes(4))
+        + _box(b"mdat", bytes(16))
+        + _box(b"moov", mvhd + traks)
+    )
+
+
+@pytest.mark.unit
+class TestExtractMetadataFromMP4:
+    def test_reads_video_track_metadata(self, tmp_path: Path) -> None:
+        video_path = tmp_path / "clip.mp4"
+        video_path.write_bytes(_make_mp4())
+
+        metadata = _extract_metadata_from_mp4(video_path)
+
+        assert metadata is not None
+        assert metadata.title == "clip"
+        assert metadata.duration == pytest.approx(10.01)
+        assert (metadata.width, metadata.height) == (1280, 720)
+        assert metadata.fps == pytest.approx(30000 / 1001)
+        assert metadata.has_audio is True
+
+    def test_detects_missing_audio_track(self, tmp_path: Path) -> None:
+        video_path = tmp_path / "clip.mp4"
+        video_path.write_bytes(_make_mp4(with_audio=False))
+
+        metadata = _extract_metadata_from_mp4(video_path)
+
+        assert metadata is not None
+        assert metadata.has_audio is False
+
+    def test_non_mp4_returns_none(self, tmp_path: Path) -> None:
+        video_path = tmp_path / "clip.mp4"
+        video_path.write_bytes(b"\x1aE\xdf\xa3 not an mp4 container")
+
+        assert _extract_metadata_from_mp4(video_path) is None
+
+    def test_truncated_file_returns_none(self, tmp_path: Path) -> None:
+        video_path = tmp_path / "clip.mp4"
+        video_path.write_bytes(_make_mp4()[:-40])
+
+        assert _extract_metadata_from_mp4(video_path) is None
+
+    def test_empty_file_returns_none(self, tmp_path: Path) -> None:
+        video_path = tmp_path / "clip.mp4"
+        video_path.write_bytes(b"")
+
+        assert _extract_metadata_from_mp4(video_path) is None
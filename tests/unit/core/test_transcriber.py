@@ -1,5 +1,7 @@
 """Unit tests for audio transcription."""
 
+import os
+import time
 from datetime import timedelta
 from unittest.mock import MagicMock, Mock, patch
 
@@ -167,7 +169,14 @@ class TestTranscribeAudio:
         response2.segments = [
             {"id": 0, "start": 0.0, "end": 3.0, "text": " World"},
         ]
-        mock_client.audio.transcriptions.create.side_effect = [response1, response2]
+        # Chunks are uploaded concurrently, so answer by file name, not call order
+        responses = {
+            "large_audio_chunk0.mp3": response1,
+            "large_audio_chunk1.mp3": response2,
+        }
+        mock_client.audio.transcriptions.create.side_effect = lambda **kwargs: (
+            responses[kwargs["file"][0]]
+        )
 
         chunk0 = tmp_path / "large_audio_chunk0.mp3"
         chunk0.write_bytes(b"chunk0")
@@ -175,11 +184,13 @@ class TestTranscribeAudio:
         chunk1.write_bytes(b"chunk1")
 
         with patch(
-            "bilingualsub.core.transcriber.split_audio",
+            "bilingualsub.core.transcriber.iter_audio_chunks",
             return_value=[(chunk0, 0.0), (chunk1, 1500.0)],
         ):
             result = transcribe_audio(audio_path)
 
+        # Both chunks go through one client and its connection pool
+        mock_groq.assert_called_once()
         assert isinstance(result, Subtitle)
         assert len(result.entries) == 2
         assert result.entries[0].text == "Hello"
@@ -416,13 +427,104 @@ class TestTranscribeAudio:
             valid_verbose_json_response
         )
 
-        with patch("bilingualsub.core.transcriber.split_audio") as mock_split:
+        with patch("bilingualsub.core.transcriber.iter_audio_chunks") as mock_split:
             result = transcribe_audio(audio_path)
 
         mock_split.assert_not_called()
         assert isinstance(result, Subtitle)
         assert len(result.entries) == 2
 
+    def test_client_is_reused_across_calls(
+        self, tmp_path, mock_groq, valid_verbose_json_response, monkeypatch
+    ):
+        """Test that repeated transcriptions share one client and its pool."""
+        monkeypatch.setenv("GROQ_API_KEY", "test-api-key")
+
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"fake audio content")
+
+        mock_client = MagicMock()
+        mock_groq.return_value = mock_client
+        mock_client.audio.transcriptions.create.return_value = (
+            valid_verbose_json_response
+        )
+
+        transcribe_audio(audio_path)
+        transcribe_audio(audio_path)
+
+        mock_groq.assert_called_once_with(api_key="test-api-key")
+        assert mock_client.audio.transcriptions.create.call_count == 2
+
+    def test_cached_transcript_skips_api_call(
+        self, tmp_path, mock_groq, valid_verbose_json_response, monkeypatch
+    ):
+        """Test that a repeated request is served from the transcript cache."""
+        monkeypatch.setenv("GROQ_API_KEY", "test-api-key")
+        monkeypatch.setenv("TRANSCRIPT_CACHE_DIR", str(tmp_path / "cache"))
+
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"fake audio content")
+
+        mock_client = MagicMock()
+        mock_groq.return_value = mock_client
+        mock_client.audio.transcriptions.create.return_value = (
+            valid_verbose_json_response
+        )
+
+        first = transcribe_audio(audio_path)
+        second = transcribe_audio(audio_path)
+
+        mock_client.audio.transcriptions.create.assert_called_once()
+        assert second.entries == first.entries
+
+    def test_cache_key_includes_language(
+        self, tmp_path, mock_groq, valid_verbose_json_response, monkeypatch
+    ):
+        """Test that a different language is not served from the cache."""
+        monkeypatch.setenv("GROQ_API_KEY", "test-api-key")
+        monkeypatch.setenv("TRANSCRIPT_CACHE_DIR", str(tmp_path / "cache"))
+
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"fake audio content")
+
+        mock_client = MagicMock()
+        mock_groq.return_value = mock_client
+        mock_client.audio.transcriptions.create.return_value = (
+            valid_verbose_json_response
+        )
+
+        transcribe_audio(audio_path, language="en")
+        transcribe_audio(audio_path, language="ja")
+
+        assert mock_client.audio.transcriptions.create.call_count == 2
+
+    def test_storing_a_transcript_prunes_expired_cache_files(
+        self, tmp_path, mock_groq, valid_verbose_json_response, monkeypatch
+    ):
+        """Test that cache files past the TTL are deleted when a new one is stored."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("GROQ_API_KEY", "test-api-key")
+        monkeypatch.setenv("TRANSCRIPT_CACHE_DIR", str(cache_dir))
+        cache_dir.mkdir()
+        stale = cache_dir / "stale.json"
+        stale.write_text("[]", encoding="utf-8")
+        old = time.time() - 8 * 24 * 60 * 60
+        os.utime(stale, (old, old))
+
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"fake audio content")
+
+        mock_client = MagicMock()
+        mock_groq.return_value = mock_client
+        mock_client.audio.transcriptions.create.return_value = (
+            valid_verbose_json_response
+        )
+
+        transcribe_audio(audio_path)
+
+        assert not stale.exists()
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
 
 @pytest.mark.unit
 class TestWhisperPrompt:
@@ -1,9 +1,11 @@
 """Unit tests for subtitle translation."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from unittest.mock import Mock, patch
 
 import pytest
+from agno.models.groq import Groq
 from agno.models.openai import OpenAIChat
 
 from bilingualsub.core.subtitle import Subtitle, SubtitleEntry
@@ -12,12 +14,21 @@ from bilingualsub.core.translator import (
     RetranslateEntry,
     RetranslateResult,
     TranslationError,
+    _batch_size_for,
     _build_model,
+    _pack_batches,
     _parse_batch_response,
     _parse_retranslate_response,
+    _rate_limit_delay,
+    _RateLimiter,
     _repair_cjk_split_boundaries,
+    _thread_local_agent,
+    _TranslationCache,
+    _TranslatorPool,
+    iter_translated_entries,
     retranslate_entries,
     translate_subtitle,
+    translate_subtitles,
 )
 from bilingualsub.utils.config import get_settings
 
@@ -31,6 +42,40 @@ def set_fake_groq_api_key(monkeypatch):
     get_settings.cache_clear()
 
 
+def _entries(texts: list[str]) -> list[SubtitleEntry]:
+    """Build consecutive two-second entries with the given texts."""
+    return [
+        SubtitleEntry(
+            index=i + 1,
+            start=timedelta(seconds=i * 2),
+            end=timedelta(seconds=i * 2 + 2),
+            text=text,
+        )
+        for i, text in enumerate(texts)
+    ]
+
+
+def _subtitle(count: int, prefix: str = "Line") -> Subtitle:
+    """Build a subtitle whose entries read ``"<prefix> 1"`` .. ``"<prefix> N"``."""
+    return Subtitle(entries=_entries([f"{prefix} {i}" for i in range(1, count + 1)]))
+
+
+def _echo_batch(prompt_text: str, *, replace: str = "Line") -> Mock:
+    """Answer a batch prompt by echoing its numbered lines.
+
+    The first ``replace`` in each line becomes ``譯``, so ``"1. Line 1"`` is
+    translated to ``"1. 譯 1"``.
+    """
+    lines = [
+        line
+        for line in prompt_text.splitlines()
+        if line.strip() and line.strip()[0].isdigit()
+    ]
+    resp = Mock()
+    resp.content = "\n".join(line.replace(replace, "譯", 1) for line in lines)
+    return resp
+
+
 class TestTranslateSubtitle:
     """Test cases for translate_subtitle function."""
 
@@ -200,6 +245,21 @@ class TestTranslateSubtitle:
         for part in expected_lang_parts:
             assert part in prompt
 
+    def test_translate_subtitle_reuses_agent_across_calls(
+        self, mock_agent, sample_subtitle
+    ):
+        """Repeated calls on the same thread should reuse the cached Agent."""
+        mock_translator = Mock()
+        mock_agent.return_value = mock_translator
+        mock_response = Mock()
+        mock_response.content = "1. 你好\n2. 你好嗎"
+        mock_translator.run.return_value = mock_response
+
+        translate_subtitle(sample_subtitle)
+        translate_subtitle(sample_subtitle)
+
+        mock_agent.assert_called_once()
+
     def test_translate_subtitle_returns_new_subtitle_object(
         self, mock_agent, sample_subtitle
     ):
@@ -241,6 +301,12 @@ class TestParseBatchResponse:
         result = _parse_batch_response(response, 2)
         assert result == ["翻譯一", "翻譯二"]
 
+    def test_parse_batch_response_ignores_preamble_and_blank_lines(self):
+        """Should skip non-numbered lines and tolerate CRLF line endings."""
+        response = "Here you go:\r\n\r\n1. 翻譯一\r\n\r\n2. 翻譯二\r\n"
+        result = _parse_batch_response(response, 2)
+        assert result == ["翻譯一", "翻譯二"]
+
     def test_parse_batch_response_count_mismatch(self):
         """Should raise TranslationError on count mismatch."""
         response = "1. 你好"
@@ -253,6 +319,23 @@ class TestParseBatchResponse:
         with pytest.raises(TranslationError):
             _parse_batch_response(response, 3)
 
+    def test_parse_batch_response_out_of_range_number(self):
+        """Should name the missing line when a number falls outside the batch."""
+        response = "1. 你好\n3. 再見"
+        with pytest.raises(TranslationError, match="Missing translation for line 2"):
+            _parse_batch_response(response, 2)
+
+    def test_parse_batch_response_json_object(self):
+        """Should read a fenced JSON reply without touching leading numbers."""
+        response = '```json\n{"translations": ["3.5 百萬", "你好"]}\n```'
+        result = _parse_batch_response(response, 2)
+        assert result == ["3.5 百萬", "你好"]
+
+    def test_parse_batch_response_json_count_mismatch(self):
+        """Should raise TranslationError when the JSON array length differs."""
+        with pytest.raises(TranslationError, match="Expected 3 translations"):
+            _parse_batch_response('["一", "二"]', 3)
+
 
 class TestParseRetranslateResponse:
     def test_parse_retranslate_response_json_object(self):
@@ -385,6 +468,142 @@ class TestBatchTranslation:
         assert result.entries[0].text == "你好"
         assert result.entries[1].text == "世界"
 
+    def test_unparseable_large_batch_is_retried_in_halves(self):
+        """A malformed 10-line response should be retried as two batches."""
+        entries = [
+            SubtitleEntry(
+                index=i + 1,
+                start=timedelta(seconds=i * 2),
+                end=timedelta(seconds=i * 2 + 2),
+                text=f"Line {i + 1}",
+            )
+            for i in range(10)
+        ]
+        subtitle = Subtitle(entries=entries)
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+
+            def respond(prompt_text):
+                resp = Mock()
+                lines = [
+                    line
+                    for line in prompt_text.splitlines()
+                    if line.strip() and line.strip()[0].isdigit()
+                ]
+                if len(lines) == 10:
+                    resp.content = "Sorry, I cannot number these."
+                else:
+                    resp.content = "\n".join(
+                        line.replace("Line", "譯", 1) for line in lines
+                    )
+                return resp
+
+            mock_translator.run.side_effect = respond
+
+            result = translate_subtitle(subtitle)
+
+        assert mock_translator.run.call_count == 3
+        assert [e.text for e in result.entries] == [f"譯 {i}" for i in range(1, 11)]
+        tail_prompt = mock_translator.run.call_args_list[2][0][0]
+        assert "Line 5 → 譯 5" in tail_prompt
+
+    def test_missing_line_is_requested_alone(self):
+        """A response that skips one line should only re-request that line."""
+        entries = [
+            SubtitleEntry(
+                index=i + 1,
+                start=timedelta(seconds=i * 2),
+                end=timedelta(seconds=i * 2 + 2),
+                text=f"Line {i + 1}",
+            )
+            for i in range(3)
+        ]
+        subtitle = Subtitle(entries=entries)
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            gap_resp = Mock()
+            gap_resp.content = "1. 一\n3. 三"
+            repair_resp = Mock()
+            repair_resp.content = "1. 二"
+            mock_translator.run.side_effect = [gap_resp, repair_resp]
+
+            result = translate_subtitle(subtitle)
+
+        assert [e.text for e in result.entries] == ["一", "二", "三"]
+        repair_prompt = mock_translator.run.call_args_list[1][0][0]
+        assert "1. Line 2" in repair_prompt
+        assert "Line 1 → 一" in repair_prompt
+
+    def test_transient_error_retries_batch_before_fallback(self):
+        """A connection error should retry the batch rather than go one-by-one."""
+        entries = [
+            SubtitleEntry(
+                index=1,
+                start=timedelta(seconds=0),
+                end=timedelta(seconds=2),
+                text="Hello",
+            ),
+            SubtitleEntry(
+                index=2,
+                start=timedelta(seconds=2),
+                end=timedelta(seconds=4),
+                text="World",
+            ),
+        ]
+        subtitle = Subtitle(entries=entries)
+
+        with (
+            patch("bilingualsub.core.translator.Agent") as mock_agent,
+            patch("bilingualsub.core.translator.time.sleep") as mock_sleep,
+        ):
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            good_resp = Mock()
+            good_resp.content = "1. 你好\n2. 世界"
+            mock_translator.run.side_effect = [ConnectionError("reset"), good_resp]
+
+            result = translate_subtitle(subtitle)
+
+        assert [e.text for e in result.entries] == ["你好", "世界"]
+        assert mock_translator.run.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_parallel_one_by_one_fallback_keeps_order(self):
+        """Fallback requests may run in parallel but results keep entry order."""
+        entries = [
+            SubtitleEntry(
+                index=i + 1,
+                start=timedelta(seconds=i * 2),
+                end=timedelta(seconds=i * 2 + 2),
+                text=f"Line {i + 1}",
+            )
+            for i in range(4)
+        ]
+        subtitle = Subtitle(entries=entries)
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+
+            def respond(prompt_text):
+                resp = Mock()
+                if "編號" in prompt_text:
+                    resp.content = "not numbered"
+                else:
+                    resp.content = "譯 " + prompt_text.rsplit("Line ", 1)[1]
+                return resp
+
+            mock_translator.run.side_effect = respond
+
+            result = translate_subtitle(subtitle, max_concurrency=4)
+
+        assert [e.text for e in result.entries] == [f"譯 {i}" for i in range(1, 5)]
+        assert mock_translator.run.call_count == 5
+
     def test_translate_respects_batch_size(self):
         """25 entries should result in 3 batch API calls (10+10+5)."""
         entries = [
@@ -467,6 +686,388 @@ class TestBatchTranslation:
         assert progress_calls[1] == (20, 25)
         assert progress_calls[2] == (25, 25)
 
+    def test_concurrent_batches_keep_entry_order(self):
+        """Concurrent batches should be reassembled in subtitle order."""
+        entries = [
+            SubtitleEntry(
+                index=i + 1,
+                start=timedelta(seconds=i * 2),
+                end=timedelta(seconds=i * 2 + 2),
+                text=f"Line {i + 1}",
+            )
+            for i in range(25)
+        ]
+        subtitle = Subtitle(entries=entries)
+        prompts: list[str] = []
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+
+            def echo_batch(prompt_text):
+                prompts.append(prompt_text)
+                lines = [
+                    line
+                    for line in prompt_text.splitlines()
+                    if line.strip() and line.strip()[0].isdigit()
+                ]
+                resp = Mock()
+                resp.content = "\n".join(
+                    line.replace("Line", "譯", 1) for line in lines
+                )
+                return resp
+
+            mock_translator.run.side_effect = echo_batch
+
+            progress_calls = []
+            result = translate_subtitle(
+                subtitle,
+                max_concurrency=3,
+                on_progress=lambda done, total: progress_calls.append((done, total)),
+            )
+
+        assert [e.text for e in result.entries] == [f"譯 {i}" for i in range(1, 26)]
+        assert progress_calls == [(10, 25), (20, 25), (25, 25)]
+        assert mock_translator.run.call_count == 3
+        later_prompt = next(p for p in prompts if "1. Line 11" in p)
+        assert "上文參考" in later_prompt
+        assert "- Line 10\n" in later_prompt
+        assert "→" not in later_prompt
+
+
+class TestPackBatches:
+    """Test character-budgeted batch packing."""
+
+    @staticmethod
+    def _entries(lengths: list[int]) -> list[SubtitleEntry]:
+        return _entries(["x" * length for length in lengths])
+
+    def test_short_lines_fill_batches_by_count(self):
+        assert _pack_batches(self._entries([10] * 25)) == [(0, 10), (10, 20), (20, 25)]
+
+    def test_long_lines_close_batch_early(self):
+        bounds = _pack_batches(self._entries([600, 600, 600, 10]))
+        assert bounds == [(0, 2), (2, 4)]
+
+    def test_oversized_line_gets_own_batch(self):
+        assert _pack_batches(self._entries([5000, 10])) == [(0, 1), (1, 2)]
+
+    def test_lines_without_letters_do_not_count_toward_batch_size(self):
+        entries = self._entries([10] * 12)
+        entries[3] = entries[3].with_text("♪ ♪")
+        entries[7] = entries[7].with_text("...")
+        assert _pack_batches(entries) == [(0, 12)]
+
+    def test_configured_batch_size_is_used_as_is(self):
+        assert _batch_size_for(self._entries([10] * 25), 25) == 25
+
+    def test_adaptive_batch_size_grows_for_short_lines(self):
+        assert _batch_size_for(self._entries([30] * 100), 0) == 50
+        assert _batch_size_for(self._entries([2] * 100), 0) == 75
+        assert _batch_size_for(self._entries([400] * 10), 0) == 10
+
+    def test_adaptive_batch_size_translates_short_lines_in_one_request(
+        self, monkeypatch
+    ):
+        monkeypatch.setenv("TRANSLATOR_BATCH_SIZE", "0")
+        get_settings.cache_clear()
+        subtitle = Subtitle(
+            entries=[
+                SubtitleEntry(
+                    index=i,
+                    start=timedelta(seconds=i * 2),
+                    end=timedelta(seconds=i * 2 + 2),
+                    text=f"Line {i}",
+                )
+                for i in range(1, 26)
+            ]
+        )
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_response = Mock()
+            mock_response.content = "\n".join(f"{i}. 譯" for i in range(1, 26))
+            mock_translator.run.return_value = mock_response
+
+            result = translate_subtitle(subtitle)
+
+        assert mock_translator.run.call_count == 1
+        assert len(result.entries) == 25
+
+
+class TestRateLimiter:
+    """Test the shared request/token bucket."""
+
+    def test_waits_for_refill_once_budget_is_spent(self):
+        clock = [100.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with (
+            patch(
+                "bilingualsub.core.translator.time.monotonic",
+                side_effect=lambda: clock[0],
+            ),
+            patch(
+                "bilingualsub.core.translator.time.sleep", side_effect=fake_sleep
+            ) as mock_sleep,
+        ):
+            limiter = _RateLimiter(per_minute=60)
+            limiter.acquire(60)
+            mock_sleep.assert_not_called()
+
+            limiter.acquire(30)
+
+        mock_sleep.assert_called_once()
+        assert clock[0] == pytest.approx(130.0)
+
+    def test_oversized_request_is_clamped_to_capacity(self):
+        with patch("bilingualsub.core.translator.time.sleep") as mock_sleep:
+            _RateLimiter(per_minute=10).acquire(500)
+        mock_sleep.assert_not_called()
+
+
+class TestRateLimitDelay:
+    """Test the wait before a rate-limit retry."""
+
+    def test_provider_hint_is_a_floor(self):
+        for attempt in range(5):
+            assert 30.0 <= _rate_limit_delay(30.0, attempt) <= 45.0
+
+    def test_short_hint_backs_off_exponentially(self):
+        with patch("bilingualsub.core.translator.random.uniform", return_value=1.0):
+            delays = [_rate_limit_delay(0.5, attempt) for attempt in range(8)]
+
+        assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0, 60.0]
+
+    def test_rate_limited_batch_reports_jittered_delay(self):
+        subtitle = Subtitle(
+            entries=[
+                SubtitleEntry(
+                    index=1,
+                    start=timedelta(seconds=0),
+                    end=timedelta(seconds=2),
+                    text="Hello",
+                )
+            ]
+        )
+        limited = Mock(content="rate_limit_exceeded: try again in 4s")
+        translated = Mock(content="1. 你好")
+        reported = []
+
+        with (
+            patch("bilingualsub.core.translator.Agent") as mock_agent,
+            patch("bilingualsub.core.translator.time.sleep") as mock_sleep,
+        ):
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = [limited, translated]
+
+            result = translate_subtitle(
+                subtitle, on_rate_limit=lambda *args: reported.append(args)
+            )
+
+        assert result.entries[0].text == "你好"
+        [(delay, attempt, _max_retries)] = reported
+        assert attempt == 1
+        assert 4.0 <= delay <= 6.0
+        mock_sleep.assert_called_once_with(delay)
+
+
+class TestTranslationCache:
+    """Test reuse of line translations."""
+
+    def test_repeated_lines_are_translated_once(self):
+        """A later batch made of already translated lines should skip the LLM."""
+        texts = [f"Line {i}" for i in range(1, 11)] + ["Line 1", "Line 2"]
+        subtitle = Subtitle(entries=_entries(texts))
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = _echo_batch
+
+            result = translate_subtitle(subtitle)
+
+        assert mock_translator.run.call_count == 1
+        assert [e.text for e in result.entries][-2:] == ["譯 1", "譯 2"]
+
+    def test_duplicate_lines_in_batch_are_prompted_once(self):
+        """Identical lines in one batch should share a single numbered slot."""
+        subtitle = Subtitle(entries=_entries(["Line 1", "Line 2", "Line 1", "Line 3"]))
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = _echo_batch
+
+            result = translate_subtitle(subtitle)
+
+        prompt = mock_translator.run.call_args[0][0]
+        assert "3. Line 3" in prompt
+        assert "4. " not in prompt
+        assert [e.text for e in result.entries] == ["譯 1", "譯 2", "譯 1", "譯 3"]
+
+    def test_lines_differing_only_in_whitespace_share_a_slot(self):
+        """Line breaks and repeated spaces should not defeat deduplication."""
+        subtitle = Subtitle(entries=_entries(["Line 1", "Line\n1", "Line  2"]))
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = _echo_batch
+
+            result = translate_subtitle(subtitle)
+
+        prompt = mock_translator.run.call_args[0][0]
+        assert "3. " not in prompt
+        assert [e.text for e in result.entries][:2] == ["譯 1", "譯 1"]
+
+    def test_lines_without_letters_skip_the_llm(self):
+        """Music notes and bare punctuation should be kept verbatim."""
+        subtitle = Subtitle(entries=_entries(["♪ ♪", "Line 2", "..."]))
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = _echo_batch
+
+            result = translate_subtitle(subtitle)
+
+        prompt = mock_translator.run.call_args[0][0]
+        assert "1. Line 2" in prompt
+        assert "2. " not in prompt
+        assert [e.text for e in result.entries] == ["♪ ♪", "譯 2", "..."]
+
+    def test_cache_path_reuses_translations_across_runs(self, monkeypatch, tmp_path):
+        """Configured cache file should serve lines translated in a prior run."""
+        monkeypatch.setenv("TRANSLATION_CACHE_PATH", str(tmp_path / "cache.db"))
+        get_settings.cache_clear()
+        subtitle = Subtitle(entries=_entries(["Line 1", "Line 2"]))
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = _echo_batch
+
+            first = translate_subtitle(subtitle)
+            second = translate_subtitle(subtitle)
+
+        assert mock_translator.run.call_count == 1
+        assert [e.text for e in second.entries] == [e.text for e in first.entries]
+
+    def test_cache_connection_is_usable_from_worker_threads(self, tmp_path):
+        """One connection per cache should serve the translation worker threads."""
+        path = str(tmp_path / "cache.db")
+        cache = _TranslationCache("ns", path)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(cache.put_many, [("Line 1", "譯 1")]).result()
+
+        assert _TranslationCache("ns", path).get_many(["Line 1"]) == {"Line 1": "譯 1"}
+
+    def test_unusable_cache_path_keeps_memory_cache(self, tmp_path):
+        """A cache file that cannot be opened should only cost persistence."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = _TranslationCache("ns", str(blocker / "cache.db"))
+        cache.put_many([("Line 1", "譯 1")])
+
+        assert cache.get_many(["Line 1", "Line 2"]) == {"Line 1": "譯 1"}
+
+    def test_json_output_setting_requests_json_array(self, monkeypatch):
+        """JSON mode should ask for a translations array and accept it."""
+        monkeypatch.setenv("TRANSLATOR_JSON_OUTPUT", "true")
+        get_settings.cache_clear()
+        subtitle = Subtitle(entries=_entries(["Line 1", "Line 2"]))
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_response = Mock()
+            mock_response.content = '{"translations": ["譯 1", "譯 2"]}'
+            mock_translator.run.return_value = mock_response
+
+            result = translate_subtitle(subtitle)
+
+        prompt = mock_translator.run.call_args[0][0]
+        assert '{"translations": [' in prompt
+        assert [e.text for e in result.entries] == ["譯 1", "譯 2"]
+
+
+class TestTranslateSubtitles:
+    """Test translating several subtitle files in one call."""
+
+    def test_concurrent_files_keep_per_file_order(self):
+        """Batches of all files should share one pool and split back per file."""
+        subtitles = [_subtitle(15, "Alpha Line"), _subtitle(3, "Beta Line")]
+        progress_calls = []
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = _echo_batch
+
+            results = translate_subtitles(
+                subtitles,
+                max_concurrency=3,
+                on_progress=lambda *args: progress_calls.append(args),
+            )
+
+        assert [e.text for e in results[0].entries] == [
+            f"Alpha 譯 {i}" for i in range(1, 16)
+        ]
+        assert [e.text for e in results[1].entries] == [
+            f"Beta 譯 {i}" for i in range(1, 4)
+        ]
+        assert mock_translator.run.call_count == 3
+        assert progress_calls == [(0, 2, 10, 18), (1, 2, 15, 18), (2, 2, 18, 18)]
+
+    def test_sequential_files_share_line_cache(self):
+        """A line translated in one file should not be requested again."""
+        subtitles = [_subtitle(2, "Alpha Line"), _subtitle(2, "Alpha Line")]
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = _echo_batch
+
+            results = translate_subtitles(subtitles, max_concurrency=1)
+
+        assert mock_translator.run.call_count == 1
+        assert [e.text for e in results[1].entries] == ["Alpha 譯 1", "Alpha 譯 2"]
+
+
+class TestIterTranslatedEntries:
+    """Test streaming translated entries as batches complete."""
+
+    def test_yields_all_entries_in_order(self):
+        """Concurrent batches should still be yielded in subtitle order."""
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = _echo_batch
+
+            entries = list(iter_translated_entries(_subtitle(25), max_concurrency=3))
+
+        assert [e.text for e in entries] == [f"譯 {i}" for i in range(1, 26)]
+        assert [e.index for e in entries] == list(range(1, 26))
+
+    def test_closing_early_skips_remaining_batches(self):
+        """Stopping after the first batch should not request later ones."""
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = _echo_batch
+
+            stream = iter_translated_entries(_subtitle(25), target_lang="en")
+            first = [next(stream) for _ in range(10)]
+            stream.close()
+
+        assert [e.text for e in first] == [f"譯 {i}" for i in range(1, 11)]
+        assert mock_translator.run.call_count == 1
+
 
 class TestTranslationOverlap:
     """Test context overlap between translation batches."""
@@ -551,6 +1152,12 @@ class TestTranslationOverlap:
             assert "Line 9" in second_prompt
             assert "Line 10" in second_prompt
 
+            # Fixed instructions lead every prompt so batches share a prefix
+            first_prompt = mock_translator.run.call_args_list[0][0][0]
+            instructions = first_prompt.split("【待翻譯字幕】")[0]
+            assert second_prompt.startswith(instructions)
+            assert second_prompt.index("上文參考") < second_prompt.index("1. Line 11")
+
     @pytest.mark.unit
     def test_context_contains_original_and_translated(self):
         """Context should contain both original text and translated text."""
@@ -827,6 +1434,68 @@ class TestTranslationMetadataAndPartial:
             assert "原文: Line 2" in prompt
             assert "目前翻譯（可修正）: 第二句" in prompt
 
+    def test_retranslate_entries_runs_selected_entries_in_parallel(self):
+        """Parallel re-translation should still key each result by its entry."""
+        entries = [
+            RetranslateEntry(index=i, original=f"Line {i}", translated=f"第{i}句")
+            for i in range(1, 5)
+        ]
+
+        def reply(prompt_text):
+            index = int(prompt_text.split("index: ")[1].split()[0])
+            resp = Mock()
+            resp.content = (
+                f'{{"index": {index}, "original": "Line {index}", '
+                f'"translated": "新{index}"}}'
+            )
+            return resp
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            mock_translator = Mock()
+            mock_agent.return_value = mock_translator
+            mock_translator.run.side_effect = reply
+
+            result = retranslate_entries(
+                entries=entries, selected_indices=[4, 1, 3], max_concurrency=3
+            )
+
+        assert list(result) == [4, 1, 3]
+        assert {i: r.translated for i, r in result.items()} == {
+            4: "新4",
+            1: "新1",
+            3: "新3",
+        }
+
+    def test_retranslate_entries_runs_in_parallel_by_default(self):
+        """Re-translation should not inherit the sequential batch default."""
+        entries = [
+            RetranslateEntry(index=i, original=f"Line {i}", translated=f"第{i}句")
+            for i in range(1, 4)
+        ]
+
+        def reply(prompt_text):
+            index = int(prompt_text.split("index: ")[1].split()[0])
+            resp = Mock()
+            resp.content = (
+                f'{{"index": {index}, "original": "Line {index}", '
+                f'"translated": "新{index}"}}'
+            )
+            return resp
+
+        with (
+            patch("bilingualsub.core.translator.Agent") as mock_agent,
+            patch(
+                "bilingualsub.core.translator.ThreadPoolExecutor",
+                wraps=ThreadPoolExecutor,
+            ) as executor_spy,
+        ):
+            mock_agent.return_value.run.side_effect = reply
+
+            result = retranslate_entries(entries=entries, selected_indices=[1, 2, 3])
+
+        assert executor_spy.call_args.kwargs["max_workers"] == 3
+        assert [r.translated for r in result.values()] == ["新1", "新2", "新3"]
+
     def test_retranslate_entries_requires_structured_json_result(self):
         entries = [RetranslateEntry(index=1, original="Line 1", translated="第一句")]
 
@@ -972,6 +1641,95 @@ class TestBuildModel:
 
 
 @pytest.mark.unit
+class TestApiKeyPool:
+    """Test rotation over TRANSLATOR_API_KEYS."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_settings_cache(self):
+        get_settings.cache_clear()
+        yield
+        get_settings.cache_clear()
+
+    def test_given_api_key_when_build_model_then_groq_model_uses_it(self, monkeypatch):
+        monkeypatch.setenv("TRANSLATOR_MODEL", "groq:openai/gpt-oss-120b")
+        get_settings.cache_clear()
+
+        model_arg = _build_model(get_settings(), "gsk-pool-1")
+
+        assert isinstance(model_arg, Groq)
+        assert model_arg.id == "openai/gpt-oss-120b"
+        assert model_arg.api_key == "gsk-pool-1"
+
+    def test_rate_limited_key_fails_over_to_next_key(self, monkeypatch):
+        """A rate-limited reply should be retried on another key without sleeping."""
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        monkeypatch.setenv("TRANSLATOR_API_KEYS", "failover-a, failover-b")
+        get_settings.cache_clear()
+        subtitle = Subtitle(
+            entries=[
+                SubtitleEntry(
+                    index=1,
+                    start=timedelta(seconds=0),
+                    end=timedelta(seconds=2),
+                    text="Hello",
+                )
+            ]
+        )
+        limited = Mock(content="rate_limit_exceeded: try again in 30s")
+        translated = Mock(content="1. 你好")
+
+        def build_agent(model, description):
+            translator = Mock()
+            translator.run.return_value = (
+                limited if model.api_key == "failover-a" else translated
+            )
+            return translator
+
+        with (
+            patch("bilingualsub.core.translator.Agent", side_effect=build_agent),
+            patch("bilingualsub.core.translator.time.sleep") as mock_sleep,
+        ):
+            result = translate_subtitle(subtitle)
+
+        assert result.entries[0].text == "你好"
+        mock_sleep.assert_not_called()
+
+    def test_each_failover_attempt_is_charged_to_the_quota(self):
+        """Every request sent during key failover should count against the quota."""
+        replies = {
+            "quota-a": Mock(content="rate_limit_exceeded: try again in 30s"),
+            "quota-b": Mock(content="1. 你好"),
+        }
+
+        def get_translator(key):
+            return Mock(run=Mock(return_value=replies[key]))
+
+        with patch("bilingualsub.core.translator._shared_rate_limiter") as limiter:
+            pool = _TranslatorPool(
+                get_translator,
+                requests_per_minute=30,
+                api_keys=("quota-a", "quota-b"),
+            )
+            response = pool.run("prompt")
+
+        assert response.content == "1. 你好"
+        assert limiter.return_value.acquire.call_count == 2
+
+    def test_agent_cache_keeps_one_agent_per_rotated_key(self, monkeypatch):
+        """Rotating over many keys should reuse each key's Agent."""
+        keys = [f"cache-key-{i}" for i in range(6)]
+        monkeypatch.setenv("TRANSLATOR_API_KEYS", ",".join(keys))
+        get_settings.cache_clear()
+        settings = get_settings()
+
+        with patch("bilingualsub.core.translator.Agent") as mock_agent:
+            for _ in range(2):
+                for key in keys:
+                    _thread_local_agent(settings, "description", key)
+
+        assert mock_agent.call_count == len(keys)
+
+
 class TestCjkBoundaryRepair:
     def test_repair_cjk_split_boundaries(self):
         # Test case 1: leading "的問題" with punctuation
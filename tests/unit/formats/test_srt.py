@@ -1,11 +1,18 @@
 """Unit tests for SRT parser and serializer."""
 
 from datetime import timedelta
+from pathlib import Path
 
 import pytest
 
+from bilingualsub.core.merger import merge_subtitles
 from bilingualsub.core.subtitle import Subtitle, SubtitleEntry
-from bilingualsub.formats.srt import SRTParseError, parse_srt, serialize_srt
+from bilingualsub.formats.srt import (
+    SRTParseError,
+    parse_srt,
+    serialize_srt,
+    write_bilingual_srt,
+)
 
 
 class TestParseSRT:
@@ -375,3 +382,38 @@ Line 3
         reparsed = parse_srt(serialized)
 
         assert reparsed[0].text == "Line 1\nLine 2\nLine 3"
+
+
+class TestWriteBilingualSRT:
+    """Test cases for the fused merge + serialize writer."""
+
+    def _entries(self, texts: list[str]) -> list[SubtitleEntry]:
+        return [
+            SubtitleEntry(
+                index=i + 1,
+                start=timedelta(seconds=i * 3, milliseconds=250),
+                end=timedelta(seconds=i * 3 + 2),
+                text=text,
+            )
+            for i, text in enumerate(texts)
+        ]
+
+    def test_matches_merge_then_serialize(self, tmp_path: Path):
+        """Test output is identical to merge_subtitles + serialize_srt."""
+        original = self._entries(["Hello", "World", "Line 1\nLine 2"])
+        translated = self._entries(["你好", "世界", "第一行"])
+        path = tmp_path / "out.srt"
+
+        write_bilingual_srt(original, translated, path)
+
+        merged = merge_subtitles(original, translated)
+        expected = serialize_srt(Subtitle(entries=merged))
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_count_mismatch_raises(self, tmp_path: Path):
+        """Test mismatched entry counts raise ValueError."""
+        original = self._entries(["Hello", "World"])
+        translated = self._entries(["你好"])
+
+        with pytest.raises(ValueError, match="Entry count mismatch"):
+            write_bilingual_srt(original, translated, tmp_path / "out.srt")
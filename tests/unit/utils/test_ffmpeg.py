@@ -6,11 +6,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from bilingualsub.utils.ffmpeg import (
+    FFMPEG_BIN,
     FFmpegError,
     burn_subtitles,
     extract_audio,
     extract_video_metadata,
     get_audio_duration,
+    iter_audio_chunks,
     split_audio,
     trim_video,
 )
@@ -90,7 +92,7 @@ class TestBurnSubtitles:
         cmd = mock_popen.call_args[0][0]
 
         # Verify command structure
-        assert cmd[0] == "ffmpeg"
+        assert cmd[0] == FFMPEG_BIN
         assert "-i" in cmd
         assert str(video_path) in cmd
         assert "-vf" in cmd
@@ -526,6 +528,7 @@ class TestExtractAudio:
         assert call_args[0] == (str(output_path),)
         assert call_args[1]["acodec"] == "libmp3lame"
         assert call_args[1]["audio_bitrate"] == "64k"
+        assert call_args[1]["ac"] == 1
         assert "vn" in call_args[1]
         assert result == output_path
 
@@ -807,6 +810,31 @@ class TestSplitAudio:
         with pytest.raises(ValueError, match="Audio file does not exist"):
             split_audio(audio_path, output_dir=tmp_path)
 
+    @pytest.mark.unit
+    def test_iter_audio_chunks_cuts_lazily(self, tmp_path, mock_ffmpeg):
+        """Given long audio, when iterating, then each chunk is cut on demand."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"fake audio")
+
+        with patch("bilingualsub.utils.ffmpeg.get_audio_duration", return_value=3600.0):
+            chunks = iter_audio_chunks(audio_path, output_dir=tmp_path)
+            assert mock_ffmpeg.input.call_count == 0
+
+            first_path, first_offset = next(chunks)
+
+        assert mock_ffmpeg.input.call_count == 1
+        assert first_offset == 0.0
+        assert "chunk0" in first_path.name
+        assert [offset for _, offset in chunks] == [1500.0, 3000.0]
+
+    @pytest.mark.unit
+    def test_iter_audio_chunks_validates_before_iterating(self, tmp_path):
+        """Given non-existent file, when creating the iterator, then raises."""
+        audio_path = tmp_path / "nonexistent.mp3"
+
+        with pytest.raises(ValueError, match="Audio file does not exist"):
+            iter_audio_chunks(audio_path, output_dir=tmp_path)
+
 
 def _ffprobe_json(
     streams: list[dict], duration: float = 120.0, title: str = "test"